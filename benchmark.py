@@ -0,0 +1,144 @@
+"""
+Offline benchmarks for GitHubTool's API paths
+
+Runs each flow against the replay server in github_replay.py and reports request count,
+wall time and peak memory, so regressions show up without spending real API quota.
+
+    python benchmark.py                                   # 1k/10k/100k accounts, every flow
+    python benchmark.py --sizes 1000 --flows followback --latency 0.05 --rest
+    python benchmark.py --startup                         # fresh-interpreter time for short invocations
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List
+
+from github_tool import GitHubTool
+from github_replay import FakeGitHub, ReplayAdapter
+
+FLOWS = {
+    'followback': lambda tool: tool.check_follow_back_status(),
+    'user_info': lambda tool: tool.get_user_info(tool.username, refresh=True),
+    'repo_info': lambda tool: tool.get_repository_info(tool.username, 'repo0'),
+    'repo_scan': lambda tool: tool.scan_repositories(tool.username),
+}
+
+STARTUP_COMMANDS = {
+    'import': ['-c', 'import github_tool'],
+    'help': ['github_tool.py', '--help'],
+    'bad-args': ['github_tool.py', 'analyze-user'],  # argparse error: exits before any network I/O
+}
+
+def run_startup(runs: int) -> List[Dict]:
+    """Median wall time of fresh interpreters running commands that never reach the network"""
+    results = []
+    here = os.path.dirname(os.path.abspath(__file__))
+
+    print(f"{'command':<12}{'median (ms)':>13}{'min (ms)':>10}")
+    for name, arguments in STARTUP_COMMANDS.items():
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run([sys.executable] + arguments, cwd=here,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        results.append({'command': name, 'median_ms': round(statistics.median(timings), 1),
+                        'min_ms': round(min(timings), 1)})
+        print(f"{name:<12}{results[-1]['median_ms']:>13.1f}{results[-1]['min_ms']:>10.1f}")
+
+    return results
+
+def run_flow(flow: str, size: int, latency: float, graphql: bool, runs: int) -> List[Dict]:
+    """Benchmark one flow on a fresh tool; run 1 is cold, later runs reuse its cache and snapshots"""
+    results = []
+
+    # Import asyncio and start an event loop once up front, so run 1 times the flow rather than that
+    asyncio.run(asyncio.sleep(0))
+
+    previous_home = os.environ.get('GITHUB_TOOL_HOME')
+    try:
+        with tempfile.TemporaryDirectory() as home:
+            os.environ['GITHUB_TOOL_HOME'] = home
+            adapter = ReplayAdapter(FakeGitHub(followers=size), latency=latency, graphql=graphql)
+            tool = GitHubTool(interactive=False)
+            adapter.mount(tool)
+
+            success, message = tool.login_with_token('replay-token')
+            if not success:
+                raise RuntimeError(message)
+
+            for run in range(1, runs + 1):
+                adapter.reset_counters()
+                tracemalloc.start()
+                start = time.perf_counter()
+
+                FLOWS[flow](tool)
+
+                wall = time.perf_counter() - start
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                results.append({
+                    'flow': flow,
+                    'size': size,
+                    'run': run,
+                    'requests': adapter.requests,
+                    'not_modified': adapter.not_modified,
+                    'wall_seconds': round(wall, 3),
+                    'peak_memory_mb': round(peak / 1024 / 1024, 2),
+                    'endpoints': dict(adapter.by_endpoint)
+                })
+
+            tool.session.close()
+    finally:
+        if previous_home is None:
+            os.environ.pop('GITHUB_TOOL_HOME', None)
+        else:
+            os.environ['GITHUB_TOOL_HOME'] = previous_home
+
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GitHubTool against an offline replay of the GitHub API")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help="Follower/following counts to simulate (repos scale at 1/10th)")
+    parser.add_argument('--flows', nargs='+', choices=sorted(FLOWS), default=list(FLOWS))
+    parser.add_argument('--latency', type=float, default=0.0, help="Simulated seconds per request")
+    parser.add_argument('--runs', type=int, default=2, help="Runs per flow (run 1 cold, the rest warm)")
+    parser.add_argument('--rest', action='store_true', help="Disable GraphQL to benchmark the REST fallbacks")
+    parser.add_argument('--startup', action='store_true', help="Time interpreter startup and --help instead of the flows")
+    parser.add_argument('--json', metavar='PATH', help="Also write the results as JSON")
+    args = parser.parse_args()
+
+    if args.startup:
+        results = run_startup(max(args.runs, 10))
+    else:
+        results = run_flows(args)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+def run_flows(args) -> List[Dict]:
+    results = []
+    print(f"{'flow':<12}{'size':>8}{'run':>5}{'requests':>10}{'304s':>7}{'wall (s)':>10}{'peak (MB)':>11}")
+    for size in args.sizes:
+        for flow in args.flows:
+            for result in run_flow(flow, size, args.latency, not args.rest, args.runs):
+                results.append(result)
+                print(f"{flow:<12}{size:>8}{result['run']:>5}{result['requests']:>10}{result['not_modified']:>7}"
+                      f"{result['wall_seconds']:>10.3f}{result['peak_memory_mb']:>11.2f}")
+                sys.stdout.flush()
+
+    return results
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+requests/urllib3 plumbing behind GitHubTool's Transport settings
+
+Kept out of github_tool.py so that importing the tool (for --help, the menu
+banner, or argument errors) doesn't pay for importing requests.
+"""
+import os
+import random
+import ssl
+import threading
+import time
+from typing import Tuple
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import select_proxy
+from urllib3.util.retry import Retry
+
+class JitteredRetry(Retry):
+    """urllib3 Retry with full jitter, so parallel workers don't retry in lockstep"""
+    
+    def get_backoff_time(self) -> float:
+        return random.uniform(0, super().get_backoff_time())
+
+class TimeoutSession(requests.Session):
+    """requests.Session that applies a default (connect, read) timeout to every request"""
+    
+    def __init__(self, timeout: Tuple[float, float]):
+        super().__init__()
+        self.timeout = timeout
+    
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return super().request(method, url, **kwargs)
+
+class HTTP2Adapter(BaseAdapter):
+    """
+    requests adapter backed by httpx HTTP/2 clients, multiplexing concurrent reads on one connection
+    
+    httpx fixes TLS and proxy settings per client, so there is one client per
+    (verify, cert, proxy) combination that requests asks for - in practice one.
+    Timeouts are per request, as with the HTTP/1.1 adapter.
+    """
+    
+    # Connection-specific headers are illegal in HTTP/2; Accept-Encoding is left to httpx,
+    # which only advertises the encodings it can decode
+    DROP_HEADERS = frozenset({'connection', 'keep-alive', 'proxy-connection', 'transfer-encoding',
+                              'upgrade', 'upgrade-insecure-requests', 'accept-encoding'})
+    
+    def __init__(self, transport):
+        import httpx
+        import h2  # noqa: F401 - httpx only speaks HTTP/2 with the h2 extra
+        
+        super().__init__()
+        self.httpx = httpx
+        self.transport = transport
+        self.clients = {}
+        self.lock = threading.Lock()
+    
+    def client(self, verify, cert, proxy):
+        """The httpx client for a TLS/proxy combination, created on first use"""
+        key = (verify, cert, proxy)
+        with self.lock:
+            if key not in self.clients:
+                self.clients[key] = self.httpx.Client(
+                    http2=True,
+                    verify=self.ssl_context(verify, cert),
+                    proxy=proxy,
+                    trust_env=False,  # requests has already applied the environment's proxy and CA settings
+                    timeout=self.httpx.Timeout(self.transport.read_timeout, connect=self.transport.connect_timeout),
+                    limits=self.httpx.Limits(max_connections=self.transport.pool_size,
+                                             max_keepalive_connections=self.transport.pool_size)
+                )
+            return self.clients[key]
+    
+    @staticmethod
+    def ssl_context(verify, cert) -> ssl.SSLContext:
+        """requests' verify (bool or CA bundle path) and cert (path or (cert, key)) as an SSL context"""
+        if isinstance(verify, str):
+            context = ssl.create_default_context(**{'capath' if os.path.isdir(verify) else 'cafile': verify})
+        else:
+            context = ssl.create_default_context()
+            if not verify:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+        
+        if cert:
+            context.load_cert_chain(*((cert,) if isinstance(cert, str) else cert))
+        return context
+    
+    def to_httpx_timeout(self, timeout):
+        """requests' timeout (seconds, (connect, read) or None for no limit) for httpx"""
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return self.httpx.Timeout(read, connect=connect)
+        return self.httpx.Timeout(timeout)
+    
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        """Send a prepared request, retrying idempotent ones like the HTTP/1.1 adapter does"""
+        retryable = request.method in self.transport.RETRY_METHODS
+        headers = {k: v for k, v in request.headers.items() if k.lower() not in self.DROP_HEADERS}
+        client = self.client(verify, cert if cert is None or isinstance(cert, str) else tuple(cert),
+                             select_proxy(request.url, proxies or {}))
+        
+        for attempt in range(self.transport.retries + 1):
+            last_attempt = not retryable or attempt == self.transport.retries
+            try:
+                reply = client.request(request.method, request.url, headers=headers, content=request.body,
+                                       timeout=self.to_httpx_timeout(timeout))
+            except self.httpx.TimeoutException as e:
+                if last_attempt:
+                    raise requests.Timeout(e, request=request)
+            except self.httpx.TransportError as e:
+                if last_attempt:
+                    raise requests.ConnectionError(e, request=request)
+            else:
+                if last_attempt or reply.status_code not in self.transport.RETRY_STATUSES:
+                    return self._to_response(request, reply)
+            
+            time.sleep(random.uniform(0, self.transport.backoff * 2 ** attempt))
+    
+    def _to_response(self, request, reply) -> requests.Response:
+        """Convert an httpx response (body already decoded) into a requests.Response"""
+        response = requests.Response()
+        response.status_code = reply.status_code
+        response.headers = CaseInsensitiveDict(reply.headers)
+        response._content = reply.content
+        response.encoding = reply.encoding
+        response.reason = reply.reason_phrase
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+    
+    def close(self):
+        with self.lock:
+            for client in self.clients.values():
+                client.close()
+            self.clients.clear()
@@ -0,0 +1,364 @@
+"""
+Offline stand-in for the GitHub API, used to benchmark and exercise GitHubTool without live quota
+
+Mount it on a tool's session and every request is answered locally:
+
+    tool = GitHubTool(interactive=False)
+    replay = ReplayAdapter(FakeGitHub(followers=10000), latency=0.02)
+    replay.mount(tool)
+"""
+import hashlib
+import json
+import re
+import threading
+import time
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+LANGUAGES = ['Python', 'JavaScript', 'Go', 'Rust', 'TypeScript', None]
+
+class FakeGitHub:
+    """Synthetic account data, generated on demand so 100k-entry accounts cost nothing up front"""
+
+    def __init__(self, login: str = 'octo', followers: int = 1000, following: Optional[int] = None,
+                 repos: Optional[int] = None, overlap: float = 0.5, gone: Iterable[str] = ()):
+        self.login = login
+        self.gone = {name.lower() for name in gone}  # Logins that no longer exist (renamed or deleted): writes get 404
+        self.followers = followers
+        self.following = following if following is not None else followers
+        self.repos = repos if repos is not None else max(1, followers // 10)
+
+        # Followers are user0..userN; following starts part-way through so `overlap` of it is mutual
+        self.following_offset = int(self.followers * (1 - overlap))
+
+    def counts(self, login: str) -> Tuple[int, int, int]:
+        """(followers, following, repos) for an account"""
+        if login.lower() == self.login.lower():
+            return self.followers, self.following, self.repos
+        return 10, 10, 3
+
+    def user_entry(self, index: int) -> Dict:
+        """Minimal user object as returned in follower/following lists"""
+        return {'login': f"user{index}", 'id': index + 1, 'type': 'User'}
+
+    def connection_entry(self, owner: str, connection: str, index: int) -> Dict:
+        """Entry `index` of an account's followers/following list (newest first)"""
+        if owner.lower() == self.login.lower() and connection == 'following':
+            return self.user_entry(self.following_offset + index)
+        return self.user_entry(index)
+
+    def profile(self, login: str) -> Dict:
+        """/users/{login} payload"""
+        followers, following, repos = self.counts(login)
+        return {
+            'login': login,
+            'id': zlib.crc32(login.lower().encode('utf-8')) % 10 ** 8,  # Stable across processes, unlike hash()
+            'name': login.title(),
+            'bio': 'Synthetic replay account',
+            'company': None,
+            'location': 'Localhost',
+            'email': None,
+            'blog': '',
+            'twitter_username': None,
+            'followers': followers,
+            'following': following,
+            'public_repos': repos,
+            'public_gists': 0,
+            'hireable': False,
+            'created_at': '2015-01-01T00:00:00Z',
+            'updated_at': '2024-01-01T00:00:00Z',
+            'avatar_url': '',
+            'repos_url': f"https://api.github.com/users/{login}/repos"
+        }
+
+    def repo_entry(self, owner: str, index: int) -> Dict:
+        """Repository object as returned in /users/{owner}/repos and /orgs/{org}/repos"""
+        return self.repository(owner, f"repo{index}")
+
+    @staticmethod
+    def repo_index(name: str) -> int:
+        """N for repoN (0 for any other name)"""
+        match = re.fullmatch(r'repo(\d+)', name)
+        return int(match.group(1)) if match else 0
+
+    def repository(self, owner: str, name: str) -> Dict:
+        """/repos/{owner}/{name} payload; repoN vary by N (every 10th archived, every 4th unlicensed, ...)"""
+        base = f"https://api.github.com/repos/{owner}/{name}"
+        index = self.repo_index(name)
+        return {
+            'name': name,
+            'full_name': f"{owner}/{name}",
+            'owner': {'login': owner},
+            'description': 'Synthetic replay repository',
+            'language': LANGUAGES[index % len(LANGUAGES)],
+            'stargazers_count': 1234 + index % 50,
+            'watchers_count': 1234 + index % 50,
+            'forks_count': 56 + index % 7,
+            'open_issues_count': 7,
+            'license': None if index % 4 == 3 else {'name': 'MIT License' if index % 2 else 'Apache License 2.0'},
+            'created_at': '2018-01-01T00:00:00Z',
+            'updated_at': '2024-01-01T00:00:00Z',
+            'pushed_at': f"{2016 + index % 10}-06-01T00:00:00Z",
+            'homepage': None,
+            'topics': ['replay', 'benchmark'],
+            'size': 2048,
+            'default_branch': 'main',
+            'archived': index % 10 == 9,
+            'fork': index % 5 == 4,
+            'languages_url': f"{base}/languages",
+            'contributors_url': f"{base}/contributors"
+        }
+
+    def languages(self, name: str = 'repo0') -> Dict:
+        """/repos/{owner}/{name}/languages payload"""
+        primary = LANGUAGES[self.repo_index(name) % len(LANGUAGES)] or 'Python'
+        languages = {'JavaScript': 30000, 'Shell': 2000}
+        languages[primary] = 120000
+        return dict(sorted(languages.items(), key=lambda item: -item[1]))
+
+    def contributors(self) -> List[Dict]:
+        """/repos/{owner}/{name}/contributors payload"""
+        return [dict(self.user_entry(i), contributions=500 - i * 40) for i in range(10)]
+
+class ReplayAdapter(BaseAdapter):
+    """requests transport adapter that serves FakeGitHub data with realistic headers and latency"""
+
+    def __init__(self, fake: FakeGitHub, latency: float = 0.0, graphql: bool = True, rate_limit: int = 1000000,
+                 window: float = 3600.0):
+        super().__init__()
+        self.fake = fake
+        self.latency = latency        # Seconds added to every request
+        self.graphql_enabled = graphql  # False makes /graphql return 502 (forces the REST fallbacks)
+        self.rate_limit = rate_limit  # Requests per window; past it requests get GitHub's 403
+        self.window = window          # Seconds until the quota refills
+        self.lock = threading.Lock()
+        self.remaining = {'core': rate_limit, 'graphql': rate_limit}
+        self.reset_at = time.time() + window
+        self.reset_counters()
+
+    def mount(self, tool):
+        """Route a GitHubTool's API traffic through this adapter"""
+        tool.session.mount(tool.api_url, self)
+
+    def reset_counters(self):
+        """Zero the request counters"""
+        with self.lock:
+            self.requests = 0
+            self.not_modified = 0
+            self.by_endpoint = {}
+
+    def close(self):
+        pass
+
+    def send(self, request, **kwargs):
+        """Answer a prepared request locally"""
+        if self.latency:
+            time.sleep(self.latency)
+
+        parsed = urlparse(request.url)
+        path = parsed.path.rstrip('/')
+        query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+
+        with self.lock:
+            if time.time() >= self.reset_at:
+                self.remaining = {'core': self.rate_limit, 'graphql': self.rate_limit}
+                self.reset_at = time.time() + self.window
+
+        resource = 'graphql' if request.method == 'POST' and path == '/graphql' else 'core'
+        if path != '/rate_limit' and self.remaining[resource] == 0:
+            status, body, headers = 403, {'message': 'API rate limit exceeded'}, {}
+        elif resource == 'graphql':
+            if self.graphql_enabled:
+                status, body, headers = self._graphql(json.loads(request.body))
+            else:
+                status, body, headers = 502, {'message': 'Bad Gateway'}, {}
+        else:
+            status, body, headers = self._rest(request.method, path, query)
+
+        content = json.dumps(body).encode('utf-8')
+
+        # Conditional requests: matching ETags get an empty 304 that doesn't count against the limit
+        if request.method == 'GET' and status == 200:
+            etag = '"' + hashlib.sha1(content).hexdigest() + '"'
+            headers['ETag'] = etag
+            if request.headers.get('If-None-Match') == etag:
+                status, content = 304, b''
+
+        with self.lock:
+            self.requests += 1
+            endpoint = re.sub(r'\d+', 'N', path) if resource == 'core' else '/graphql'
+            self.by_endpoint[endpoint] = self.by_endpoint.get(endpoint, 0) + 1
+
+            if status == 304:
+                self.not_modified += 1
+            elif path != '/rate_limit' and status != 403:
+                self.remaining[resource] = max(self.remaining[resource] - 1, 0)
+
+            headers.update({
+                'X-RateLimit-Limit': str(self.rate_limit),
+                'X-RateLimit-Remaining': str(self.remaining[resource]),
+                'X-RateLimit-Used': str(self.rate_limit - self.remaining[resource]),
+                'X-RateLimit-Reset': str(int(self.reset_at)),
+                'X-RateLimit-Resource': resource,
+                'Content-Type': 'application/json; charset=utf-8'
+            })
+
+        response = requests.Response()
+        response.status_code = status
+        response._content = content
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        response.reason = {200: 'OK', 304: 'Not Modified', 403: 'Forbidden', 404: 'Not Found', 502: 'Bad Gateway'}.get(status, '')
+        response.connection = self
+        return response
+
+    def _page(self, path: str, query: Dict, total: int, make_entry) -> Tuple[int, List[Dict], Dict]:
+        """One page of a paginated list, with a Link header like GitHub's"""
+        per_page = min(int(query.get('per_page', 30)), 100)
+        page = max(int(query.get('page', 1)), 1)
+        start = (page - 1) * per_page
+        items = [make_entry(i) for i in range(start, min(start + per_page, total))]
+
+        headers = {}
+        last_page = max((total + per_page - 1) // per_page, 1)
+        if page < last_page:
+            url = f"https://api.github.com{path}"
+            headers['Link'] = (f'<{url}?per_page={per_page}&page={page + 1}>; rel="next", '
+                               f'<{url}?per_page={per_page}&page={last_page}>; rel="last"')
+        return 200, items, headers
+
+    def _rest(self, method: str, path: str, query: Dict) -> Tuple[int, object, Dict]:
+        """REST routes"""
+        fake = self.fake
+
+        if method != 'GET':
+            target = path.rsplit('/', 1)[-1].lower()
+            if path.startswith(('/user/following/', '/users/')) and target in fake.gone:
+                return 404, {'message': 'Not Found'}, {}
+            return 204, None, {}
+
+        if path == '/user':
+            return 200, fake.profile(fake.login), {}
+
+        if path == '/rate_limit':
+            resources = {
+                name: {'limit': self.rate_limit, 'remaining': self.remaining.get(name, self.rate_limit),
+                       'used': self.rate_limit - self.remaining.get(name, self.rate_limit),
+                       'reset': int(self.reset_at)}
+                for name in ('core', 'search', 'graphql')
+            }
+            return 200, {'resources': resources, 'rate': resources['core']}, {}
+
+        match = re.fullmatch(r'/orgs/([^/]+)/repos', path)
+        if match:
+            login = match.group(1)
+            if login.lower() != fake.login.lower():
+                return 404, {'message': 'Not Found'}, {}
+            return self._page(path, query, fake.repos, lambda i: fake.repo_entry(login, i))
+
+        match = re.fullmatch(r'/users/([^/]+)(?:/(followers|following|repos))?', path)
+        if match:
+            login, connection = match.groups()
+            if not connection:
+                return 200, fake.profile(login), {}
+
+            followers, following, repos = fake.counts(login)
+            if connection == 'repos':
+                return self._page(path, query, repos, lambda i: fake.repo_entry(login, i))
+            total = followers if connection == 'followers' else following
+            return self._page(path, query, total, lambda i: fake.connection_entry(login, connection, i))
+
+        match = re.fullmatch(r'/repos/([^/]+)/([^/]+)(?:/(languages|contributors))?', path)
+        if match:
+            owner, name, extra = match.groups()
+            if extra == 'languages':
+                return 200, fake.languages(name), {}
+            if extra == 'contributors':
+                return 200, fake.contributors()[:int(query.get('per_page', 30))], {}
+            return 200, fake.repository(owner, name), {}
+
+        return 404, {'message': 'Not Found'}, {}
+
+    def _repository_node(self, owner: str, name: str) -> Dict:
+        """A repository as the RepositoryFields GraphQL fragment returns it"""
+        fake = self.fake
+        repo = fake.repository(owner, name)
+        return {
+            'name': repo['name'],
+            'nameWithOwner': repo['full_name'],
+            'owner': repo['owner'],
+            'description': repo['description'],
+            'primaryLanguage': {'name': repo['language']} if repo['language'] else None,
+            'languages': {'edges': [{'size': size, 'node': {'name': lang}} for lang, size in fake.languages(name).items()]},
+            'stargazerCount': repo['stargazers_count'],
+            'forkCount': repo['forks_count'],
+            'issues': {'totalCount': repo['open_issues_count'] - 2},
+            'pullRequests': {'totalCount': 2},
+            'licenseInfo': repo['license'],
+            'createdAt': repo['created_at'],
+            'updatedAt': repo['updated_at'],
+            'pushedAt': repo['pushed_at'],
+            'homepageUrl': repo['homepage'],
+            'repositoryTopics': {'nodes': [{'topic': {'name': topic}} for topic in repo['topics']]},
+            'diskUsage': repo['size'],
+            'defaultBranchRef': {'name': repo['default_branch']},
+            'isArchived': repo['archived'],
+            'isFork': repo['fork']
+        }
+
+    def _graphql(self, payload: Dict) -> Tuple[int, Dict, Dict]:
+        """The GraphQL queries GitHubTool sends"""
+        fake = self.fake
+        query = payload.get('query', '')
+        variables = payload.get('variables') or {}
+
+        first_match = re.search(r'first:\s*(\d+)', query)
+        first = int(first_match.group(1)) if first_match else 100
+        start = int(variables.get('cursor') or 0)
+
+        def connection(total, make_node):
+            end = min(start + first, total)
+            return {
+                'totalCount': total,
+                'pageInfo': {'hasNextPage': end < total, 'endCursor': str(end)},
+                'nodes': [make_node(i) for i in range(start, end)]
+            }
+
+        if 'repository(' in query:
+            node = self._repository_node(variables['owner'], variables['name'])
+            return 200, {'data': {'repository': node}}, {}
+
+        login = variables.get('login', fake.login)
+        followers, following, repos = fake.counts(login)
+
+        if 'repositoryOwner(' in query:
+            page = connection(repos, lambda i: self._repository_node(login, f"repo{i}"))
+            return 200, {'data': {'repositoryOwner': {'repositories': page}}}, {}
+
+        if 'repositories(' in query:
+            def repo_node(i):
+                entry = fake.repo_entry(login, i)
+                return {
+                    'name': entry['name'],
+                    'stargazerCount': entry['stargazers_count'],
+                    'forkCount': entry['forks_count'],
+                    'primaryLanguage': {'name': entry['language']} if entry['language'] else None
+                }
+            return 200, {'data': {'user': {'repositories': connection(repos, repo_node)}}}, {}
+
+        for name, total in (('followers', followers), ('following', following)):
+            if f"{name}(" in query:
+                def user_node(i):
+                    entry = fake.connection_entry(login, name, i)
+                    return {'login': entry['login'], 'databaseId': entry['id']}
+                page = connection(total, user_node)
+                return 200, {'data': {'user': {name: page}}}, {}
+
+        return 200, {'errors': [{'message': 'Unsupported query in replay server'}]}, {}
@@ -1,21 +1,64 @@
-import requests
 import json
 import time
 import random
 import sys
-from typing import Dict, Optional, Tuple, List
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, List, Iterable, Iterator, AsyncIterator
 import logging
+import argparse
 import re
 from datetime import datetime
 import os
-import base64
-from urllib.parse import urljoin
-import hmac
+from urllib.parse import urlparse
 import hashlib
+import functools
+import unicodedata
+import importlib
+import importlib.util
+import io
+from operator import itemgetter
+
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access
+    
+    Until then nothing is imported or put in sys.modules; after that the
+    ordinary import has run, so other importers of the module are unaffected.
+    """
+    
+    def __init__(self, name: str):
+        self._name = name
+        self._module = sys.modules.get(name)
+    
+    def __getattr__(self, attribute: str):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attribute)
+    
+    def __repr__(self) -> str:
+        return f"<lazy module {self._name!r}{' (imported)' if self._module else ''}>"
+
+def lazy_import(name: str) -> LazyModule:
+    """Import a module on first attribute access, keeping it off the startup path"""
+    if name not in sys.modules and importlib.util.find_spec(name) is None:
+        raise ImportError(f"No module named {name!r}", name=name)
+    return LazyModule(name)
+
+# Only some commands need these; requests alone is most of the import time
+requests = lazy_import('requests')
+asyncio = lazy_import('asyncio')
+sqlite3 = lazy_import('sqlite3')
+csv = lazy_import('csv')
+gzip = lazy_import('gzip')
+
+if TYPE_CHECKING:
+    from urllib3.util import Retry
 
 # Set up logging
 logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
+logging.getLogger('urllib3.connectionpool').setLevel(logging.ERROR)  # Transport retries are routine
 
 # Color Codes for terminal output
 class Colors:
@@ -57,11 +100,1387 @@ class Colors:
         '\033[38;5;46m',
     ]
 
-class GitHubTool:
+    @classmethod
+    def disable(cls):
+        """Turn every colour code into an empty string (output that isn't a terminal)"""
+        for name, value in vars(cls).items():
+            if isinstance(value, str) and value.startswith('\033'):
+                setattr(cls, name, '')
+        cls.GRADIENT = [''] * len(cls.GRADIENT)
+
+def configure_colors(stream):
+    """
+    Colour only when messages land on a terminal and NO_COLOR isn't set
+    
+    Colors is shared by the whole process, so this runs once from the entry
+    points (stdout for the menu, stderr for headless commands), not per tool.
+    """
+    if not stream.isatty() or os.environ.get('NO_COLOR'):
+        Colors.disable()
+    elif os.name == 'nt':
+        os.system('')  # Once, so the Windows console interprets the escape codes
+
+ANSI_PATTERN = re.compile(r'\033\[[0-9;]*[A-Za-z]')
+
+def display_width(text: str) -> int:
+    """Terminal columns a string takes: escape codes none, wide characters and emoji two"""
+    width = 0
+    previous = 0
+    for char in ANSI_PATTERN.sub('', text):
+        if char == '\ufe0f':
+            # Emoji presentation selector: widens a narrow symbol such as ❤ or ⚠ to two columns
+            width += 2 - previous if previous else 0
+            previous = 0
+            continue
+        if unicodedata.combining(char) or char == '\u200d':
+            continue
+        previous = 2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1
+        width += previous
+    return width
+
+def clip(text: str, width: int) -> str:
+    """Cut a string to at most `width` terminal columns, ending in … if anything was cut (escape codes are kept)"""
+    if display_width(text) <= width:
+        return text
+    
+    clipped = ''
+    for part in re.split(f"({ANSI_PATTERN.pattern})", text):
+        if ANSI_PATTERN.fullmatch(part):
+            clipped += part
+            continue
+        for char in part:
+            if display_width(clipped + char) > width - 1:
+                return clipped + '…'
+            clipped += char
+    return clipped + '…'
+
+def pad(text: str, width: int) -> str:
+    """Left-align a string to `width` terminal columns, however many escape codes or emoji it holds"""
+    return text + ' ' * max(width - display_width(text), 0)
+
+def render_once(method):
+    """Build a GitHubTool screen in a buffer and write it to the terminal in one go"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.screen():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+# GraphQL queries (only the fields we actually use, to keep responses small)
+FOLLOW_CONNECTION_QUERY = """
+query($login: String!, $cursor: String) {
+  user(login: $login) {
+    %s(first: 100, after: $cursor) {
+      totalCount
+      pageInfo { hasNextPage endCursor }
+      nodes { login databaseId }
+    }
+  }
+}
+"""
+
+USER_REPOSITORIES_QUERY = """
+query($login: String!, $cursor: String) {
+  user(login: $login) {
+    repositories(first: 100, after: $cursor, ownerAffiliations: OWNER, privacy: PUBLIC) {
+      pageInfo { hasNextPage endCursor }
+      nodes { name stargazerCount forkCount primaryLanguage { name } }
+    }
+  }
+}
+"""
+
+REPOSITORY_FIELDS = """
+fragment RepositoryFields on Repository {
+  name
+  nameWithOwner
+  owner { login }
+  description
+  primaryLanguage { name }
+  languages(first: 100, orderBy: {field: SIZE, direction: DESC}) { edges { size node { name } } }
+  stargazerCount
+  forkCount
+  issues(states: OPEN) { totalCount }
+  pullRequests(states: OPEN) { totalCount }
+  licenseInfo { name }
+  createdAt
+  updatedAt
+  pushedAt
+  homepageUrl
+  repositoryTopics(first: 20) { nodes { topic { name } } }
+  diskUsage
+  defaultBranchRef { name }
+  isArchived
+  isFork
+}
+"""
+
+REPOSITORY_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) { ...RepositoryFields }
+}
+""" + REPOSITORY_FIELDS
+
+# Organizations and users alike; 50 repositories per page keeps the languages/topics nodes well inside GitHub's limits
+OWNER_REPOSITORIES_QUERY = """
+query($login: String!, $cursor: String) {
+  repositoryOwner(login: $login) {
+    repositories(first: 50, after: $cursor, ownerAffiliations: OWNER, orderBy: {field: NAME, direction: ASC}) {
+      totalCount
+      pageInfo { hasNextPage endCursor }
+      nodes { ...RepositoryFields }
+    }
+  }
+}
+""" + REPOSITORY_FIELDS
+
+# Per-repository columns of a repository scan export
+REPO_SCAN_FIELDS = ['full_name', 'language', 'languages', 'stars', 'forks', 'open_issues', 'license',
+                    'created_at', 'pushed_at', 'archived', 'fork', 'size', 'default_branch', 'topics', 'contributors']
+# Parquet column types of the non-string REPO_SCAN_FIELDS (ExportWriter `types`)
+REPO_SCAN_TYPES = {'stars': 'int64', 'forks': 'int64', 'open_issues': 'int64', 'size': 'int64',
+                   'archived': 'bool', 'fork': 'bool'}
+
+class Spinner:
+    """Loading spinner that animates on a background thread while the real work runs"""
+    
+    FRAMES = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
+    
+    def __init__(self, text: str, enabled: bool = True, interval: float = 0.1):
+        self.text = text
+        self.enabled = enabled and sys.stdout.isatty()
+        self.interval = interval
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()
+        self.thread = None
+        self.width = 0
+    
+    def __enter__(self):
+        if self.enabled:
+            self.thread = threading.Thread(target=self._spin, daemon=True)
+            self.thread.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.thread:
+            self.stop_event.set()
+            self.thread.join()
+            with self.lock:
+                self._clear()
+        return False
+    
+    def _clear(self):
+        """Erase the spinner line (caller holds the lock)"""
+        sys.stdout.write('\r' + ' ' * self.width + '\r')
+        sys.stdout.flush()
+    
+    def _spin(self):
+        """Draw frames until stopped"""
+        frame = 0
+        while not self.stop_event.is_set():
+            with self.lock:
+                line = f"{self.text} {self.FRAMES[frame % len(self.FRAMES)]}"
+                self.width = max(self.width, len(line) + 1)
+                sys.stdout.write(f"\r{Colors.BRIGHT_BLUE}{line}{Colors.RESET}")
+                sys.stdout.flush()
+            frame += 1
+            self.stop_event.wait(self.interval)
+    
+    def update(self, text: str):
+        """Change the spinner text"""
+        with self.lock:
+            self.text = text
+    
+    def write(self, line: str):
+        """Print a line above the spinner without garbling it"""
+        with self.lock:
+            if self.thread:
+                self._clear()
+            print(line)
+
+class ExportWriter:
+    """
+    Streaming export of dict rows as CSV, JSON Lines or Parquet
+    
+    Rows are written as they arrive (Parquet in row groups of `chunk_rows`), so
+    memory stays flat however large the export. CSV and JSON Lines can be gzip
+    or zstd compressed; Parquet compresses its columns itself. Parquet needs
+    pyarrow and zstd needs zstandard - both are optional.
+    """
+    
+    FORMATS = {'csv': '.csv', 'jsonl': '.jsonl', 'parquet': '.parquet'}
+    COMPRESSIONS = {'gzip': '.gz', 'zstd': '.zst'}
+    PARQUET_TYPES = ('string', 'int64', 'float64', 'bool')
+    
+    def __init__(self, target, fields: Optional[List[str]] = None, output_format: str = 'csv',
+                 compression: Optional[str] = None, chunk_rows: int = 10000, types: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            target: File path, or an open text stream (uncompressed CSV/JSON Lines only)
+            fields: Column order (default: keys of the first row)
+            output_format: 'csv', 'jsonl' or 'parquet'
+            compression: None, 'gzip' or 'zstd'
+            chunk_rows: Rows per Parquet row group
+            types: Parquet type per field (one of PARQUET_TYPES). With `fields` given, the
+                schema is declared up front and unlisted fields are strings; otherwise it
+                is inferred from the first row group
+        
+        Raises:
+            ValueError: Unknown format/compression, or a stream target that can't take it
+            ImportError: The optional library for the format/compression is missing
+        """
+        if output_format not in self.FORMATS:
+            raise ValueError(f"Unknown export format '{output_format}' (use {', '.join(self.FORMATS)})")
+        if compression and compression not in self.COMPRESSIONS:
+            raise ValueError(f"Unknown compression '{compression}' (use {', '.join(self.COMPRESSIONS)})")
+        if not isinstance(target, str) and (compression or output_format == 'parquet'):
+            raise ValueError("Compressed and Parquet exports need a file path")
+        unknown_types = set((types or {}).values()) - set(self.PARQUET_TYPES)
+        if unknown_types:
+            raise ValueError(f"Unknown Parquet type(s) {', '.join(sorted(unknown_types))} (use {', '.join(self.PARQUET_TYPES)})")
+        
+        self.target = target
+        self.fields = list(fields) if fields else None
+        # Declared schema: a later row group can't contradict types guessed from an all-None first one
+        self.types = {field: (types or {}).get(field, 'string') for field in fields} if fields else None
+        self.output_format = output_format
+        self.compression = compression
+        self.chunk_rows = chunk_rows
+        self.count = 0
+        
+        self.stream = None
+        self.csv_writer = None
+        self.parquet_writer = None
+        self.pending = []  # Parquet rows not yet flushed as a row group
+        
+        if output_format == 'parquet':
+            import pyarrow  # noqa: F401 - fail now rather than after the first chunk
+        else:
+            self.stream = self._open_text()
+    
+    @classmethod
+    def filename(cls, prefix: str, output_format: str, compression: Optional[str] = None) -> str:
+        """Timestamped file name with the right extension, e.g. prefix_20240101_120000.csv.gz"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        suffix = cls.FORMATS.get(output_format, f".{output_format}")
+        if compression and output_format != 'parquet':
+            suffix += cls.COMPRESSIONS.get(compression, '')
+        return f"{prefix}_{timestamp}{suffix}"
+    
+    @classmethod
+    def parse_format(cls, spec: str) -> Tuple[str, Optional[str]]:
+        """Split 'jsonl.gz' style specs (or file names) into (format, compression)"""
+        compression = None
+        for name, suffix in cls.COMPRESSIONS.items():
+            if spec.endswith(suffix):
+                compression, spec = name, spec[:-len(suffix)]
+        return spec.rsplit('.', 1)[-1], compression
+    
+    def _open_text(self):
+        """Open the CSV/JSON Lines output, wrapped in a compressor if asked"""
+        if not isinstance(self.target, str):
+            return self.target
+        if self.compression == 'gzip':
+            return gzip.open(self.target, 'wt', encoding='utf-8', newline='')
+        if self.compression == 'zstd':
+            import zstandard
+            raw = open(self.target, 'wb')
+            return io.TextIOWrapper(zstandard.ZstdCompressor().stream_writer(raw), encoding='utf-8', newline='')
+        return open(self.target, 'w', encoding='utf-8', newline='')
+    
+    def write(self, row: Dict):
+        """Write one row"""
+        if self.fields is None:
+            self.fields = list(row.keys())
+        self.count += 1
+        
+        if self.output_format == 'jsonl':
+            self.stream.write(json.dumps({field: row.get(field) for field in self.fields}, default=str) + '\n')
+        elif self.output_format == 'csv':
+            if self.csv_writer is None:
+                self.csv_writer = csv.DictWriter(self.stream, fieldnames=self.fields, extrasaction='ignore')
+                self.csv_writer.writeheader()
+            self.csv_writer.writerow({field: csv_cell(row.get(field)) for field in self.fields})
+        else:
+            self.pending.append(row)
+            if len(self.pending) >= self.chunk_rows:
+                self._flush_row_group()
+    
+    def write_rows(self, rows: Iterable[Dict]) -> int:
+        """Write rows from any iterable (a generator keeps memory flat); returns the running count"""
+        for row in rows:
+            self.write(row)
+        return self.count
+    
+    def _flush_row_group(self):
+        """Write the pending rows as one Parquet row group"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        columns = {field: [self._parquet_value(row.get(field)) for row in self.pending] for field in self.fields}
+        self.pending = []
+        
+        if self.types:
+            for field, values in columns.items():
+                if self.types[field] == 'string':
+                    columns[field] = [None if value is None else str(value) for value in values]
+        
+        if self.parquet_writer is None:
+            if self.types:
+                factories = {'string': pa.string, 'int64': pa.int64, 'float64': pa.float64, 'bool': pa.bool_}
+                schema = pa.schema([pa.field(field, factories[self.types[field]]()) for field in self.fields])
+            else:
+                # Columns that are all None in the first group would be typed null; make them strings
+                table = pa.table(columns)
+                schema = pa.schema([pa.field(f.name, pa.string()) if pa.types.is_null(f.type) else f for f in table.schema])
+            self.parquet_writer = pq.ParquetWriter(self.target, schema, compression=self.compression or 'snappy')
+        
+        self.parquet_writer.write_table(pa.table(columns, schema=self.parquet_writer.schema))
+    
+    @staticmethod
+    def _parquet_value(value):
+        """Scalars stay typed; lists and dicts become JSON strings"""
+        if isinstance(value, (list, tuple, dict)):
+            return json.dumps(value, default=str)
+        return value
+    
+    def close(self):
+        """Flush and close (streams passed in are flushed but left open)"""
+        if self.output_format == 'parquet':
+            if self.pending or (self.parquet_writer is None and self.fields):
+                self._flush_row_group()
+            if self.parquet_writer:
+                self.parquet_writer.close()
+        elif self.stream is self.target:
+            self.stream.flush()
+        else:
+            self.stream.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+class GitHubAPIError(Exception):
+    """Raised when a paginated or GraphQL request fails"""
+    
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+
+class ResponseCache:
+    """On-disk cache of GET response bodies, revalidated with ETag / Last-Modified"""
+    
+    def __init__(self, directory: str):
+        self.directory = directory
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Response cache disabled: {e}")
+    
+    def _path(self, url: str) -> str:
+        """Cache file for a URL"""
+        return os.path.join(self.directory, hashlib.sha256(url.encode('utf-8')).hexdigest() + '.json')
+    
+    def get(self, url: str) -> Optional[Dict]:
+        """Return the cached entry for a URL, if any"""
+        try:
+            with open(self._path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def conditional_headers(self, url: str) -> Dict:
+        """Build If-None-Match / If-Modified-Since headers for a URL"""
+        entry = self.get(url)
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def store(self, url: str, response):
+        """Save a 200 response that carries a validator"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        
+        entry = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'link': response.headers.get('Link'),
+            'body': response.text,
+            'stored_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        
+        # Write to a temp file first so a crash never leaves a truncated entry; the name is
+        # per thread because the async reader and batch workers can store the same URL at once
+        path = self._path(url)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            # Bodies of authenticated requests (the /user profile, private repositories) stay private to the user
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry for {url}: {e}")
+    
+    def apply(self, url: str, response):
+        """Store fresh responses and replay the cached body on 304 Not Modified"""
+        response.from_cache = False
+        
+        if response.status_code == 200:
+            self.store(url, response)
+        elif response.status_code == 304:
+            entry = self.get(url)
+            if entry:
+                response.status_code = 200
+                response._content = entry['body'].encode('utf-8')
+                response.encoding = 'utf-8'
+                if entry.get('link'):
+                    response.headers['Link'] = entry['link']
+                response.from_cache = True
+        
+        return response
+
+class SessionStateStore:
+    """Per-token login and rate-limit state kept between runs, filed under a hash of the token (never the token)"""
+    
+    MAX_AGE = 12 * 3600  # Re-validate the token with /user at least this often (seconds)
+    
+    def __init__(self, directory: str):
+        self.directory = directory
+    
+    def _path(self, access_token: str) -> str:
+        """State file for a token"""
+        return os.path.join(self.directory, hashlib.sha256(access_token.encode('utf-8')).hexdigest() + '.json')
+    
+    def load(self, access_token: str) -> Optional[Dict]:
+        """Saved {'login', 'id', 'resources', 'saved_at'} for a token, if present and not stale"""
+        try:
+            with open(self._path(access_token), 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if not state.get('login') or time.time() - state.get('saved_at', 0) > self.MAX_AGE:
+            return None
+        return state
+    
+    def save(self, access_token: str, login: str, user_id: Optional[int], resources: Dict):
+        """Record the login and last seen rate-limit state for a token"""
+        state = {'login': login, 'id': user_id, 'resources': resources, 'saved_at': time.time()}
+        
+        path = self._path(access_token)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # The file says which account a token belongs to, so keep it private to the user
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not save session state: {e}")
+    
+    def forget(self, access_token: str):
+        """Drop the saved state for a token (e.g. after it was rejected)"""
+        try:
+            os.remove(self._path(access_token))
+        except OSError:
+            pass
+
+class FollowSnapshotStore:
+    """SQLite store of follower/following snapshots, used for diffs and incremental fetches"""
+    
+    KEEP_SNAPSHOTS = 10  # Per account and kind
+    INCREMENTAL_MAX_AGE = 24 * 3600  # Older snapshots are refetched in full so renamed accounts show their new login (seconds)
+    CHECKPOINT_MAX_AGE = 24 * 3600  # Older partial fetches start over (seconds)
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.schema_ready = False
+    
+    def _connect(self) -> 'sqlite3.Connection':
+        """Open the database, creating the schema on first use"""
+        conn = sqlite3.connect(self.path)
+        # Checkpoints commit once per page; a crash may lose the last page but never corrupts the file
+        conn.execute("PRAGMA synchronous = NORMAL")
+        if self.schema_ready:
+            return conn
+        
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS snapshots (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                account TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                taken_at TEXT NOT NULL,
+                total INTEGER NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS snapshot_members (
+                snapshot_id INTEGER NOT NULL,
+                position INTEGER NOT NULL,
+                login TEXT NOT NULL,
+                user_id INTEGER,
+                PRIMARY KEY (snapshot_id, position)
+            )
+        """)
+        
+        # Partial fetches: where to continue (GraphQL cursor or REST page URL) and the accounts so far
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                account TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                source TEXT NOT NULL,
+                cursor TEXT,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (account, kind)
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS checkpoint_members (
+                account TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                login TEXT NOT NULL,
+                PRIMARY KEY (account, kind, position)
+            )
+        """)
+        
+        # Snapshots from before IDs were stored have NULL user_id and are ignored by latest()
+        columns = [r[1] for r in conn.execute("PRAGMA table_info(snapshot_members)")]
+        if 'user_id' not in columns:
+            conn.execute("ALTER TABLE snapshot_members ADD COLUMN user_id INTEGER")
+        self.schema_ready = True
+        return conn
+    
+    def latest(self, account: str, kind: str) -> Optional[Dict]:
+        """Most recent snapshot of an account's followers/following ((id, login) pairs, newest first)"""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT id, taken_at FROM snapshots WHERE account = ? AND kind = ? ORDER BY id DESC LIMIT 1",
+                    (account.lower(), kind)
+                ).fetchone()
+                if not row:
+                    return None
+                
+                users = [(r[0], r[1]) for r in conn.execute(
+                    "SELECT user_id, login FROM snapshot_members WHERE snapshot_id = ? ORDER BY position", (row[0],)
+                )]
+                if any(user_id is None for user_id, _ in users):
+                    return None
+                return {'taken_at': row[1], 'users': users}
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read snapshot: {e}")
+            return None
+    
+    def save(self, account: str, kind: str, users: List[Tuple[int, str]]):
+        """Store a complete snapshot and prune old ones"""
+        try:
+            with self._connect() as conn:
+                cursor = conn.execute(
+                    "INSERT INTO snapshots (account, kind, taken_at, total) VALUES (?, ?, ?, ?)",
+                    (account.lower(), kind, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), len(users))
+                )
+                snapshot_id = cursor.lastrowid
+                conn.executemany(
+                    "INSERT INTO snapshot_members (snapshot_id, position, user_id, login) VALUES (?, ?, ?, ?)",
+                    ((snapshot_id, i, user_id, login) for i, (user_id, login) in enumerate(users))
+                )
+                
+                stale = [r[0] for r in conn.execute(
+                    "SELECT id FROM snapshots WHERE account = ? AND kind = ? ORDER BY id DESC LIMIT -1 OFFSET ?",
+                    (account.lower(), kind, self.KEEP_SNAPSHOTS)
+                )]
+                for old_id in stale:
+                    conn.execute("DELETE FROM snapshot_members WHERE snapshot_id = ?", (old_id,))
+                    conn.execute("DELETE FROM snapshots WHERE id = ?", (old_id,))
+        except sqlite3.Error as e:
+            logger.warning(f"Could not save snapshot: {e}")
+    
+    @classmethod
+    def mergeable(cls, snapshot: Optional[Dict]) -> bool:
+        """Whether an incremental fetch may merge into this snapshot (non-empty and younger than INCREMENTAL_MAX_AGE)"""
+        if not snapshot or not snapshot['users']:
+            return False
+        age = datetime.now() - datetime.strptime(snapshot['taken_at'], "%Y-%m-%d %H:%M:%S")
+        return age.total_seconds() <= cls.INCREMENTAL_MAX_AGE
+    
+    def discard(self, account: str, kind: str):
+        """Drop an account's followers/following snapshots so the next load fetches the full list"""
+        try:
+            with self._connect() as conn:
+                ids = [r[0] for r in conn.execute(
+                    "SELECT id FROM snapshots WHERE account = ? AND kind = ?", (account.lower(), kind))]
+                for snapshot_id in ids:
+                    conn.execute("DELETE FROM snapshot_members WHERE snapshot_id = ?", (snapshot_id,))
+                    conn.execute("DELETE FROM snapshots WHERE id = ?", (snapshot_id,))
+        except sqlite3.Error as e:
+            logger.warning(f"Could not discard snapshot: {e}")
+    
+    def checkpoint(self, account: str, kind: str) -> Optional[Dict]:
+        """The unfinished fetch of an account's followers/following: {'source', 'cursor', 'users', 'updated_at'}"""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT source, cursor, updated_at FROM checkpoints WHERE account = ? AND kind = ?",
+                    (account.lower(), kind)
+                ).fetchone()
+                if not row or time.time() - row[2] > self.CHECKPOINT_MAX_AGE:
+                    return None
+                
+                users = [(r[0], r[1]) for r in conn.execute(
+                    "SELECT user_id, login FROM checkpoint_members WHERE account = ? AND kind = ? ORDER BY position",
+                    (account.lower(), kind)
+                )]
+                return {'source': row[0], 'cursor': row[1], 'users': users, 'updated_at': row[2]}
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read checkpoint: {e}")
+            return None
+    
+    def checkpoint_size(self, account: str, kind: str) -> int:
+        """Accounts already fetched by an unfinished fetch (0 if there is none)"""
+        checkpoint = self.checkpoint(account, kind)
+        return len(checkpoint['users']) if checkpoint else 0
+    
+    def extend_checkpoint(self, account: str, kind: str, source: str, cursor: Optional[str],
+                          users: List[Tuple[int, str]], offset: int):
+        """Record one fetched page: its accounts (from position `offset`) and where the next page starts"""
+        try:
+            with self._connect() as conn:
+                if offset == 0:
+                    conn.execute("DELETE FROM checkpoint_members WHERE account = ? AND kind = ?", (account.lower(), kind))
+                conn.execute(
+                    "INSERT OR REPLACE INTO checkpoints (account, kind, source, cursor, updated_at) VALUES (?, ?, ?, ?, ?)",
+                    (account.lower(), kind, source, cursor, time.time())
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO checkpoint_members (account, kind, position, user_id, login) VALUES (?, ?, ?, ?, ?)",
+                    ((account.lower(), kind, offset + i, user_id, login) for i, (user_id, login) in enumerate(users))
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not save checkpoint: {e}")
+    
+    def clear_checkpoint(self, account: str, kind: str):
+        """Drop the checkpoint once a fetch completes"""
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM checkpoints WHERE account = ? AND kind = ?", (account.lower(), kind))
+                conn.execute("DELETE FROM checkpoint_members WHERE account = ? AND kind = ?", (account.lower(), kind))
+        except sqlite3.Error as e:
+            logger.warning(f"Could not clear checkpoint: {e}")
+
+class ProfileHistoryStore:
+    """
+    SQLite time series of get_user_info() metrics, one row per distinct observation
+    
+    Consecutive analyses that see the same numbers only move the row's last_seen,
+    so the table grows with changes rather than with how often an account is checked.
+    scanned_at is when the repository aggregates were last actually recomputed.
+    """
+    
+    METRICS = ('followers', 'following', 'public_repos', 'public_gists', 'repo_count', 'total_stars', 'total_forks')
+    PERIODS = {'day': '%Y-%m-%d', 'week': '%Y-W%W'}
+    REUSE_MAX_AGE = 24 * 3600  # Stars/forks older than this are rescanned even when the profile is unchanged (seconds)
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.schema_ready = False
+    
+    def _connect(self) -> 'sqlite3.Connection':
+        """Open the database, creating the schema on first use"""
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA synchronous = NORMAL")
+        if self.schema_ready:
+            return conn
+        
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS profile_metrics (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                login TEXT NOT NULL,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                scanned_at TEXT,
+                {', '.join(f'{name} INTEGER NOT NULL' for name in self.METRICS)},
+                top_languages TEXT NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS profile_metrics_login ON profile_metrics (login, id)")
+        
+        # Rows from before scanned_at was tracked have NULL and count as never scanned
+        columns = [r[1] for r in conn.execute("PRAGMA table_info(profile_metrics)")]
+        if 'scanned_at' not in columns:
+            conn.execute("ALTER TABLE profile_metrics ADD COLUMN scanned_at TEXT")
+        self.schema_ready = True
+        return conn
+    
+    def _row(self, row: Tuple) -> Dict:
+        """A profile_metrics row as {'first_seen', 'last_seen', 'scanned_at', <metrics>, 'top_languages'}"""
+        entry = {'first_seen': row[0], 'last_seen': row[1], 'scanned_at': row[2]}
+        entry.update(zip(self.METRICS, row[3:-1], strict=True))
+        entry['top_languages'] = [tuple(pair) for pair in json.loads(row[-1])]
+        return entry
+    
+    def _select(self) -> str:
+        """SELECT clause matching _row()"""
+        return f"SELECT first_seen, last_seen, scanned_at, {', '.join(self.METRICS)}, top_languages FROM profile_metrics"
+    
+    def latest(self, login: str, count: int = 1) -> List[Dict]:
+        """The newest `count` observations of an account, newest first"""
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(f"{self._select()} WHERE login = ? ORDER BY id DESC LIMIT ?",
+                                    (login.lower(), count)).fetchall()
+                return [self._row(row) for row in rows]
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read profile history: {e}")
+            return []
+    
+    def public_repos(self, logins: Iterable[str]) -> Dict[str, int]:
+        """login (lowercase) -> public_repos from the newest observation, for the logins that have one"""
+        logins = list({login.lower() for login in logins})
+        counts = {}
+        try:
+            with self._connect() as conn:
+                for start in range(0, len(logins), 500):  # Stay under SQLite's bound-parameter limit
+                    chunk = logins[start:start + 500]
+                    counts.update(conn.execute(
+                        "SELECT login, public_repos FROM profile_metrics WHERE id IN "
+                        f"(SELECT MAX(id) FROM profile_metrics WHERE login IN ({', '.join('?' * len(chunk))}) GROUP BY login)",
+                        chunk
+                    ).fetchall())
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read profile history: {e}")
+        return counts
+    
+    def record(self, user_info: Dict, repo_count: int):
+        """Append an analysis that rescanned the repositories, or extend the newest row when none of the metrics changed"""
+        values = dict(user_info, repo_count=repo_count)
+        metrics = tuple(values.get(name) or 0 for name in self.METRICS)
+        languages = json.dumps([list(pair) for pair in user_info.get('top_languages', [])])
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        login = (user_info.get('username') or '').lower()
+        
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    f"SELECT id, {', '.join(self.METRICS)}, top_languages FROM profile_metrics "
+                    "WHERE login = ? ORDER BY id DESC LIMIT 1", (login,)
+                ).fetchone()
+                if row and tuple(row[1:-1]) == metrics and row[-1] == languages:
+                    conn.execute("UPDATE profile_metrics SET last_seen = ?, scanned_at = ? WHERE id = ?", (now, now, row[0]))
+                    return
+                
+                conn.execute(
+                    f"INSERT INTO profile_metrics (login, first_seen, last_seen, scanned_at, {', '.join(self.METRICS)}, top_languages) "
+                    f"VALUES (?, ?, ?, ?, {', '.join('?' * len(self.METRICS))}, ?)",
+                    (login, now, now, now) + metrics + (languages,)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not save profile history: {e}")
+    
+    def touch(self, login: str):
+        """Mark the newest observation as seen again without a rescan (scanned_at is left alone)"""
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "UPDATE profile_metrics SET last_seen = ? WHERE id = (SELECT MAX(id) FROM profile_metrics WHERE login = ?)",
+                    (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), login.lower())
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not save profile history: {e}")
+    
+    def trend(self, login: str, period: str = 'day', limit: int = 30) -> List[Dict]:
+        """
+        The last observation in each day/week, oldest first, with 'period' and
+        per-metric '<name>_delta' against the previous period
+        """
+        bucket = f"strftime('{self.PERIODS[period]}', last_seen)"
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    f"SELECT {bucket}, first_seen, last_seen, scanned_at, {', '.join(self.METRICS)}, top_languages "
+                    f"FROM profile_metrics WHERE id IN (SELECT MAX(id) FROM profile_metrics WHERE login = ? "
+                    f"GROUP BY {bucket}) ORDER BY id DESC LIMIT ?",
+                    (login.lower(), limit + 1)
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read profile history: {e}")
+            return []
+        
+        # One extra row is read so the oldest period shown still has a delta
+        entries = [dict(period=row[0], **self._row(row[1:])) for row in reversed(rows)]
+        previous = None
+        for entry in entries:
+            for name in self.METRICS:
+                entry[f"{name}_delta"] = entry[name] - previous[name] if previous else None
+            previous = entry
+        return entries[-limit:]
+
+class FollowGraph:
+    """
+    Followers and following as lists of (id, login) sorted by numeric user ID
+    
+    The partitions come from one linear merge over the IDs, so renamed accounts
+    still match and comparisons are integer comparisons. Logins are interned as
+    they are fetched, so every list points at a single copy of each string.
+    """
+    
+    def __init__(self, followers: Iterable[Tuple[int, str]], following: Iterable[Tuple[int, str]]):
+        self.followers = sorted(followers, key=itemgetter(0))
+        self.following = sorted(following, key=itemgetter(0))
+    
+    def partition(self) -> Tuple[List[str], List[str], List[str]]:
+        """(mutual, not following back, fans) as alphabetically sorted login lists"""
+        followers, following = self.followers, self.following
+        mutual, not_following_back, fans = [], [], []
+        
+        i = j = 0
+        while i < len(followers) or j < len(following):
+            if j == len(following) or (i < len(followers) and followers[i][0] < following[j][0]):
+                user_id, login = followers[i]
+                fans.append(login)
+            elif i == len(followers) or following[j][0] < followers[i][0]:
+                user_id, login = following[j]
+                not_following_back.append(login)
+            else:
+                user_id, login = followers[i]
+                mutual.append(login)
+            
+            # Step past this ID in both lists (repeats included)
+            while i < len(followers) and followers[i][0] == user_id:
+                i += 1
+            while j < len(following) and following[j][0] == user_id:
+                j += 1
+        
+        for logins in (mutual, not_following_back, fans):
+            logins.sort()
+        return mutual, not_following_back, fans
+
+class RateLimitGovernor:
+    """Tracks rate-limit state from response headers and paces requests around primary/secondary limits"""
+    
+    def __init__(self, max_wait: int = 90, low_watermark: int = 50):
+        self.max_wait = max_wait            # Longest we'll sleep automatically before giving up (seconds)
+        self.low_watermark = low_watermark  # Remaining-requests level that triggers a warning
+        self.resources = {}                 # resource -> {'limit', 'remaining', 'used', 'reset'}
+        self.backoff_until = 0.0            # Secondary limit / Retry-After pause (epoch seconds)
+        self.secondary_hits = 0
+        self.lock = threading.Lock()
+    
+    def observe(self, response, *args, **kwargs):
+        """Session response hook: record X-RateLimit-* and Retry-After headers"""
+        headers = response.headers
+        resource = headers.get('X-RateLimit-Resource', 'core')
+        
+        with self.lock:
+            if 'X-RateLimit-Remaining' in headers:
+                try:
+                    self.resources[resource] = {
+                        'limit': int(headers.get('X-RateLimit-Limit', 0)),
+                        'remaining': int(headers['X-RateLimit-Remaining']),
+                        'used': int(headers.get('X-RateLimit-Used', 0)),
+                        'reset': int(headers.get('X-RateLimit-Reset', 0))
+                    }
+                except ValueError:
+                    pass
+            
+            if response.status_code in (403, 429):
+                retry_after = headers.get('Retry-After')
+                state = self.resources.get(resource, {})
+                
+                if retry_after and retry_after.isdigit():
+                    self.backoff_until = max(self.backoff_until, time.time() + int(retry_after))
+                    self.secondary_hits += 1
+                elif state.get('remaining') != 0 and 'rate limit' in response.text.lower():
+                    # Secondary limit without Retry-After: wait a minute, doubling on repeats
+                    self.secondary_hits += 1
+                    self.backoff_until = max(self.backoff_until, time.time() + 60 * 2 ** min(self.secondary_hits - 1, 4))
+            elif response.status_code < 400:
+                self.secondary_hits = 0
+    
+    def update_from_rate_limit(self, rate_data: Dict):
+        """Seed state from a /rate_limit response body"""
+        with self.lock:
+            for resource, state in rate_data.get('resources', {}).items():
+                self.resources[resource] = {
+                    'limit': state.get('limit', 0),
+                    'remaining': state.get('remaining', 0),
+                    'used': state.get('used', 0),
+                    'reset': state.get('reset', 0)
+                }
+    
+    def restore(self, resources: Dict):
+        """Seed state saved by an earlier run; windows that have reset since start over at their limit"""
+        now = time.time()
+        with self.lock:
+            for resource, state in resources.items():
+                if resource in self.resources:
+                    continue  # Fresher headers already seen this run
+                state = dict(state)
+                if state.get('reset', 0) <= now:
+                    state.update(remaining=state.get('limit', 0), used=0)
+                self.resources[resource] = state
+    
+    def snapshot(self) -> Dict:
+        """Copy of the current per-resource state (for saving between runs)"""
+        with self.lock:
+            return {resource: dict(state) for resource, state in self.resources.items()}
+    
+    def shortfall(self, estimate: Dict[str, int]) -> Dict[str, int]:
+        """Requests per resource that an estimated cost exceeds the last known remaining budget by"""
+        missing = {}
+        for resource, cost in estimate.items():
+            remaining = self.remaining(resource)
+            if remaining is not None and cost > remaining:
+                missing[resource] = cost - remaining
+        return missing
+    
+    def remaining(self, resource: str = 'core') -> Optional[int]:
+        """Last known remaining requests for a resource (None if not seen yet)"""
+        return self.resources.get(resource, {}).get('remaining')
+    
+    def reset_at(self, resource: str = 'core') -> Optional[datetime]:
+        """Last known reset time for a resource"""
+        reset = self.resources.get(resource, {}).get('reset')
+        return datetime.fromtimestamp(reset) if reset else None
+    
+    def wait_time(self, resource: str = 'core') -> float:
+        """Seconds to wait before the next request on a resource is allowed"""
+        now = time.time()
+        wait = self.backoff_until - now
+        
+        state = self.resources.get(resource)
+        if state and state['remaining'] == 0:
+            wait = max(wait, state['reset'] - now + 1)
+        
+        return max(wait, 0.0)
+    
+    def is_rate_limited(self, response) -> bool:
+        """Whether a response was rejected by a primary or secondary rate limit"""
+        if response.status_code not in (403, 429):
+            return False
+        if response.headers.get('X-RateLimit-Remaining') == '0' or 'Retry-After' in response.headers:
+            return True
+        return 'rate limit' in response.text.lower()
+    
+    def wait(self, resource: str = 'core') -> bool:
+        """Sleep until a request is allowed; False if that would take longer than max_wait"""
+        delay = self.wait_time(resource)
+        if delay <= 0:
+            return True
+        if delay > self.max_wait:
+            return False
+        
+        logger.info(f"Rate limit backoff: sleeping {delay:.0f}s")
+        time.sleep(delay)
+        return True
+    
+    def refusal(self, url: str, resource: str = 'core'):
+        """Synthetic 403 standing in for a request not sent because the limit won't clear within max_wait"""
+        response = requests.Response()
+        response.status_code = 403
+        response.reason = 'Rate Limited'
+        response.url = url
+        response.headers['Retry-After'] = str(int(self.wait_time(resource)) + 1)
+        response._content = json.dumps({'message': 'API rate limit exceeded (request not sent)'}).encode('utf-8')
+        response.encoding = 'utf-8'
+        return response
+
+def track_flow(method):
+    """Tag the API requests a GitHubTool method makes with the method's name"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.request_metrics.flow(method.__name__):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+def profile_flow(method):
+    """Profile a menu flow when GITHUB_TOOL_PROFILE / --profile is set (see FlowProfiler)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.profiled(method.__name__):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+class RequestMetrics:
+    """Per-flow, per-endpoint request statistics, fed by a session response hook"""
+    
+    # URL paths are collapsed to templates so /users/alice and /users/bob share one row
+    ENDPOINT_PATTERNS = [
+        (re.compile(r'^/users/[^/]+'), '/users/{user}'),
+        (re.compile(r'^/repos/[^/]+/[^/]+'), '/repos/{owner}/{repo}'),
+        (re.compile(r'^/orgs/[^/]+'), '/orgs/{org}'),
+        (re.compile(r'^/user/(following|starred)/.+'), r'/user/\1/{target}'),
+    ]
+    
     def __init__(self):
-        self.session = requests.Session()
+        self.stats = {}        # (flow, endpoint) -> counters and latencies
+        self.last_used = {}    # rate-limit resource -> (X-RateLimit-Used, X-RateLimit-Reset)
+        self.local = threading.local()
+        self.root_flow = None  # Outermost active flow, inherited by worker threads
+        self.lock = threading.Lock()
+    
+    @contextmanager
+    def flow(self, name: str) -> Iterator[None]:
+        """Attribute requests made inside the block to `name` (the innermost flow on a thread wins)"""
+        stack = getattr(self.local, 'flows', None)
+        if stack is None:
+            stack = self.local.flows = []
+        
+        is_root = self.root_flow is None
+        if is_root:
+            self.root_flow = name
+        stack.append(name)
+        try:
+            yield
+        finally:
+            stack.pop()
+            if is_root:
+                self.root_flow = None
+    
+    def current_flow(self) -> str:
+        """Flow to charge a request on this thread to"""
+        stack = getattr(self.local, 'flows', None)
+        if stack:
+            return stack[-1]
+        return self.root_flow or 'other'
+    
+    def endpoint(self, method: str, url: str) -> str:
+        """'GET /users/{user}/followers' style key for a request"""
+        path = urlparse(url).path
+        for pattern, template in self.ENDPOINT_PATTERNS:
+            if pattern.match(path):
+                path = pattern.sub(template, path, count=1)
+                break
+        return f"{method} {path}"
+    
+    def observe(self, response, *args, **kwargs):
+        """Session response hook: record latency, bytes, status, cache hits and quota spent"""
+        request = response.request
+        headers = response.headers
+        key = (self.current_flow(), self.endpoint(request.method, request.url))
+        
+        bytes_in = int(headers.get('Content-Length') or len(response.content or b''))
+        body = request.body or b''
+        bytes_out = len(body.encode('utf-8') if isinstance(body, str) else body)
+        
+        # Quota is the change in X-RateLimit-Used, which also prices GraphQL queries correctly
+        units = 0
+        resource = headers.get('X-RateLimit-Resource', 'core')
+        used = headers.get('X-RateLimit-Used', '')
+        reset = headers.get('X-RateLimit-Reset')
+        
+        with self.lock:
+            if used.isdigit():
+                used = int(used)
+                last = self.last_used.get(resource)
+                if last and last[1] == reset:
+                    units = max(used - last[0], 0)
+                    used = max(used, last[0])
+                elif response.status_code != 304 and not request.url.endswith('/rate_limit'):
+                    units = 1  # First response in this window: assume the usual cost
+                self.last_used[resource] = (used, reset)
+            
+            entry = self.stats.setdefault(key, {
+                'latencies': [], 'bytes_in': 0, 'bytes_out': 0, 'statuses': {}, 'cache_hits': 0, 'quota_units': 0
+            })
+            entry['latencies'].append(response.elapsed.total_seconds())
+            entry['bytes_in'] += bytes_in
+            entry['bytes_out'] += bytes_out
+            status = str(response.status_code)
+            entry['statuses'][status] = entry['statuses'].get(status, 0) + 1
+            entry['quota_units'] += units
+            if response.status_code == 304:
+                entry['cache_hits'] += 1
+    
+    @staticmethod
+    def percentile(ordered: List[float], fraction: float) -> float:
+        """Nearest-rank percentile of an already sorted list"""
+        if not ordered:
+            return 0.0
+        return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+    
+    def latency_percentiles(self, ordered: List[float]) -> Dict:
+        """p50/p90/p99/max of sorted latencies, in milliseconds"""
+        return {
+            name: round(self.percentile(ordered, fraction) * 1000, 1)
+            for name, fraction in (('p50', 0.5), ('p90', 0.9), ('p99', 0.99), ('max', 1.0))
+        }
+    
+    def summary(self) -> Dict:
+        """Per-flow totals with per-endpoint breakdowns (latencies in milliseconds)"""
+        with self.lock:
+            items = [(key, dict(entry, latencies=sorted(entry['latencies']))) for key, entry in self.stats.items()]
+        
+        flows = {}
+        flow_latencies = {}
+        for (flow, endpoint), entry in sorted(items):
+            latencies = entry['latencies']
+            flow_latencies.setdefault(flow, []).extend(latencies)
+            totals = flows.setdefault(flow, {
+                'requests': 0, 'seconds': 0.0, 'bytes_in': 0, 'bytes_out': 0,
+                'cache_hits': 0, 'quota_units': 0, 'endpoints': {}
+            })
+            totals['requests'] += len(latencies)
+            totals['seconds'] = round(totals['seconds'] + sum(latencies), 3)
+            for field in ('bytes_in', 'bytes_out', 'cache_hits', 'quota_units'):
+                totals[field] += entry[field]
+            
+            totals['endpoints'][endpoint] = {
+                'requests': len(latencies),
+                'statuses': entry['statuses'],
+                'bytes_in': entry['bytes_in'],
+                'bytes_out': entry['bytes_out'],
+                'cache_hits': entry['cache_hits'],
+                'quota_units': entry['quota_units'],
+                'latency_ms': self.latency_percentiles(latencies)
+            }
+        
+        for flow, latencies in flow_latencies.items():
+            flows[flow]['latency_ms'] = self.latency_percentiles(sorted(latencies))
+        
+        return {'flows': flows}
+    
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition of the same data"""
+        def labels(**values) -> str:
+            escaped = []
+            for name, value in values.items():
+                value = str(value).replace('\\', '\\\\').replace('"', '\\"')
+                escaped.append(f'{name}="{value}"')
+            return '{' + ','.join(escaped) + '}'
+        
+        with self.lock:
+            items = [(key, dict(entry, latencies=sorted(entry['latencies']))) for key, entry in self.stats.items()]
+        
+        lines = [
+            '# HELP github_tool_requests_total GitHub API requests by flow, endpoint and status',
+            '# TYPE github_tool_requests_total counter'
+        ]
+        for (flow, endpoint), entry in sorted(items):
+            for status, count in sorted(entry['statuses'].items()):
+                lines.append(f"github_tool_requests_total{labels(flow=flow, endpoint=endpoint, status=status)} {count}")
+        
+        counters = [
+            ('github_tool_bytes_received_total', 'bytes_in', 'Response bytes received'),
+            ('github_tool_bytes_sent_total', 'bytes_out', 'Request body bytes sent'),
+            ('github_tool_cache_hits_total', 'cache_hits', 'Requests answered 304 Not Modified from the ETag cache'),
+            ('github_tool_quota_units_total', 'quota_units', 'Rate-limit units consumed'),
+        ]
+        for metric, field, description in counters:
+            lines += [f"# HELP {metric} {description}", f"# TYPE {metric} counter"]
+            for (flow, endpoint), entry in sorted(items):
+                lines.append(f"{metric}{labels(flow=flow, endpoint=endpoint)} {entry[field]}")
+        
+        lines += [
+            '# HELP github_tool_request_latency_seconds GitHub API response latency',
+            '# TYPE github_tool_request_latency_seconds summary'
+        ]
+        for (flow, endpoint), entry in sorted(items):
+            latencies = entry['latencies']
+            for quantile in (0.5, 0.9, 0.99):
+                value = self.percentile(latencies, quantile)
+                lines.append(f"github_tool_request_latency_seconds{labels(flow=flow, endpoint=endpoint, quantile=quantile)} {value:.6f}")
+            lines.append(f"github_tool_request_latency_seconds_sum{labels(flow=flow, endpoint=endpoint)} {sum(latencies):.6f}")
+            lines.append(f"github_tool_request_latency_seconds_count{labels(flow=flow, endpoint=endpoint)} {len(latencies)}")
+        
+        return '\n'.join(lines) + '\n'
+    
+    def dump(self, path: str):
+        """Write the metrics to a file: Prometheus text for .prom/.txt, JSON otherwise"""
+        with open(path, 'w', encoding='utf-8') as f:
+            if path.endswith(('.prom', '.txt')):
+                f.write(self.to_prometheus())
+            else:
+                json.dump(self.summary(), f, indent=2)
+
+class FlowProfiler:
+    """
+    Deterministic (cProfile) profiles of whole flows, one .pstats file per flow run
+    
+    Alongside each file a line in profiles.jsonl splits the flow's wall time into
+    process CPU time (all threads) and the time the flow's own thread spent
+    blocked: on sockets and worker threads, in sleeps, or at an input prompt.
+    Only the thread that started the flow is profiled; requests handed to worker
+    threads show up as time waiting on them.
+    """
+    
+    # Builtins (pstats filename '~') whose own time is the thread being blocked, not running Python
+    WAIT_CATEGORIES = (
+        ('input', re.compile(r"builtins\.input|readline' of '_io")),
+        ('sleep', re.compile(r"time\.sleep")),
+        ('network', re.compile(r"_socket|_ssl|select|poll|_thread\.lock|getaddrinfo")),
+    )
+    HOTSPOTS = 5
+    
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.active = False
+        self.runs = 0
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Profile directory unavailable: {e}")
+    
+    @contextmanager
+    def profile(self, name: str) -> Iterator[Dict]:
+        """
+        Profile the block as flow `name`; the yielded dict is filled with the
+        breakdown when the block ends. Nested flows belong to the outer profile.
+        """
+        summary = {}
+        if self.active:
+            yield summary
+            return
+        
+        import cProfile
+        import pstats
+        
+        self.active = True
+        self.runs += 1
+        profiler = cProfile.Profile()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        profiler.enable()
+        try:
+            yield summary
+        finally:
+            profiler.disable()
+            wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+            self.active = False
+            
+            path = os.path.join(self.directory, f"{datetime.now():%Y%m%d-%H%M%S}-{self.runs}-{name}.pstats")
+            stats = pstats.Stats(profiler)
+            summary.update(flow=name, file=path, wall_seconds=round(wall, 3), cpu_seconds=round(cpu, 3),
+                           **self.breakdown(stats))
+            try:
+                stats.dump_stats(path)
+                with open(os.path.join(self.directory, 'profiles.jsonl'), 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(summary) + '\n')
+            except OSError as e:
+                logger.warning(f"Could not write profile for {name}: {e}")
+    
+    def breakdown(self, stats) -> Dict:
+        """Blocked seconds per WAIT_CATEGORIES entry and the functions with the most own time"""
+        waits = {f"{category}_seconds": 0.0 for category, _ in self.WAIT_CATEGORIES}
+        busy = []
+        for (filename, line, function), (_, _, own_time, _, _) in stats.stats.items():
+            category = None
+            if filename == '~':
+                category = next((c for c, pattern in self.WAIT_CATEGORIES if pattern.search(function)), None)
+            if category:
+                waits[f"{category}_seconds"] += own_time
+            else:
+                busy.append((own_time, f"{os.path.basename(filename)}:{line}({function})"))
+        
+        busy.sort(reverse=True)
+        return dict({k: round(v, 3) for k, v in waits.items()},
+                    hotspots=[{'function': where, 'seconds': round(own_time, 3)} for own_time, where in busy[:self.HOTSPOTS]])
+
+class Transport:
+    """
+    HTTP transport settings for the API session: pool size, timeouts, retries, HTTP/2
+    
+    Idempotent requests (GET/HEAD) that fail with a connection error or a
+    5xx are retried with jittered exponential backoff. 403/429 rate limits are
+    left to RateLimitGovernor. HTTP/2 needs httpx 0.26+ with the h2 extra and
+    falls back to HTTP/1.1 pooling when it isn't installed.
+    """
+    
+    RETRY_STATUSES = (500, 502, 503, 504)
+    RETRY_METHODS = frozenset({'GET', 'HEAD'})
+    
+    def __init__(self, pool_size: int = 10, connect_timeout: float = 5.0, read_timeout: float = 30.0,
+                 retries: int = 3, backoff: float = 0.5, http2: bool = False):
+        self.pool_size = pool_size
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retries = retries
+        self.backoff = backoff  # First retry waits up to this long, doubling each time
+        self.http2 = http2
+    
+    @classmethod
+    def from_env(cls) -> 'Transport':
+        """Settings from GITHUB_TOOL_POOL_SIZE / _CONNECT_TIMEOUT / _READ_TIMEOUT / _RETRIES / _HTTP2"""
+        def number(name: str, kind, default, minimum):
+            value = os.environ.get(name)
+            if value is None:
+                return default
+            try:
+                parsed = kind(value)
+            except ValueError:
+                parsed = None
+            if parsed is None or not parsed >= minimum:  # `not >=` also rejects NaN
+                logger.warning(f"Ignoring {name}={value!r}: expected a number >= {minimum}; using {default}")
+                return default
+            return parsed
+        
+        return cls(
+            pool_size=number('GITHUB_TOOL_POOL_SIZE', int, 10, 1),
+            connect_timeout=number('GITHUB_TOOL_CONNECT_TIMEOUT', float, 5.0, 0.001),
+            read_timeout=number('GITHUB_TOOL_READ_TIMEOUT', float, 30.0, 0.001),
+            retries=number('GITHUB_TOOL_RETRIES', int, 3, 0),
+            http2=os.environ.get('GITHUB_TOOL_HTTP2', '').lower() in ('1', 'true', 'yes')
+        )
+    
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        return self.connect_timeout, self.read_timeout
+    
+    def retry_policy(self) -> 'Retry':
+        """urllib3 retry policy for the HTTP/1.1 adapter"""
+        from github_http import JitteredRetry
+        
+        return JitteredRetry(
+            total=self.retries,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=self.RETRY_METHODS,
+            backoff_factor=self.backoff,
+            raise_on_status=False,            # Hand the last 5xx back instead of raising
+            respect_retry_after_header=False  # Retry-After means a rate limit: the governor's job
+        )
+    
+    def build_session(self, api_url: str) -> 'requests.Session':
+        """A session with pooled, retrying adapters (HTTP/2 for the API host if enabled)"""
+        from requests.adapters import HTTPAdapter
+        from github_http import TimeoutSession, HTTP2Adapter
+        
+        session = TimeoutSession(self.timeout)
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size,
+                              max_retries=self.retry_policy())
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        
+        if self.http2:
+            try:
+                session.mount(api_url, HTTP2Adapter(self))
+            except ImportError as e:
+                logger.warning(f"HTTP/2 unavailable ({e}); install httpx[http2]>=0.26. Using HTTP/1.1")
+        
+        return session
+
+class GitHubTool:
+    def __init__(self, interactive: bool = True, verbose: bool = False, transport: Optional[Transport] = None):
+        self.interactive = interactive  # False for headless CLI runs: no banner, spinner or menus
+        self.verbose = verbose          # Headless only: show progress messages on stderr
         self.base_url = "https://github.com"
         self.api_url = "https://api.github.com"
+        self.transport = transport or Transport.from_env()
+        self._session = None  # Built on first use (see the session property)
+        self.session_lock = threading.Lock()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36',
             'Accept': 'application/vnd.github.v3+json',
@@ -74,13 +1493,39 @@ class GitHubTool:
             'Sec-Fetch-Site': 'none',
             'Cache-Control': 'max-age=0',
         }
-        self.session.headers.update(self.headers)
+        
+        # Every response (reads and writes) feeds the rate-limit governor
+        self.rate_governor = RateLimitGovernor()
+        self.max_rate_limit_retries = 2
+        
+        # What to do when a flow's estimated cost exceeds the remaining quota: 'ask' (menu), 'fail', 'wait', 'run' or 'split'
+        self.budget_policy = 'ask' if interactive else 'fail'
+        
+        # ...and the per-flow request metrics shown at exit (GITHUB_TOOL_METRICS=path also dumps them)
+        self.request_metrics = RequestMetrics()
+        self.metrics_path = os.environ.get('GITHUB_TOOL_METRICS')
+        
+        # GITHUB_TOOL_PROFILE=dir writes a cProfile .pstats file per flow there (FlowProfiler)
+        profile_dir = os.environ.get('GITHUB_TOOL_PROFILE')
+        self.profiler = FlowProfiler(profile_dir) if profile_dir else None
+        
         self.username = None
+        self.user_id = None
         self.access_token = None
         self.session_start_time = datetime.now()
         self.followed_users = []
         self.starred_repos = []
         
+        # Local state (response cache etc.) lives outside the working directory
+        self.state_dir = os.environ.get('GITHUB_TOOL_HOME', os.path.join(os.path.expanduser('~'), '.github_tool'))
+        self.response_cache = ResponseCache(os.path.join(self.state_dir, 'http_cache'))
+        self.snapshot_store = FollowSnapshotStore(os.path.join(self.state_dir, 'snapshots.db'))
+        self.profile_history = ProfileHistoryStore(os.path.join(self.state_dir, 'profiles.db'))
+        self.session_state = SessionStateStore(os.path.join(self.state_dir, 'sessions'))
+        self.followback_changes = None
+        self.user_info_cache = {}  # username (lowercase) -> get_user_info() result
+        self.active_spinner = None
+        
         
         self.github_features = {
             'follow': 'Follow users',
@@ -116,13 +1561,50 @@ class GitHubTool:
             "Other violations"
         ]
     
+    @property
+    def session(self) -> 'requests.Session':
+        """The API session, created on first request so the menu appears before requests is imported"""
+        if self._session is None:
+            with self.session_lock:
+                if self._session is None:
+                    session = self.transport.build_session(self.api_url)
+                    session.headers.update(self.headers)
+                    session.hooks['response'].append(self.rate_governor.observe)
+                    session.hooks['response'].append(self.request_metrics.observe)
+                    session.hooks['response'].append(self.forget_rejected_token)
+                    self._session = session
+        return self._session
+    
+    @contextmanager
+    def screen(self) -> Iterator[None]:
+        """Collect everything printed inside into one buffer, then write it with a single flush"""
+        buffer = io.StringIO()
+        stdout = sys.stdout
+        sys.stdout = buffer
+        try:
+            yield
+        finally:
+            sys.stdout = stdout
+            stdout.write(buffer.getvalue())
+            stdout.flush()
+    
+    def box_row(self, content: str, width: int = 60) -> str:
+        """One row of a ┌─┐ box: content clipped or padded to the inner width and closed with the right border"""
+        return f"{Colors.BRIGHT_GREEN}│{Colors.RESET}{pad(clip(content, width), width)}{Colors.RESET}{Colors.BRIGHT_GREEN}│{Colors.RESET}"
+    
     def clear_screen(self):
         """Clear the terminal screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
-        print('\033[H\033[J', end='')
+        # The real stdout: inside a screen() sys.stdout is the frame buffer
+        if not self.interactive or not sys.__stdout__.isatty():
+            return
+        # Home the cursor and erase, without a clear/cls subprocess per screen
+        print('\033[H\033[2J', end='')
     
+    @render_once
     def print_banner(self):
         """Print the cool ASCII banner with gradient colors"""
+        if not self.interactive:
+            return
         self.clear_screen()
         
         banner = [
@@ -150,32 +1632,46 @@ class GitHubTool:
         print(f"{Colors.RESET}")
         print(f"{Colors.BRIGHT_CYAN}{'='*70}{Colors.RESET}")
         print(f"{Colors.BRIGHT_GREEN}┌────────────────────────────────────────────────────────────┐{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.BRIGHT_CYAN}             GITHUB TOOL v3.6      {Colors.BRIGHT_GREEN}{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.BRIGHT_YELLOW}     Developed with  ❤️ by Illusivehacks         {Colors.BRIGHT_GREEN}{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.BRIGHT_CYAN}     NEW: Seed User Follower Extractor            {Colors.BRIGHT_GREEN}{Colors.RESET}")
+        print(self.box_row(f"{Colors.BRIGHT_CYAN}             GITHUB TOOL v3.6"))
+        print(self.box_row(f"{Colors.BRIGHT_YELLOW}     Developed with  ❤️ by Illusivehacks"))
+        print(self.box_row(f"{Colors.BRIGHT_CYAN}     NEW: Seed User Follower Extractor"))
         print(f"{Colors.BRIGHT_GREEN}└────────────────────────────────────────────────────────────┘{Colors.RESET}\n")
     
-    def print_header(self, text: str, color: str = Colors.BRIGHT_CYAN):
+    def print_header(self, text: str, color: Optional[str] = None):
         """Print a formatted header"""
+        if not self.interactive:
+            return
+        color = color or Colors.BRIGHT_CYAN
+        
         print(f"\n{color}{'═' * 60}{Colors.RESET}")
         print(f"{color}{Colors.BOLD}✨ {text} ✨{Colors.RESET}")
         print(f"{color}{'═' * 60}{Colors.RESET}\n")
     
+    def write_line(self, line: str, important: bool = False):
+        """Print a line, keeping any running spinner intact (headless: stderr, progress only if verbose)"""
+        if not self.interactive:
+            if important or self.verbose:
+                print(line, file=sys.stderr)
+        elif self.active_spinner:
+            self.active_spinner.write(line)
+        else:
+            print(line)
+    
     def print_success(self, text: str):
         """Print success message"""
-        print(f"{Colors.BRIGHT_GREEN}✅ {text}{Colors.RESET}")
+        self.write_line(f"{Colors.BRIGHT_GREEN}✅ {text}{Colors.RESET}")
     
     def print_error(self, text: str):
         """Print error message"""
-        print(f"{Colors.BRIGHT_RED}❌ {text}{Colors.RESET}")
+        self.write_line(f"{Colors.BRIGHT_RED}❌ {text}{Colors.RESET}", important=True)
     
     def print_warning(self, text: str):
         """Print warning message"""
-        print(f"{Colors.BRIGHT_YELLOW}⚠️  {text}{Colors.RESET}")
+        self.write_line(f"{Colors.BRIGHT_YELLOW}⚠️  {text}{Colors.RESET}", important=True)
     
     def print_info(self, text: str):
         """Print info message"""
-        print(f"{Colors.BRIGHT_BLUE}ℹ️  {text}{Colors.RESET}")
+        self.write_line(f"{Colors.BRIGHT_BLUE}ℹ️  {text}{Colors.RESET}")
     
     def animate_loading(self, text: str, duration: int = 2):
         """Animate a loading spinner"""
@@ -194,7 +1690,45 @@ class GitHubTool:
         sys.stdout.write('\r' + ' ' * (len(text) + 2) + '\r')
         sys.stdout.flush()
     
-    def login_with_token(self, access_token: str) -> Tuple[bool, str]:
+    @contextmanager
+    def profiled(self, name: str) -> Iterator[None]:
+        """Run the block under the FlowProfiler, if profiling is on, and report where the time went"""
+        if self.profiler is None or self.profiler.active:
+            yield
+            return
+        
+        summary = {}
+        try:
+            with self.profiler.profile(name) as summary:
+                yield
+        finally:
+            if summary:
+                self.write_line(
+                    f"{Colors.BRIGHT_BLUE}🔬 {name}: {summary['wall_seconds']:.2f}s wall · "
+                    f"{summary['cpu_seconds']:.2f}s CPU · {summary['network_seconds']:.2f}s network/workers · "
+                    f"{summary['sleep_seconds']:.2f}s sleeping · {summary['input_seconds']:.2f}s at prompts{Colors.RESET}",
+                    important=True)
+                for hotspot in summary['hotspots'][:3]:
+                    self.write_line(f"{Colors.DIM}   {hotspot['seconds']:>7.3f}s  {hotspot['function']}{Colors.RESET}", important=True)
+                self.write_line(f"{Colors.DIM}   Profile written to {summary['file']}{Colors.RESET}", important=True)
+    
+    @contextmanager
+    def spinner(self, text: str) -> Iterator[Spinner]:
+        """Show a spinner for as long as the wrapped network call takes"""
+        if self.active_spinner:
+            # Nested calls (e.g. inside a batch run) share the outer spinner
+            yield self.active_spinner
+            return
+        
+        with Spinner(text, enabled=self.interactive) as spinner:
+            self.active_spinner = spinner
+            try:
+                yield spinner
+            finally:
+                self.active_spinner = None
+    
+    @track_flow
+    def login_with_token(self, access_token: str, use_saved_state: bool = True) -> Tuple[bool, str]:
         """Login using GitHub Personal Access Token"""
         try:
             self.print_header("GITHUB LOGIN")
@@ -205,19 +1739,34 @@ class GitHubTool:
                 'Accept': 'application/vnd.github.v3+json'
             })
             
-            self.animate_loading("Authenticating with GitHub API")
+            # A recent run with this token already knows who it is and how much budget is left
+            saved = self.session_state.load(access_token) if use_saved_state else None
+            if saved:
+                self.username = saved['login']
+                self.user_id = saved.get('id')
+                self.rate_governor.restore(saved.get('resources', {}))
+                
+                self.print_success(f"Welcome back, @{self.username}! ✨")
+                remaining = self.rate_governor.remaining()
+                if remaining is not None:
+                    self.print_info(f"API Rate Limit: ~{remaining} requests remaining (as of the last run)")
+                return True, f"Logged in as @{self.username}"
             
             # Test the token
-            response = self.session.get(f"{self.api_url}/user")
+            with self.spinner("Authenticating with GitHub API"):
+                response = self.session.get(f"{self.api_url}/user")
             
             if response.status_code == 200:
                 user_data = response.json()
                 self.username = user_data.get('login')
+                self.user_id = user_data.get('id')
                 
                 # Get rate limit info
                 rate_response = self.session.get(f"{self.api_url}/rate_limit")
                 if rate_response.status_code == 200:
                     rate_data = rate_response.json()
+                    self.rate_governor.update_from_rate_limit(rate_data)
+                    self.save_session_state()
                     core_limit = rate_data['resources']['core']['limit']
                     remaining = rate_data['resources']['core']['remaining']
                     
@@ -229,6 +1778,7 @@ class GitHubTool:
                     
                     return True, f"Logged in as @{self.username}"
                 else:
+                    self.save_session_state()
                     return True, f"Logged in as @{self.username} (rate limit check failed)"
             
             elif response.status_code == 401:
@@ -241,16 +1791,29 @@ class GitHubTool:
         except Exception as e:
             return False, f"Login error: {str(e)}"
     
+    def save_session_state(self):
+        """Persist the token's login and latest rate-limit state for the next run"""
+        if self.access_token and self.username:
+            self.session_state.save(self.access_token, self.username, self.user_id, self.rate_governor.snapshot())
+    
+    def forget_rejected_token(self, response, *args, **kwargs):
+        """Session response hook: a 401 means the saved login for this token can't be trusted any more"""
+        if response.status_code == 401 and self.access_token:
+            self.session_state.forget(self.access_token)
+            self.username = None
+            self.user_id = None
+            self.access_token = None
+    
+    @track_flow
     def login_with_credentials(self, username: str, password: str) -> Tuple[bool, str]:
         """Login with username and password (basic auth)"""
         try:
             self.print_header("GITHUB LOGIN")
             
-            self.animate_loading("Authenticating with GitHub")
-            
             # Try basic auth
             self.session.auth = (username, password)
-            response = self.session.get(f"{self.api_url}/user")
+            with self.spinner("Authenticating with GitHub"):
+                response = self.session.get(f"{self.api_url}/user")
             
             if response.status_code == 200:
                 user_data = response.json()
@@ -275,70 +1838,454 @@ class GitHubTool:
         except Exception as e:
             return False, f"Login error: {str(e)}"
     
+    def api_get(self, url: str, use_cache: bool = True):
+        """GET an API URL, revalidating against the ETag cache (304s don't count against the rate limit)"""
+        headers = self.response_cache.conditional_headers(url) if use_cache else {}
+        
+        response = None
+        for attempt in range(self.max_rate_limit_retries + 1):
+            # If the limit won't clear within max_wait, hand a 403 back to the caller without spending a request
+            if not self.rate_governor.wait():
+                if response is None:
+                    response = self.rate_governor.refusal(url)
+                break
+            
+            response = self.session.get(url, headers=headers)
+            
+            if not self.rate_governor.is_rate_limited(response):
+                break
+        
+        if use_cache:
+            response = self.response_cache.apply(url, response)
+        
+        return response
+    
+    def graphql(self, query: str, variables: Optional[Dict] = None) -> Optional[Dict]:
+        """Run a GraphQL query; returns None when GraphQL is unavailable so callers can fall back to REST"""
+        if not self.access_token:
+            return None  # GraphQL requires a token
+        
+        try:
+            response = None
+            for attempt in range(self.max_rate_limit_retries + 1):
+                if not self.rate_governor.wait('graphql'):
+                    if response is None:
+                        logger.warning("GraphQL request skipped: rate limited")
+                        return None
+                    break
+                
+                response = self.session.post(f"{self.api_url}/graphql", json={'query': query, 'variables': variables or {}})
+                
+                if not self.rate_governor.is_rate_limited(response):
+                    break
+            
+            if response.status_code != 200:
+                logger.warning(f"GraphQL request failed: HTTP {response.status_code}")
+                return None
+            
+            payload = response.json()
+            if payload.get('errors'):
+                logger.warning(f"GraphQL errors: {payload['errors']}")
+                return None
+            
+            return payload.get('data')
+            
+        except Exception as e:
+            logger.warning(f"GraphQL error: {e}")
+            return None
+    
+    def paginate(self, url: str, fields: Optional[Tuple[str, ...]] = ('id', 'login'), per_page: int = 100,
+                 progress: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Lazily yield items from a paginated REST endpoint, following Link: rel="next"
+        
+        Args:
+            url: First page URL (per_page is appended)
+            fields: Keys to keep from each item (None keeps the whole item)
+            per_page: Page size (100 is the API maximum)
+            progress: Label for "Loaded N ... so far" messages
+        
+        Raises:
+            GitHubAPIError: If a page request fails
+        """
+        separator = '&' if '?' in url else '?'
+        for items, _ in self.paginate_pages(f"{url}{separator}per_page={per_page}", fields, progress):
+            yield from items
+    
+    def paginate_pages(self, next_url: str, fields: Optional[Tuple[str, ...]] = ('id', 'login'),
+                       progress: Optional[str] = None) -> Iterator[Tuple[List[Dict], Optional[str]]]:
+        """
+        paginate() a page at a time: yields (items, URL of the next page or None after the last)
+        
+        Starting from a saved next-page URL resumes an interrupted walk.
+        
+        Raises:
+            GitHubAPIError: If a page request fails
+        """
+        count = 0
+        
+        while next_url:
+            try:
+                response = self.api_get(next_url)
+            except requests.RequestException as e:
+                raise GitHubAPIError(0, f"Network error: {e}")
+            
+            if response.status_code != 200:
+                raise GitHubAPIError(response.status_code, f"HTTP {response.status_code} for {next_url}")
+            
+            items = [{field: item.get(field) for field in fields} if fields else item for item in response.json()]
+            count += len(items)
+            
+            if progress:
+                self.print_info(f"Loaded {count} {progress} so far...")
+            
+            # Rate limit state comes from the response headers
+            self.warn_if_rate_limit_low()
+            
+            next_url = response.links.get('next', {}).get('url')
+            yield items, next_url
+    
+    def print_fetch_error(self, error: GitHubAPIError, what: str, username: str):
+        """Report a failed paginated fetch"""
+        if error.status_code == 403:
+            self.print_error(f"Rate limited while fetching {what}")
+        elif error.status_code == 404:
+            self.print_error(f"User @{username} not found")
+        elif error.status_code == 0:
+            self.print_error(f"Failed to fetch {what}: {error}")
+        else:
+            self.print_error(f"Failed to fetch {what}: HTTP {error.status_code}")
+    
+    def warn_if_rate_limit_low(self):
+        """Warn when the last seen core rate limit is running low"""
+        remaining = self.rate_governor.remaining()
+        if remaining is not None and remaining < self.rate_governor.low_watermark:
+            self.print_warning(f"Low API rate limit: {remaining} requests remaining")
+    
+    def estimate_followback_cost(self, counts: Dict, previous_followers: Optional[Dict],
+                                 previous_following: Optional[Dict]) -> Dict[str, int]:
+        """
+        Requests the follow lists will take: a page per 100 accounts, or per 100 new
+        accounts when a snapshot allows an incremental fetch (or per 100 not yet
+        fetched when an interrupted fetch left a checkpoint). GraphQL pages cost one
+        point each; the REST fallback spends the same number of core requests.
+        """
+        pages = 0
+        for connection, previous in (('followers', previous_followers), ('following', previous_following)):
+            total = counts.get(connection) or 0
+            if FollowSnapshotStore.mergeable(previous):
+                total -= len(previous['users'])
+            else:
+                total -= self.snapshot_store.checkpoint_size(self.username, connection)
+            pages += max(1, -(-total // 100))
+        
+        return {'graphql' if self.access_token else 'core': pages}
+    
+    def estimate_user_costs(self, usernames: List[str]) -> List[Dict[str, int]]:
+        """
+        Requests get_user_info() takes for each user: the profile plus a page per
+        100 repositories. public_repos comes from this session's results or the
+        profile history; accounts never seen before are assumed to fit on one page.
+        """
+        known = self.profile_history.public_repos(username for username in usernames
+                                                  if username.lower() not in self.user_info_cache)
+        costs = []
+        for username in usernames:
+            cached = self.user_info_cache.get(username.lower())
+            public_repos = cached['public_repos'] if cached else known.get(username.lower())
+            pages = max(1, -(-public_repos // 100)) if public_repos else 1
+            costs.append({'core': 1, 'graphql': pages} if self.access_token else {'core': 1 + pages})
+        return costs
+    
+    @staticmethod
+    def total_cost(costs: Iterable[Dict[str, int]]) -> Dict[str, int]:
+        """Sum of per-resource request estimates"""
+        total = {}
+        for cost in costs:
+            for resource, count in cost.items():
+                total[resource] = total.get(resource, 0) + count
+        return total
+    
+    def plan_budget(self, what: str, estimate: Dict[str, int], units: int = 1,
+                    unit_costs: Optional[List[Dict[str, int]]] = None) -> int:
+        """
+        Check an estimated cost against the remaining rate limit before starting a flow
+        
+        Args:
+            what: Description of the work, for messages
+            estimate: Expected requests per rate-limit resource
+            units: Independent pieces of work the estimate covers (users in a batch);
+                   more than one lets the work be split
+            unit_costs: Each unit's own estimate, when they differ; a split then takes
+                        the longest run of units from the start that fits
+        
+        Returns:
+            How many units to run now: all of them, the affordable part, or 0 to defer
+        """
+        if any(self.rate_governor.remaining(resource) is None for resource in estimate):
+            self.get_rate_limits()  # Free, and gives the budget for every resource
+        
+        missing = self.rate_governor.shortfall(estimate)
+        if not missing:
+            return units
+        
+        affordable = units if unit_costs is None else self.affordable_units(unit_costs)
+        resets = []
+        for resource, cost in estimate.items():
+            remaining = self.rate_governor.remaining(resource)
+            if remaining is not None and cost and unit_costs is None:
+                affordable = min(affordable, remaining * units // cost)
+            if resource in missing:
+                reset_at = self.rate_governor.reset_at(resource)
+                resets.append(reset_at)
+                when = f", resets at {reset_at.strftime('%H:%M:%S')}" if reset_at else ""
+                self.print_warning(f"{what} needs ~{cost} {resource} requests but only {remaining} remain{when}")
+        
+        reset_at = max((r for r in resets if r), default=None)
+        options = []
+        if reset_at:
+            options.append(('wait', f"Wait until the limit resets at {reset_at.strftime('%H:%M:%S')}"))
+        if units > 1 and 0 < affordable < units:
+            options.append(('split', f"Run the first {affordable} of {units} now and save the rest for later"))
+        options.append(('run', "Run anyway (stops early if the quota runs out)"))
+        options.append(('fail', "Cancel"))
+        
+        if self.budget_policy == 'ask':
+            for number, (_, label) in enumerate(options, 1):
+                print(f"{Colors.BRIGHT_GREEN}[{number}]{Colors.RESET} {Colors.BRIGHT_WHITE}{label}{Colors.RESET}")
+            choice = self.get_input(f"Select option (1-{len(options)})")
+            policy = options[int(choice) - 1][0] if choice.isdigit() and 1 <= int(choice) <= len(options) else 'fail'
+        else:
+            policy = self.budget_policy if self.budget_policy in dict(options) else 'fail'
+        
+        if policy == 'wait':
+            self.wait_for_reset(reset_at)
+            return units
+        if policy == 'split':
+            return affordable
+        if policy == 'run':
+            return units
+        return 0
+    
+    def affordable_units(self, unit_costs: List[Dict[str, int]]) -> int:
+        """How many units from the start of unit_costs the remaining rate limit covers"""
+        budget = {resource: self.rate_governor.remaining(resource) for cost in unit_costs for resource in cost}
+        affordable = 0
+        for cost in unit_costs:
+            if any(budget[resource] is not None and count > budget[resource] for resource, count in cost.items()):
+                break
+            for resource, count in cost.items():
+                if budget[resource] is not None:
+                    budget[resource] -= count
+            affordable += 1
+        return affordable
+    
+    def confirm_wait_for_reset(self, reset_at: datetime) -> bool:
+        """Whether to sleep until the rate limit resets (asks in the menu, follows budget_policy otherwise)"""
+        if self.budget_policy == 'ask':
+            answer = self.get_input(f"Wait until the limit resets at {reset_at.strftime('%H:%M:%S')} and continue? (y/n)")
+            return answer.lower() == 'y'
+        return self.budget_policy == 'wait'
+    
+    def wait_for_reset(self, reset_at: datetime):
+        """Sleep until a rate-limit window resets, then refresh the known budget"""
+        with self.spinner(f"Waiting for the rate limit to reset at {reset_at.strftime('%H:%M:%S')}"):
+            time.sleep(max((reset_at - datetime.now()).total_seconds() + 1, 0))
+        self.get_rate_limits()
+    
+    def save_deferred_usernames(self, usernames: List[str]) -> str:
+        """Write usernames left over by a split batch to a file that can be fed back in later"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"github_users_deferred_{timestamp}.txt"
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.writelines(f"{username}\n" for username in usernames)
+        return filename
+    
+    @track_flow
     def verify_user_exists(self, username: str) -> bool:
         """Verify that a GitHub user exists"""
         try:
-            response = self.session.get(f"{self.api_url}/users/{username}")
+            response = self.api_get(f"{self.api_url}/users/{username}")
             return response.status_code == 200
         except:
             return False
     
-    def get_user_info(self, username: str) -> Optional[Dict]:
-        """Get detailed information about a GitHub user"""
+    def repo_from_graphql_node(self, node: Dict) -> Dict:
+        """Map a USER_REPOSITORIES_QUERY node to the REST repository fields aggregate_repo_stats() reads"""
+        return {
+            'name': node['name'],
+            'stargazers_count': node['stargazerCount'],
+            'forks_count': node['forkCount'],
+            'language': (node.get('primaryLanguage') or {}).get('name')
+        }
+    
+    def aggregate_repo_stats(self, repos: Iterable[Dict], totals: Optional[Dict] = None) -> Dict:
+        """
+        Compute star/fork/language aggregates in a single pass over a repository stream
+        
+        Passing an earlier result as `totals` folds more of the same stream into
+        it, so a stream that arrives a page at a time never has to be held whole.
+        """
+        repo_count = totals['repo_count'] if totals else 0
+        total_stars = totals['total_stars'] if totals else 0
+        total_forks = totals['total_forks'] if totals else 0
+        languages = dict(totals['languages']) if totals else {}
+        
+        for repo in repos:
+            repo_count += 1
+            total_stars += repo.get('stargazers_count') or 0
+            total_forks += repo.get('forks_count') or 0
+            
+            lang = repo.get('language')
+            if lang:
+                languages[lang] = languages.get(lang, 0) + 1
+        
+        # Sort languages by frequency
+        top_languages = sorted(languages.items(), key=lambda x: x[1], reverse=True)[:5]
+        
+        return {
+            'repo_count': repo_count,
+            'total_stars': total_stars,
+            'total_forks': total_forks,
+            'languages': languages,
+            'top_languages': top_languages,
+            'avg_repo_stars': total_stars / repo_count if repo_count else 0
+        }
+    
+    @track_flow
+    def get_user_info(self, username: str, refresh: bool = False) -> Optional[Dict]:
+        """Get detailed information about a GitHub user (cached for the session unless refresh=True)"""
+        if not refresh and username.lower() in self.user_info_cache:
+            return self.user_info_cache[username.lower()]
+        
         try:
-            self.animate_loading(f"Fetching info for @{username}")
-            
-            response = self.session.get(f"{self.api_url}/users/{username}")
-            
-            if response.status_code == 200:
-                user_data = response.json()
-                
-                # Get additional statistics
-                repos_response = self.session.get(user_data['repos_url'] + "?per_page=100")
-                repos_data = repos_response.json() if repos_response.status_code == 200 else []
-                
-                # Calculate statistics
-                total_stars = sum(repo.get('stargazers_count', 0) for repo in repos_data)
-                total_forks = sum(repo.get('forks_count', 0) for repo in repos_data)
-                languages = {}
-                
-                for repo in repos_data:
-                    lang = repo.get('language')
-                    if lang:
-                        languages[lang] = languages.get(lang, 0) + 1
-                
-                # Sort languages by frequency
-                top_languages = sorted(languages.items(), key=lambda x: x[1], reverse=True)[:5]
-                
-                return {
-                    'username': user_data.get('login'),
-                    'name': user_data.get('name'),
-                    'bio': user_data.get('bio'),
-                    'company': user_data.get('company'),
-                    'location': user_data.get('location'),
-                    'email': user_data.get('email'),
-                    'blog': user_data.get('blog'),
-                    'twitter': user_data.get('twitter_username'),
-                    'followers': user_data.get('followers', 0),
-                    'following': user_data.get('following', 0),
-                    'public_repos': user_data.get('public_repos', 0),
-                    'public_gists': user_data.get('public_gists', 0),
-                    'hireable': user_data.get('hireable', False),
-                    'created_at': user_data.get('created_at'),
-                    'updated_at': user_data.get('updated_at'),
-                    'avatar_url': user_data.get('avatar_url'),
-                    'total_stars': total_stars,
-                    'total_forks': total_forks,
-                    'top_languages': top_languages,
-                    'avg_repo_stars': total_stars / len(repos_data) if repos_data else 0
-                }
-            else:
-                return None
-                
+            with self.spinner(f"Fetching info for @{username}"):
+                return asyncio.run(AsyncReader(self).user_info(username, refresh))
         except Exception as e:
             logger.error(f"Error getting user info: {e}")
             return None
     
+    def user_info_from_profile(self, user_data: Dict, repo_stats: Dict) -> Dict:
+        """Combine a /users/{username} payload with aggregate_repo_stats() into the get_user_info() fields"""
+        return {
+            'username': user_data.get('login'),
+            'name': user_data.get('name'),
+            'bio': user_data.get('bio'),
+            'company': user_data.get('company'),
+            'location': user_data.get('location'),
+            'email': user_data.get('email'),
+            'blog': user_data.get('blog'),
+            'twitter': user_data.get('twitter_username'),
+            'followers': user_data.get('followers', 0),
+            'following': user_data.get('following', 0),
+            'public_repos': user_data.get('public_repos', 0),
+            'public_gists': user_data.get('public_gists', 0),
+            'hireable': user_data.get('hireable', False),
+            'created_at': user_data.get('created_at'),
+            'updated_at': user_data.get('updated_at'),
+            'avatar_url': user_data.get('avatar_url'),
+            'total_stars': repo_stats['total_stars'],
+            'total_forks': repo_stats['total_forks'],
+            'top_languages': repo_stats['top_languages'],
+            'avg_repo_stars': repo_stats['avg_repo_stars']
+        }
+    
+    def read_usernames_file(self, path: str) -> List[str]:
+        """Read usernames from a file (one per line, '#' comments and '@' prefixes allowed)"""
+        usernames = []
+        seen = set()
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                username = line.split('#', 1)[0].strip().lstrip('@')
+                if username and username.lower() not in seen:
+                    seen.add(username.lower())
+                    usernames.append(username)
+        
+        return usernames
+    
+    @track_flow
+    def analyze_users_batch(self, usernames: List[str], stream, workers: int = 4) -> Dict:
+        """
+        Profile analytics for many users, written to a stream as JSON lines
+        
+        Up to `workers` requests are in flight at once on the async reader; every
+        request still goes through the shared rate-limit governor, so the
+        concurrency can't outrun the API budget.
+        """
+        results = {
+            'successful': 0,
+            'failed': 0,
+            'total': len(usernames),
+            'deferred': []
+        }
+        
+        costs = self.estimate_user_costs(usernames)
+        count = self.plan_budget(f"Analyzing {len(usernames)} users", self.total_cost(costs), units=len(usernames),
+                                 unit_costs=costs)
+        usernames, results['deferred'] = usernames[:count], usernames[count:]
+        if not usernames:
+            return results
+        
+        async def analyze(spinner: Spinner):
+            reader = AsyncReader(self, concurrency=max(1, workers))
+            done = 0
+            async for username, user_info in reader.users_info(usernames):
+                if user_info:
+                    record = user_info
+                    results['successful'] += 1
+                else:
+                    record = {'username': username, 'error': 'not found or unavailable'}
+                    results['failed'] += 1
+                
+                done += 1
+                stream.write(json.dumps(record, default=str) + '\n')
+                stream.flush()
+                spinner.update(f"Analyzed {done}/{len(usernames)} users")
+        
+        with self.spinner(f"Analyzing {len(usernames)} users") as spinner:
+            asyncio.run(analyze(spinner))
+        
+        return results
+    
+    def handle_batch_analysis(self):
+        """Interactive batch analytics: usernames from a file, results to a JSON lines file"""
+        path = self.get_input("File with usernames (one per line): ")
+        try:
+            usernames = self.read_usernames_file(path)
+        except OSError as e:
+            self.print_error(f"Could not read {path}: {e}")
+            return
+        
+        if not usernames:
+            self.print_error("No usernames found in file!")
+            return
+        
+        try:
+            workers = int(self.get_input("Parallel requests (1-8, recommended 4): ") or "4")
+        except ValueError:
+            workers = 4
+        workers = min(max(workers, 1), 8)
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"github_user_analytics_{timestamp}.jsonl"
+        
+        with open(filename, 'w', encoding='utf-8') as f:
+            results = self.analyze_users_batch(usernames, f, workers)
+        
+        self.print_success(f"Analyzed {results['successful']}/{results['total']} users")
+        if results['failed']:
+            self.print_warning(f"{results['failed']} users could not be analyzed (see 'error' entries)")
+        self.print_success(f"Results saved to: {filename}")
+        if results['deferred']:
+            deferred_file = self.save_deferred_usernames(results['deferred'])
+            self.print_info(f"{len(results['deferred'])} users left for later: {deferred_file}")
+    
+    def rate_limited_message(self) -> str:
+        """Failure message for a write refused by (or held back for) a rate limit"""
+        return f"Rate limited! Try again in {int(self.rate_governor.wait_time()) // 60 + 1} minutes ⏳"
+    
+    @track_flow
     def follow_user(self, target_username: str) -> Tuple[bool, str]:
         """Follow a user on GitHub"""
         try:
@@ -356,6 +2303,10 @@ class GitHubTool:
             # Add random delay to mimic human behavior
             time.sleep(random.uniform(1, 3))
             
+            # Writes are what trip secondary limits: don't send one that is known to fail
+            if not self.rate_governor.wait():
+                return False, self.rate_limited_message()
+            
             response = self.session.put(follow_url)
             
             if response.status_code == 204:
@@ -370,17 +2321,9 @@ class GitHubTool:
                 return False, f"User @{target_username} not found ❌"
             
             elif response.status_code == 403:
-                # Check rate limits
-                rate_response = self.session.get(f"{self.api_url}/rate_limit")
-                if rate_response.status_code == 200:
-                    rate_data = rate_response.json()
-                    remaining = rate_data['resources']['core']['remaining']
-                    reset_time = rate_data['resources']['core']['reset']
-                    
-                    if remaining == 0:
-                        reset_datetime = datetime.fromtimestamp(reset_time)
-                        wait_time = reset_datetime - datetime.now()
-                        return False, f"Rate limited! Try again in {wait_time.seconds // 60} minutes ⏳"
+                # Rate limit state was recorded from this response's headers
+                if self.rate_governor.is_rate_limited(response):
+                    return False, self.rate_limited_message()
                 
                 return False, "Forbidden - Check your token permissions 🔐"
             
@@ -394,6 +2337,7 @@ class GitHubTool:
             logger.error(f"Follow error: {e}")
             return False, f"Follow error: {str(e)}"
     
+    @track_flow
     def unfollow_user(self, target_username: str) -> Tuple[bool, str]:
         """Unfollow a user on GitHub"""
         try:
@@ -406,6 +2350,10 @@ class GitHubTool:
             
             time.sleep(random.uniform(1, 3))
             
+            # Writes are what trip secondary limits: don't send one that is known to fail
+            if not self.rate_governor.wait():
+                return False, self.rate_limited_message()
+            
             response = self.session.delete(unfollow_url)
             
             if response.status_code == 204:
@@ -414,9 +2362,14 @@ class GitHubTool:
                 return True, f"Successfully unfollowed @{target_username}! 👋"
             
             elif response.status_code == 404:
-                return False, f"User @{target_username} not found ❌"
+                # Probably renamed since the following snapshot was taken: make the next check fetch it all again
+                self.snapshot_store.discard(self.username, 'following')
+                return False, f"User @{target_username} not found (renamed or deleted?) - the next followback check refetches your following list ❌"
             
             elif response.status_code == 403:
+                if self.rate_governor.is_rate_limited(response):
+                    return False, self.rate_limited_message()
+                
                 return False, "Forbidden - Check your token permissions 🔐"
             
             else:
@@ -426,6 +2379,7 @@ class GitHubTool:
             logger.error(f"Unfollow error: {e}")
             return False, f"Unfollow error: {str(e)}"
     
+    @track_flow
     def star_repository(self, repo_owner: str, repo_name: str) -> Tuple[bool, str]:
         """Star a repository on GitHub"""
         try:
@@ -458,6 +2412,7 @@ class GitHubTool:
             logger.error(f"Star error: {e}")
             return False, f"Star error: {str(e)}"
     
+    @track_flow
     def fork_repository(self, repo_owner: str, repo_name: str) -> Tuple[bool, str]:
         """Fork a repository on GitHub"""
         try:
@@ -499,120 +2454,137 @@ class GitHubTool:
             logger.error(f"Fork error: {e}")
             return False, f"Fork error: {str(e)}"
     
+    def get_top_contributors(self, repo_owner: str, repo_name: str, limit: int = 5) -> List[Dict]:
+        """Get the top contributors of a repository (REST only - GraphQL has no contributors field)"""
+        try:
+            response = self.api_get(f"{self.api_url}/repos/{repo_owner}/{repo_name}/contributors?per_page=10")
+            if response.status_code == 200:
+                return response.json()[:limit]
+        except Exception as e:
+            logger.error(f"Error getting contributors: {e}")
+        return []
+    
+    def repo_info_from_graphql(self, repo: Dict, contributors: List[Dict]) -> Dict:
+        """Map a GraphQL repository node onto the get_repository_info() fields"""
+        return {
+            'name': repo.get('name'),
+            'full_name': repo.get('nameWithOwner'),
+            'owner': (repo.get('owner') or {}).get('login'),
+            'description': repo.get('description'),
+            'language': (repo.get('primaryLanguage') or {}).get('name'),
+            'languages': {edge['node']['name']: edge['size'] for edge in repo['languages']['edges']},
+            'stars': repo.get('stargazerCount', 0),
+            'watchers': repo.get('stargazerCount', 0),  # REST watchers_count mirrors stargazers
+            'forks': repo.get('forkCount', 0),
+            'open_issues': repo['issues']['totalCount'] + repo['pullRequests']['totalCount'],  # REST counts PRs as issues
+            'license': (repo.get('licenseInfo') or {}).get('name'),
+            'created_at': repo.get('createdAt'),
+            'updated_at': repo.get('updatedAt'),
+            'pushed_at': repo.get('pushedAt'),
+            'homepage': repo.get('homepageUrl'),
+            'topics': [node['topic']['name'] for node in repo['repositoryTopics']['nodes']],
+            'contributors': contributors,
+            'size': repo.get('diskUsage') or 0,
+            'default_branch': (repo.get('defaultBranchRef') or {}).get('name'),
+            'archived': repo.get('isArchived', False),
+            'fork': repo.get('isFork', False)
+        }
+    
+    def repo_info_from_rest(self, repo_data: Dict, languages: Dict, contributors: List[Dict]) -> Dict:
+        """Map a REST repository payload onto the get_repository_info() fields"""
+        return {
+            'name': repo_data.get('name'),
+            'full_name': repo_data.get('full_name'),
+            'owner': repo_data.get('owner', {}).get('login'),
+            'description': repo_data.get('description'),
+            'language': repo_data.get('language'),
+            'languages': languages,
+            'stars': repo_data.get('stargazers_count', 0),
+            'watchers': repo_data.get('watchers_count', 0),
+            'forks': repo_data.get('forks_count', 0),
+            'open_issues': repo_data.get('open_issues_count', 0),
+            'license': (repo_data.get('license') or {}).get('name'),
+            'created_at': repo_data.get('created_at'),
+            'updated_at': repo_data.get('updated_at'),
+            'pushed_at': repo_data.get('pushed_at'),
+            'homepage': repo_data.get('homepage'),
+            'topics': repo_data.get('topics', []),
+            'contributors': contributors,
+            'size': repo_data.get('size', 0),
+            'default_branch': repo_data.get('default_branch'),
+            'archived': repo_data.get('archived', False),
+            'fork': repo_data.get('fork', False)
+        }
+    
+    @track_flow
     def get_repository_info(self, repo_owner: str, repo_name: str) -> Optional[Dict]:
         """Get detailed information about a repository"""
         try:
-            self.animate_loading(f"Fetching info for {repo_owner}/{repo_name}")
-            
-            repo_url = f"{self.api_url}/repos/{repo_owner}/{repo_name}"
-            response = self.session.get(repo_url)
-            
-            if response.status_code == 200:
-                repo_data = response.json()
-                
-                # Get additional data
-                languages_url = repo_data.get('languages_url')
-                contributors_url = repo_data.get('contributors_url')
-                
-                languages = {}
-                if languages_url:
-                    lang_response = self.session.get(languages_url)
-                    if lang_response.status_code == 200:
-                        languages = lang_response.json()
-                
-                contributors = []
-                if contributors_url:
-                    contrib_response = self.session.get(contributors_url + "?per_page=10")
-                    if contrib_response.status_code == 200:
-                        contributors = contrib_response.json()[:5]  
-                
-                return {
-                    'name': repo_data.get('name'),
-                    'full_name': repo_data.get('full_name'),
-                    'owner': repo_data.get('owner', {}).get('login'),
-                    'description': repo_data.get('description'),
-                    'language': repo_data.get('language'),
-                    'languages': languages,
-                    'stars': repo_data.get('stargazers_count', 0),
-                    'watchers': repo_data.get('watchers_count', 0),
-                    'forks': repo_data.get('forks_count', 0),
-                    'open_issues': repo_data.get('open_issues_count', 0),
-                    'license': repo_data.get('license', {}).get('name'),
-                    'created_at': repo_data.get('created_at'),
-                    'updated_at': repo_data.get('updated_at'),
-                    'pushed_at': repo_data.get('pushed_at'),
-                    'homepage': repo_data.get('homepage'),
-                    'topics': repo_data.get('topics', []),
-                    'contributors': contributors,
-                    'size': repo_data.get('size', 0),
-                    'default_branch': repo_data.get('default_branch'),
-                    'archived': repo_data.get('archived', False),
-                    'fork': repo_data.get('fork', False)
-                }
-            else:
-                return None
-                
+            with self.spinner(f"Fetching info for {repo_owner}/{repo_name}"):
+                return asyncio.run(AsyncReader(self).repository_info(repo_owner, repo_name))
         except Exception as e:
             logger.error(f"Error getting repo info: {e}")
             return None
     
+    @track_flow
+    def scan_repositories(self, owner: str, contributors: bool = False) -> Optional[List[Dict]]:
+        """get_repository_info() for every repository of a user or organization (read-only)"""
+        try:
+            with self.spinner(f"Scanning repositories of {owner}"):
+                return asyncio.run(AsyncReader(self).owner_repositories(owner, contributors))
+        except GitHubAPIError as e:
+            self.print_fetch_error(e, "repositories", owner)
+        except Exception as e:
+            logger.error(f"Error scanning repositories: {e}")
+        return None
+    
+    def summarize_repositories(self, repos: List[Dict], stale_days: int = 365) -> Dict:
+        """Totals across a repository scan: language bytes, archived and stale repositories, license coverage"""
+        languages = {}
+        licenses = {}
+        archived = []
+        stale = []
+        today = datetime.now()
+        
+        for repo in repos:
+            for language, size in repo['languages'].items():
+                languages[language] = languages.get(language, 0) + size
+            
+            license_name = repo.get('license') or 'None'
+            licenses[license_name] = licenses.get(license_name, 0) + 1
+            
+            if repo.get('archived'):
+                archived.append(repo['name'])
+            elif repo.get('pushed_at'):
+                idle_days = (today - datetime.strptime(repo['pushed_at'][:10], "%Y-%m-%d")).days
+                if idle_days > stale_days:
+                    stale.append({'name': repo['name'], 'pushed_at': repo['pushed_at'][:10], 'idle_days': idle_days})
+        
+        total_bytes = sum(languages.values())
+        licensed = len(repos) - licenses.get('None', 0)
+        
+        return {
+            'repositories': len(repos),
+            'forks': sum(1 for repo in repos if repo.get('fork')),
+            'stars': sum(repo.get('stars', 0) for repo in repos),
+            'open_issues': sum(repo.get('open_issues', 0) for repo in repos),
+            'languages': {language: {'bytes': size, 'percent': round(size / total_bytes * 100, 1)}
+                          for language, size in sorted(languages.items(), key=itemgetter(1), reverse=True)},
+            'archived': sorted(archived),
+            'stale_days': stale_days,
+            'stale': sorted(stale, key=itemgetter('idle_days'), reverse=True),
+            'licenses': dict(sorted(licenses.items(), key=itemgetter(1), reverse=True)),
+            'license_coverage': round(licensed / len(repos) * 100, 1) if repos else 0.0
+        }
+    
     # NEW FUNCTIONALITY: Seed User Follower Extractor
+    @track_flow
     def get_followers_for_user(self, username: str, max_followers: int = 1000) -> List[str]:
         """Get all followers of a specific user"""
-        try:
-            self.print_info(f"Fetching followers for @{username}...")
-            followers = []
-            page = 1
-            per_page = 100  # Max per page
-            
-            while True:
-                url = f"{self.api_url}/users/{username}/followers?page={page}&per_page={per_page}"
-                response = self.session.get(url)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if not data:
-                        break
-                    
-                    for user in data:
-                        followers.append(user['login'])
-                    
-                    self.print_info(f"Loaded {len(followers)} followers for @{username}...")
-                    
-                    # Check rate limit
-                    rate_response = self.session.get(f"{self.api_url}/rate_limit")
-                    if rate_response.status_code == 200:
-                        rate_data = rate_response.json()
-                        remaining = rate_data['resources']['core']['remaining']
-                        if remaining < 50:
-                            self.print_warning(f"Low API rate limit: {remaining} requests remaining")
-                    
-                    page += 1
-                    
-                    # Add small delay to avoid rate limiting
-                    time.sleep(0.5)
-                    
-                    # Safety limit
-                    if len(followers) >= max_followers:
-                        self.print_warning(f"Reached safety limit of {max_followers} followers for @{username}")
-                        break
-                    
-                elif response.status_code == 403:
-                    self.print_error("Rate limited while fetching followers")
-                    break
-                elif response.status_code == 404:
-                    self.print_error(f"User @{username} not found")
-                    break
-                else:
-                    self.print_error(f"Failed to fetch followers: HTTP {response.status_code}")
-                    break
-            
-            return followers
-            
-        except Exception as e:
-            self.print_error(f"Error getting followers for @{username}: {str(e)}")
-            return []
+        self.print_info(f"Fetching followers for @{username}...")
+        return self.collect_follow_logins(username, 'followers', max_followers)
     
+    @profile_flow
     def handle_seed_follower_extractor_flow(self):
         """Handle the seed user follower extraction flow"""
         if not self.username or not self.access_token:
@@ -676,6 +2648,7 @@ class GitHubTool:
         print(f"\n{Colors.BRIGHT_GREEN}[2/3]{Colors.RESET} {Colors.BRIGHT_WHITE}Extracting Followers{Colors.RESET}\n")
         
         all_followers = []
+        seen_followers = set()
         follower_sources = {}
         
         for i, seed_user in enumerate(seed_users, 1):
@@ -689,7 +2662,8 @@ class GitHubTool:
                 follower_sources[follower].append(seed_user)
             
             # Add to combined list (avoiding duplicates)
-            new_followers = [f for f in followers if f not in all_followers]
+            new_followers = [f for f in followers if f not in seen_followers]
+            seen_followers.update(new_followers)
             all_followers.extend(new_followers)
             
             self.print_success(f"Found {len(followers)} followers for @{seed_user} ({len(new_followers)} new unique followers)")
@@ -737,7 +2711,8 @@ class GitHubTool:
             except ValueError:
                 self.print_error("Invalid number!")
         elif choice == '3':
-            self.save_followers_to_file(all_followers, seed_users)
+            output_format, compression = self.ask_export_format('txt', text_report=True)
+            self.save_followers_to_file(all_followers, seed_users, output_format, compression)
         elif choice == '4':
             self.print_info("Exiting without following.")
         else:
@@ -756,10 +2731,10 @@ class GitHubTool:
     def display_follower_extraction_results(self, seed_users: List[str], all_followers: List[str], follower_sources: Dict):
         """Display the follower extraction results"""
         print(f"{Colors.BRIGHT_GREEN}┌────────────────────────────────────────────────────────────┐{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.BRIGHT_CYAN}            Follower Extraction Results              {Colors.BRIGHT_GREEN}{Colors.RESET}")
+        print(self.box_row(f"{Colors.BRIGHT_CYAN}            Follower Extraction Results"))
         print(f"{Colors.BRIGHT_GREEN}├────────────────────────────────────────────────────────────┤{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_WHITE}Seed Users:{Colors.RESET} {len(seed_users):>2}{Colors.BRIGHT_GREEN}{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_WHITE}Unique Followers Found:{Colors.RESET} {len(all_followers):>2}{Colors.BRIGHT_GREEN}{Colors.RESET}")
+        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_WHITE}Seed Users:{Colors.RESET} {len(seed_users):>2}"))
+        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_WHITE}Unique Followers Found:{Colors.RESET} {len(all_followers):>2}"))
         print(f"{Colors.BRIGHT_GREEN}└────────────────────────────────────────────────────────────┘{Colors.RESET}")
         
         # Show seed user breakdown
@@ -866,43 +2841,53 @@ class GitHubTool:
         self.print_header("FOLLOWING EXTRACTED FOLLOWERS")
         print(f"{Colors.BRIGHT_CYAN}📋 Following {len(usernames)} users with {min_delay}-{max_delay}s delay{Colors.RESET}\n")
         
-        for i, username in enumerate(usernames, 1):
-            print(f"\n{Colors.BRIGHT_CYAN}[{i}/{len(usernames)}]{Colors.RESET} Processing @{username}")
-            
-            success, message = self.follow_user(username)
-            
-            if success:
-                self.print_success(f"Followed @{username}")
-                results['successful'].append({
-                    'username': username,
-                    'message': message
-                })
-            else:
-                self.print_error(f"Failed to follow @{username}: {message}")
-                results['failed'].append({
+        report_name = ExportWriter.filename('github_follow_results', 'csv')
+        with ExportWriter(report_name, ['username', 'status', 'message', 'time']) as report:
+            for i, username in enumerate(usernames, 1):
+                print(f"\n{Colors.BRIGHT_CYAN}[{i}/{len(usernames)}]{Colors.RESET} Processing @{username}")
+                
+                success, message = self.follow_user(username)
+                
+                if success:
+                    self.print_success(f"Followed @{username}")
+                    results['successful'].append({
+                        'username': username,
+                        'message': message
+                    })
+                else:
+                    self.print_error(f"Failed to follow @{username}: {message}")
+                    results['failed'].append({
+                        'username': username,
+                        'message': message
+                    })
+                
+                # Each outcome is on disk as soon as it happens, even if the run is interrupted
+                report.write({
                     'username': username,
-                    'message': message
+                    'status': 'followed' if success else 'failed',
+                    'message': message,
+                    'time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                 })
-            
-            # Add random delay between follows (except after the last one)
-            if i < len(usernames):
-                delay = random.randint(min_delay, max_delay)
-                print(f"{Colors.DIM}Waiting {delay} seconds before next follow...{Colors.RESET}")
-                for sec in range(delay, 0, -1):
-                    sys.stdout.write(f"\r{Colors.DIM}Next follow in {sec} seconds...{' ' * 10}{Colors.RESET}")
-                    sys.stdout.flush()
-                    time.sleep(1)
-                sys.stdout.write('\r' + ' ' * 40 + '\r')
+                
+                # Add random delay between follows (except after the last one)
+                if i < len(usernames):
+                    delay = random.randint(min_delay, max_delay)
+                    print(f"{Colors.DIM}Waiting {delay} seconds before next follow...{Colors.RESET}")
+                    for sec in range(delay, 0, -1):
+                        sys.stdout.write(f"\r{Colors.DIM}Next follow in {sec} seconds...{' ' * 10}{Colors.RESET}")
+                        sys.stdout.flush()
+                        time.sleep(1)
+                    sys.stdout.write('\r' + ' ' * 40 + '\r')
         
         # Display results
         self.print_header("FOLLOW RESULTS")
         
         print(f"{Colors.BRIGHT_GREEN}┌────────────────────────────────────────────────────────────┐{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.BRIGHT_CYAN}                    Results Summary                     {Colors.BRIGHT_GREEN}{Colors.RESET}")
+        print(self.box_row(f"{Colors.BRIGHT_CYAN}                    Results Summary"))
         print(f"{Colors.BRIGHT_GREEN}├────────────────────────────────────────────────────────────┤{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_GREEN}✅ Successful:{Colors.RESET} {len(results['successful']):>3}/{results['total']:<45}{Colors.BRIGHT_GREEN}{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_RED}❌ Failed:{Colors.RESET}     {len(results['failed']):>3}/{results['total']:<45}{Colors.BRIGHT_GREEN}{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_CYAN}📊 Success Rate:{Colors.RESET} {(len(results['successful'])/results['total']*100):>6.1f}%{Colors.BRIGHT_GREEN}{Colors.RESET}")
+        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_GREEN}✅ Successful:{Colors.RESET} {len(results['successful']):>3}/{results['total']}"))
+        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_RED}❌ Failed:{Colors.RESET}     {len(results['failed']):>3}/{results['total']}"))
+        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_CYAN}📊 Success Rate:{Colors.RESET} {(len(results['successful'])/results['total']*100):>6.1f}%"))
         print(f"{Colors.BRIGHT_GREEN}└────────────────────────────────────────────────────────────┘{Colors.RESET}")
         
         if results['failed']:
@@ -910,169 +2895,324 @@ class GitHubTool:
             for fail in results['failed'][:10]:
                 print(f"  {Colors.DIM}@{fail['username']}: {fail['message']}{Colors.RESET}")
         
-        # Save results to file
+        self.print_success(f"Results saved to: {report_name}")
+    
+    def save_followers_to_file(self, followers: Iterable[str], seed_users: List[str],
+                               output_format: str = 'txt', compression: Optional[str] = None):
+        """Save extracted followers to a file, writing each one as it arrives"""
+        if output_format != 'txt':
+            rows = ({'position': position, 'login': login} for position, login in enumerate(followers, 1))
+            self.export_rows('github_followers', rows, ['position', 'login'], output_format, compression,
+                             types={'position': 'int64'})
+            return
+        
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"github_follow_results_{timestamp}.txt"
+        filename = f"github_followers_{timestamp}.txt"
+        count = 0
         
         with open(filename, 'w') as f:
-            f.write(f"GitHub Follow Results - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total attempted: {results['total']}\n")
-            f.write(f"Successful: {len(results['successful'])}\n")
-            f.write(f"Failed: {len(results['failed'])}\n")
-            f.write(f"Success rate: {(len(results['successful'])/results['total']*100):.1f}%\n\n")
+            f.write(f"GitHub Followers Extracted - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write(f"Seed Users: {', '.join([f'@{user}' for user in seed_users])}\n\n")
             
-            f.write("Successful follows:\n")
-            for success in results['successful']:
-                f.write(f"@{success['username']}\n")
+            f.write("Extracted Followers:\n")
+            for count, follower in enumerate(followers, 1):
+                f.write(f"{count}. @{follower}\n")
             
-            f.write("\nFailed follows:\n")
-            for fail in results['failed']:
-                f.write(f"@{fail['username']}: {fail['message']}\n")
+            f.write(f"\nTotal unique followers: {count}\n")
         
-        self.print_success(f"Results saved to: {filename}")
-    
-    def save_followers_to_file(self, followers: List[str], seed_users: List[str]):
-        """Save extracted followers to a file"""
-        if not followers:
+        if count == 0:
+            os.remove(filename)
             self.print_error("No followers to save!")
             return
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"github_followers_{timestamp}.txt"
+        self.print_success(f"Saved {count} followers to: {filename}")
+    
+    def export_rows(self, prefix: str, rows: Iterable[Dict], fields: List[str], output_format: str,
+                    compression: Optional[str] = None, types: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """Stream rows into a new timestamped export file; returns its name (None on failure)"""
+        filename = ExportWriter.filename(prefix, output_format, compression)
+        try:
+            with ExportWriter(filename, fields, output_format, compression, types=types) as writer:
+                count = writer.write_rows(rows)
+        except (ValueError, ImportError, OSError) as e:
+            self.print_error(f"Export failed: {e}")
+            return None
+        
+        self.print_success(f"Saved {count} rows to: {filename}")
+        return filename
+    
+    def ask_export_format(self, default: str = 'csv', text_report: bool = False) -> Tuple[str, Optional[str]]:
+        """
+        Ask for an export format such as csv, jsonl.gz or parquet, until the answer is one the caller supports
         
-        with open(filename, 'w') as f:
-            f.write(f"GitHub Followers Extracted - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Seed Users: {', '.join([f'@{user}' for user in seed_users])}\n")
-            f.write(f"Total unique followers: {len(followers)}\n\n")
+        Args:
+            default: Used when the answer is empty
+            text_report: Also offer 'txt', the caller's own uncompressed report
+        """
+        formats = (['txt'] if text_report else []) + list(ExportWriter.FORMATS)
+        while True:
+            answer = self.get_input(f"Format ({'/'.join(formats)}, add .gz or .zst to compress) [{default}]")
+            output_format, compression = ExportWriter.parse_format(answer.strip().lower() or default)
             
-            f.write("Extracted Followers:\n")
-            for i, follower in enumerate(followers, 1):
-                f.write(f"{i}. @{follower}\n")
-        
-        self.print_success(f"Saved {len(followers)} followers to: {filename}")
+            if output_format not in formats:
+                self.print_error(f"Unknown format '{output_format}' (use {', '.join(formats)})")
+            elif output_format == 'txt' and compression:
+                self.print_error("The txt report can't be compressed; choose csv or jsonl to compress")
+            else:
+                return output_format, compression
     
     # Followback 
     
-    def get_all_followers(self) -> List[str]:
-        """Get all followers of the logged-in user"""
+    def collect_follow_logins(self, username: str, connection: str, limit: int) -> List[str]:
+        """Collect a user's followers/following logins over REST, up to a safety limit"""
+        logins = []
         try:
-            if not self.username or not self.access_token:
-                self.print_error("Please login first!")
-                return []
-            
-            self.print_info("Fetching your followers...")
-            followers = []
-            page = 1
-            per_page = 100  # Max per page
-            
-            while True:
-                url = f"{self.api_url}/users/{self.username}/followers?page={page}&per_page={per_page}"
-                response = self.session.get(url)
+            url = f"{self.api_url}/users/{username}/{connection}"
+            for user in self.paginate(url, progress=f"{connection} for @{username}"):
+                logins.append(user['login'])
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    if not data:
-                        break
-                    
-                    for user in data:
-                        followers.append(user['login'])
-                    
-                    self.print_info(f"Loaded {len(followers)} followers so far...")
-                    
-                    # Check rate limit
-                    rate_response = self.session.get(f"{self.api_url}/rate_limit")
-                    if rate_response.status_code == 200:
-                        rate_data = rate_response.json()
-                        remaining = rate_data['resources']['core']['remaining']
-                        if remaining < 50:
-                            self.print_warning(f"Low API rate limit: {remaining} requests remaining")
-                    
-                    page += 1
-                    
-                    # Add small delay to avoid rate limiting
-                    time.sleep(0.5)
-                    
-                    # Safety limit: max 2000 followers
-                    if len(followers) >= 2000:
-                        self.print_warning("Reached safety limit of 2000 followers")
-                        break
-                    
-                elif response.status_code == 403:
-                    self.print_error("Rate limited while fetching followers")
+                if len(logins) >= limit:
+                    self.print_warning(f"Reached safety limit of {limit} {connection} for @{username}")
                     break
-                elif response.status_code == 404:
-                    self.print_error("User not found")
-                    break
-                else:
-                    self.print_error(f"Failed to fetch followers: HTTP {response.status_code}")
-                    break
-            
-            return followers
             
+        except GitHubAPIError as e:
+            self.print_fetch_error(e, connection, username)
         except Exception as e:
-            self.print_error(f"Error getting followers: {str(e)}")
-            return []
+            self.print_error(f"Error getting {connection} for @{username}: {str(e)}")
+        
+        return logins
     
-    def get_all_following(self) -> List[str]:
-        """Get all users that the logged-in user is following"""
-        try:
-            if not self.username or not self.access_token:
-                self.print_error("Please login first!")
-                return []
+    def iter_follow_connection_graphql(self, connection: str) -> Iterator[Tuple[int, str]]:
+        """
+        Lazily yield followers/following of the logged-in user via GraphQL as (id, login) pairs
+        
+        Raises:
+            GitHubAPIError: If GraphQL is unavailable
+        """
+        for users, _ in self.iter_follow_pages_graphql(connection):
+            yield from users
+    
+    def iter_follow_pages_graphql(self, connection: str,
+                                  cursor: Optional[str] = None) -> Iterator[Tuple[List[Tuple[int, str]], Optional[str]]]:
+        """
+        Followers/following via GraphQL a page at a time: (users, cursor of the next page or None after the last)
+        
+        Raises:
+            GitHubAPIError: If GraphQL is unavailable
+        """
+        count = 0
+        
+        while True:
+            data = self.graphql(FOLLOW_CONNECTION_QUERY % connection, {'login': self.username, 'cursor': cursor})
+            if not data or not data.get('user'):
+                raise GitHubAPIError(0, "GraphQL unavailable")
             
-            self.print_info("Fetching users you're following...")
-            following = []
-            page = 1
-            per_page = 100  # Max per page
+            page = data['user'][connection]
+            users = [(node['databaseId'], node['login']) for node in page['nodes'] if node]
+            count += len(users)
             
-            while True:
-                url = f"{self.api_url}/users/{self.username}/following?page={page}&per_page={per_page}"
-                response = self.session.get(url)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if not data:
-                        break
-                    
-                    for user in data:
-                        following.append(user['login'])
-                    
-                    self.print_info(f"Loaded {len(following)} following so far...")
-                    
-                    # Check rate limit
-                    rate_response = self.session.get(f"{self.api_url}/rate_limit")
-                    if rate_response.status_code == 200:
-                        rate_data = rate_response.json()
-                        remaining = rate_data['resources']['core']['remaining']
-                        if remaining < 50:
-                            self.print_warning(f"Low API rate limit: {remaining} requests remaining")
-                    
-                    page += 1
-                    
-                    # Add small delay to avoid rate limiting
-                    time.sleep(0.5)
-                    
-                    # Safety limit: max 2000 following
-                    if len(following) >= 2000:
-                        self.print_warning("Reached safety limit of 2000 following")
-                        break
+            self.print_info(f"Loaded {count}/{page['totalCount']} {connection} so far...")
+            
+            cursor = page['pageInfo']['endCursor'] if page['pageInfo']['hasNextPage'] else None
+            yield users, cursor
+            if cursor is None:
+                return
+    
+    def fetch_follow_list(self, connection: str) -> List[Tuple[int, str]]:
+        """
+        The logged-in user's complete followers/following as (id, login) pairs, checkpointed per page
+        
+        Every page is saved to the snapshot database with the cursor of the next
+        one, so a fetch cut short by the rate limit or the network continues from
+        the last good page on the next call instead of starting over.
+        
+        Raises:
+            GitHubAPIError: If a page fails (the pages before it stay checkpointed)
+        """
+        checkpoint = self.snapshot_store.checkpoint(self.username, connection)
+        if checkpoint:
+            users, source, cursor = checkpoint['users'], checkpoint['source'], checkpoint['cursor']
+            self.print_info(f"Resuming {connection} from a checkpoint ({len(users)} loaded at "
+                            f"{datetime.fromtimestamp(checkpoint['updated_at']).strftime('%H:%M:%S')})")
+        else:
+            users, source, cursor = [], 'graphql', None
+        seen = {user_id for user_id, _ in users}
+        rest_url = f"{self.api_url}/users/{self.username}/{connection}?per_page=100"
+        must_overlap = False  # The first REST page after a switch has to repeat an account we already have
+        
+        while True:
+            if source == 'graphql':
+                pages = self.iter_follow_pages_graphql(connection, cursor)
+            else:
+                pages = (([(user['id'], user['login']) for user in items], next_url)
+                         for items, next_url in self.paginate_pages(cursor or rest_url, progress=connection))
+            
+            shifted = False
+            try:
+                for page, cursor in pages:
+                    if must_overlap:
+                        must_overlap = False
+                        if page and not any(user_id in seen for user_id, _ in page):
+                            shifted = True
+                            break
                     
-                elif response.status_code == 403:
-                    self.print_error("Rate limited while fetching following")
-                    break
-                elif response.status_code == 404:
-                    self.print_error("User not found")
-                    break
-                else:
-                    self.print_error(f"Failed to fetch following: HTTP {response.status_code}")
+                    # Followers and following then share one string per login
+                    new_users = [(user_id, sys.intern(login)) for user_id, login in page if user_id not in seen]
+                    seen.update(user_id for user_id, _ in new_users)
+                    self.snapshot_store.extend_checkpoint(self.username, connection, source, cursor, new_users, len(users))
+                    users.extend(new_users)
+            except GitHubAPIError:
+                if source != 'graphql':
+                    raise
+                # No GraphQL: continue over REST. Both APIs list newest first, so skip the REST pages
+                # GraphQL already covered, less one in case the list shifted (repeats are dropped by ID)
+                if users:
+                    self.print_warning(f"GraphQL stopped after {len(users)} {connection}, continuing over REST")
+                source, cursor = 'rest', rest_url
+                if len(users) >= 200:
+                    cursor, must_overlap = f"{rest_url}&page={len(users) // 100}", True
+                continue
+            
+            if shifted:
+                # Over a page of accounts left since GraphQL stopped, so the page boundary is off: rescan from page 1
+                self.print_warning(f"{connection.capitalize()} list changed during the fetch, rescanning it over REST")
+                cursor = rest_url
+                continue
+            
+            self.snapshot_store.clear_checkpoint(self.username, connection)
+            return users
+    
+    def iter_follow_users(self, connection: str) -> Iterator[Tuple[int, str]]:
+        """Stream followers/following as (id, login), GraphQL first (no entry cap) with REST as the fallback"""
+        seen = set()
+        try:
+            for user_id, login in self.iter_follow_connection_graphql(connection):
+                seen.add(user_id)
+                yield user_id, sys.intern(login)  # Followers and following then share one string per login
+            return
+        except GitHubAPIError:
+            if seen:
+                self.print_warning(f"GraphQL stopped after {len(seen)} {connection}, continuing over REST")
+        
+        for user in self.paginate(f"{self.api_url}/users/{self.username}/{connection}", progress=connection):
+            if user['id'] not in seen:
+                yield user['id'], sys.intern(user['login'])
+    
+    def load_follow_list(self, connection: str, previous: Optional[Dict],
+                         expected_total: Optional[int]) -> List[Tuple[int, str]]:
+        """
+        Load followers/following as (id, login) pairs, reusing the last snapshot when possible
+        
+        Only the entries newer than the last snapshot are fetched. The result is
+        trusted only if it adds up to the live count from the profile (otherwise
+        someone in the older part of the list left, and we refetch everything).
+        Entries kept from the snapshot keep its logins, so snapshots older than
+        INCREMENTAL_MAX_AGE are not merged into: the full refetch picks up renames.
+        
+        Raises:
+            GitHubAPIError: If a page fails (a full refetch resumes from its checkpoint next time)
+        """
+        if previous and previous['users'] and not FollowSnapshotStore.mergeable(previous):
+            self.print_info(f"Snapshot of {connection} from {previous['taken_at']} is over a day old, refetching")
+        elif previous and previous['users'] and expected_total is not None:
+            known = {user_id for user_id, _ in previous['users']}
+            new_users = []
+            
+            # Newest entries come first, so stop paginating at the first one we already know
+            for user in self.iter_follow_users(connection):
+                if user[0] in known:
                     break
+                new_users.append(user)
             
-            return following
+            new_ids = {user_id for user_id, _ in new_users}
+            merged = new_users + [user for user in previous['users'] if user[0] not in new_ids]
             
-        except Exception as e:
-            self.print_error(f"Error getting following: {str(e)}")
-            return []
+            if len(merged) == expected_total:
+                self.print_info(f"Incremental update: {len(new_users)} new {connection} since {previous['taken_at']}")
+                self.snapshot_store.save(self.username, connection, merged)
+                return merged
+            
+            self.print_info(f"Snapshot out of date ({len(merged)} vs {expected_total} {connection}), refetching")
+        
+        users = self.fetch_follow_list(connection)
+        
+        # Only complete lists become snapshots
+        if users and len(users) == expected_total:
+            self.snapshot_store.save(self.username, connection, users)
+        
+        return users
+    
+    def load_follow_list_resuming(self, connection: str, previous: Optional[Dict],
+                                  expected_total: Optional[int], message: str) -> List[Tuple[int, str]]:
+        """load_follow_list(), offering to wait out an exhausted rate limit and continue from the checkpoint"""
+        while True:
+            try:
+                with self.spinner(message):
+                    return self.load_follow_list(connection, previous, expected_total)
+            except GitHubAPIError as e:
+                self.print_fetch_error(e, connection, self.username)
+                
+                reset_at = self.rate_governor.reset_at() if e.status_code in (403, 429) else None
+                if reset_at and self.confirm_wait_for_reset(reset_at):
+                    self.wait_for_reset(reset_at)
+                    continue
+                
+                progress = self.snapshot_store.checkpoint_size(self.username, connection)
+                if progress:
+                    self.print_info(f"{progress} {connection} are checkpointed - run the analysis again to continue from there")
+                return []
+    
+    def diff_follow_snapshots(self, previous_followers: Optional[Dict], previous_following: Optional[Dict],
+                              followers: List[Tuple[int, str]], following: List[Tuple[int, str]]) -> Optional[Dict]:
+        """Compare this run against the previous snapshots (by user ID, so renames aren't churn)"""
+        if not previous_followers or not previous_following:
+            return None
+        
+        old_followers = dict(previous_followers['users'])
+        old_mutual = old_followers.keys() & {user_id for user_id, _ in previous_following['users']}
+        current_followers = dict(followers)
+        mutual = current_followers.keys() & {user_id for user_id, _ in following}
+        
+        old_logins = dict(previous_following['users'])
+        old_logins.update(old_followers)
+        current_logins = dict(following)
+        current_logins.update(current_followers)
+        
+        return {
+            'since': previous_followers['taken_at'],
+            'new_followers': sorted(current_followers[i] for i in current_followers.keys() - old_followers.keys()),
+            'lost_followers': sorted(old_followers[i] for i in old_followers.keys() - current_followers.keys()),
+            'new_mutuals': sorted(current_followers[i] for i in mutual - old_mutual),
+            'renamed': sorted(f"{old_logins[i]} → @{current_logins[i]}"
+                              for i in old_logins.keys() & current_logins.keys() if old_logins[i] != current_logins[i])
+        }
+    
+    @render_once
+    def display_followback_changes(self, changes: Optional[Dict]):
+        """Display what changed since the last followback snapshot"""
+        if not changes:
+            self.print_info("No previous snapshot yet - changes will be shown from the next run.")
+            return
+        
+        print(f"\n{Colors.BRIGHT_CYAN}{'─' * 60}{Colors.RESET}")
+        print(f"{Colors.BRIGHT_MAGENTA}{Colors.BOLD}🕒 CHANGES SINCE {changes['since']}{Colors.RESET}")
+        print(f"{Colors.BRIGHT_CYAN}{'─' * 60}{Colors.RESET}")
+        
+        sections = [
+            ('New followers', changes['new_followers'], Colors.BRIGHT_GREEN),
+            ('Lost followers', changes['lost_followers'], Colors.BRIGHT_RED),
+            ('New mutuals', changes['new_mutuals'], Colors.BRIGHT_BLUE),
+            ('Renamed', changes.get('renamed', []), Colors.BRIGHT_YELLOW),
+        ]
+        
+        for title, usernames, color in sections:
+            print(f"{color}{title}: {len(usernames)}{Colors.RESET}")
+            for username in usernames[:10]:
+                print(f"  {Colors.DIM}@{username}{Colors.RESET}")
+            if len(usernames) > 10:
+                print(f"  {Colors.DIM}... and {len(usernames) - 10} more{Colors.RESET}")
     
+    @track_flow
     def check_follow_back_status(self) -> Tuple[List[str], List[str], List[str]]:
         """
         Check which users don't follow back
@@ -1087,36 +3227,41 @@ class GitHubTool:
             self.print_header("FOLLOWBACK ANALYSIS")
             
             # Get followers and following
-            self.animate_loading("Loading your followers list", 2)
-            followers = self.get_all_followers()
+            # Current counts tell us whether an incremental fetch is complete
+            profile_response = self.api_get(f"{self.api_url}/users/{self.username}")
+            counts = profile_response.json() if profile_response.status_code == 200 else {}
             
-            self.animate_loading("Loading users you follow", 2)
-            following = self.get_all_following()
+            previous_followers = self.snapshot_store.latest(self.username, 'followers')
+            previous_following = self.snapshot_store.latest(self.username, 'following')
             
-            if not followers or not following:
+            estimate = self.estimate_followback_cost(counts, previous_followers, previous_following)
+            if not self.plan_budget("The followback analysis", estimate):
+                self.print_error("Followback analysis deferred: not enough API quota left")
+                return [], [], []
+            
+            followers = self.load_follow_list_resuming('followers', previous_followers, counts.get('followers'),
+                                                       "Loading your followers list")
+            if not followers:
                 self.print_error("Could not fetch follow data")
                 return [], [], []
             
-            # Convert to sets for faster operations
-            followers_set = set(followers)
-            following_set = set(following)
+            following = self.load_follow_list_resuming('following', previous_following, counts.get('following'),
+                                                       "Loading users you follow")
             
-            # Calculate different categories
-            mutual_followers = list(followers_set.intersection(following_set))
-            not_following_back = list(following_set - followers_set)  # You follow them, they don't follow back
-            fans = list(followers_set - following_set)  # They follow you, you don't follow back
+            if not followers or not following:
+                self.print_error("Could not fetch follow data")
+                return [], [], []
             
-            # Sort alphabetically for better display
-            mutual_followers.sort()
-            not_following_back.sort()
-            fans.sort()
+            self.followback_changes = self.diff_follow_snapshots(previous_followers, previous_following, followers, following)
             
-            return mutual_followers, not_following_back, fans
+            # Mutual / you follow them but not back / they follow you but not back, already alphabetical
+            return FollowGraph(followers, following).partition()
             
         except Exception as e:
             self.print_error(f"Error in followback check: {str(e)}")
             return [], [], []
     
+    @render_once
     def display_followback_analysis(self, mutual: List[str], not_following_back: List[str], fans: List[str]):
         """Display the followback analysis in a beautiful format"""
         
@@ -1126,13 +3271,13 @@ class GitHubTool:
         
         # Summary statistics
         print(f"\n{Colors.BRIGHT_GREEN}┌────────────────────────────────────────────────────────────┐{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.BRIGHT_CYAN}                    Summary Statistics                    {Colors.BRIGHT_GREEN}{Colors.RESET}")
+        print(self.box_row(f"{Colors.BRIGHT_CYAN}                    Summary Statistics"))
         print(f"{Colors.BRIGHT_GREEN}├────────────────────────────────────────────────────────────┤{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_WHITE}Your Followers:{Colors.RESET} {len(mutual) + len(fans):>4}{Colors.BRIGHT_GREEN}{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_WHITE}You're Following:{Colors.RESET} {len(mutual) + len(not_following_back):>3}{Colors.BRIGHT_GREEN}{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_WHITE}Mutual Followers:{Colors.RESET} {len(mutual):>3}{Colors.BRIGHT_GREEN}{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_WHITE}Don't Follow Back:{Colors.RESET} {len(not_following_back):>3}{Colors.BRIGHT_GREEN}{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_WHITE}Fans (You don't follow back):{Colors.RESET} {len(fans):>3}{Colors.BRIGHT_GREEN}{Colors.RESET}")
+        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_WHITE}Your Followers:{Colors.RESET} {len(mutual) + len(fans):>4}"))
+        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_WHITE}You're Following:{Colors.RESET} {len(mutual) + len(not_following_back):>3}"))
+        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_WHITE}Mutual Followers:{Colors.RESET} {len(mutual):>3}"))
+        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_WHITE}Don't Follow Back:{Colors.RESET} {len(not_following_back):>3}"))
+        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_WHITE}Fans (You don't follow back):{Colors.RESET} {len(fans):>3}"))
         print(f"{Colors.BRIGHT_GREEN}└────────────────────────────────────────────────────────────┘{Colors.RESET}")
         
         # Display users who don't follow back
@@ -1235,6 +3380,7 @@ class GitHubTool:
         
         return results
     
+    @profile_flow
     def handle_followback_cleaner_flow(self):
         """Handle the followback checking and cleaning flow"""
         if not self.username or not self.access_token:
@@ -1260,6 +3406,12 @@ class GitHubTool:
                 
                 if not_following_back or mutual or fans:
                     self.display_followback_analysis(mutual, not_following_back, fans)
+                    self.display_followback_changes(self.followback_changes)
+                    
+                    if self.get_input("\nExport the full lists to a file? (y/N)").lower() == 'y':
+                        output_format, compression = self.ask_export_format('csv')
+                        self.export_rows('github_followback', followback_rows(mutual, not_following_back, fans),
+                                         ['login', 'category'], output_format, compression)
                     
                     if not_following_back:
                         print(f"\n{Colors.BRIGHT_YELLOW}Found {len(not_following_back)} users who don't follow you back!{Colors.RESET}")
@@ -1355,10 +3507,10 @@ class GitHubTool:
                     self.print_header("UNFOLLOW RESULTS")
                     
                     print(f"{Colors.BRIGHT_GREEN}┌────────────────────────────────────────────────────────────┐{Colors.RESET}")
-                    print(f"{Colors.BRIGHT_GREEN}│{Colors.BRIGHT_CYAN}                    Results Summary                     {Colors.BRIGHT_GREEN}{Colors.RESET}")
+                    print(self.box_row(f"{Colors.BRIGHT_CYAN}                    Results Summary"))
                     print(f"{Colors.BRIGHT_GREEN}├────────────────────────────────────────────────────────────┤{Colors.RESET}")
-                    print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_GREEN}✅ Successful:{Colors.RESET} {len(results['successful']):>3}/{results['total']:<45}{Colors.BRIGHT_GREEN}{Colors.RESET}")
-                    print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_RED}❌ Failed:{Colors.RESET}     {len(results['failed']):>3}/{results['total']:<45}{Colors.BRIGHT_GREEN}{Colors.RESET}")
+                    print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_GREEN}✅ Successful:{Colors.RESET} {len(results['successful']):>3}/{results['total']}"))
+                    print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_RED}❌ Failed:{Colors.RESET}     {len(results['failed']):>3}/{results['total']}"))
                     print(f"{Colors.BRIGHT_GREEN}└────────────────────────────────────────────────────────────┘{Colors.RESET}")
                     
                     if results['failed']:
@@ -1385,6 +3537,7 @@ class GitHubTool:
             self.clear_screen()
             self.print_banner()
     
+    @render_once
     def display_user_statistics(self, user_info: Dict):
         """Display user statistics in a beautiful format"""
         if not user_info:
@@ -1395,20 +3548,20 @@ class GitHubTool:
         
         # Profile section
         print(f"{Colors.BRIGHT_GREEN}┌────────────────────────────────────────────────────────────┐{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.BRIGHT_MAGENTA}{Colors.BOLD}👤 PROFILE INFORMATION{Colors.RESET:<41}{Colors.BRIGHT_GREEN}{Colors.RESET}")
+        print(self.box_row(f"{Colors.BRIGHT_MAGENTA}{Colors.BOLD}👤 PROFILE INFORMATION{Colors.RESET}"))
         print(f"{Colors.BRIGHT_GREEN}├────────────────────────────────────────────────────────────┤{Colors.RESET}")
         
         username_display = f"@{user_info.get('username', 'N/A')}"
         if user_info.get('name'):
             username_display += f" • {user_info.get('name')}"
         
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_CYAN}GitHub:{Colors.RESET} {Colors.BRIGHT_WHITE}{username_display:<48}{Colors.RESET}{Colors.BRIGHT_GREEN}{Colors.RESET}")
+        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_CYAN}GitHub:{Colors.RESET} {Colors.BRIGHT_WHITE}{username_display}{Colors.RESET}"))
         
         if user_info.get('company'):
-            print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_CYAN}Company:{Colors.RESET} {Colors.BRIGHT_YELLOW}{user_info.get('company', 'N/A'):<48}{Colors.RESET}{Colors.BRIGHT_GREEN}{Colors.RESET}")
+            print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_CYAN}Company:{Colors.RESET} {Colors.BRIGHT_YELLOW}{user_info.get('company', 'N/A')}{Colors.RESET}"))
         
         if user_info.get('location'):
-            print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_CYAN}Location:{Colors.RESET} {Colors.BRIGHT_YELLOW}{user_info.get('location', 'N/A'):<48}{Colors.RESET}{Colors.BRIGHT_GREEN}{Colors.RESET}")
+            print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_CYAN}Location:{Colors.RESET} {Colors.BRIGHT_YELLOW}{user_info.get('location', 'N/A')}{Colors.RESET}"))
         
         print(f"{Colors.BRIGHT_GREEN}└────────────────────────────────────────────────────────────┘{Colors.RESET}")
         
@@ -1433,6 +3586,13 @@ class GitHubTool:
         print(f"{Colors.BRIGHT_GREEN}{' ' * 10}{Colors.BRIGHT_YELLOW}[+]{Colors.RESET} {Colors.BRIGHT_MAGENTA}⭐ Total Stars:{Colors.RESET} {Colors.BRIGHT_WHITE}{stars:,}{Colors.RESET}")
         print(f"{Colors.BRIGHT_GREEN}{' ' * 10}{Colors.BRIGHT_YELLOW}[+]{Colors.RESET} {Colors.BRIGHT_MAGENTA}🍴 Total Forks:{Colors.RESET} {Colors.BRIGHT_WHITE}{forks:,}{Colors.RESET}")
         
+        # Changes since the previous distinct observation in the profile history (no API call)
+        history = self.profile_history.latest(user_info.get('username') or '', 2)
+        if len(history) == 2:
+            changes = self.format_metric_changes(history[1], user_info)
+            if changes:
+                print(f"{Colors.BRIGHT_GREEN}{' ' * 10}{Colors.BRIGHT_YELLOW}[+]{Colors.RESET} {Colors.BRIGHT_MAGENTA}📈 Since {history[1]['last_seen'][:10]}:{Colors.RESET} {changes}")
+        
         print(f"{Colors.BRIGHT_GREEN}{' ' * 10}{Colors.BRIGHT_WHITE}{'─' * 40}{Colors.RESET}")
         
         # Top languages
@@ -1510,6 +3670,7 @@ class GitHubTool:
         
         print(f"{Colors.BRIGHT_GREEN}{' ' * 10}{Colors.BRIGHT_WHITE}{'─' * 40}{Colors.RESET}")
     
+    @render_once
     def display_repository_statistics(self, repo_info: Dict):
         """Display repository statistics in a beautiful format"""
         if not repo_info:
@@ -1520,17 +3681,17 @@ class GitHubTool:
         
         # Repo info section
         print(f"{Colors.BRIGHT_GREEN}┌────────────────────────────────────────────────────────────┐{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.BRIGHT_MAGENTA}{Colors.BOLD}📦 REPOSITORY INFORMATION{Colors.RESET:<39}{Colors.BRIGHT_GREEN}{Colors.RESET}")
+        print(self.box_row(f"{Colors.BRIGHT_MAGENTA}{Colors.BOLD}📦 REPOSITORY INFORMATION{Colors.RESET}"))
         print(f"{Colors.BRIGHT_GREEN}├────────────────────────────────────────────────────────────┤{Colors.RESET}")
         
         repo_display = f"{repo_info.get('owner', 'N/A')}/{repo_info.get('name', 'N/A')}"
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_CYAN}Repository:{Colors.RESET} {Colors.BRIGHT_WHITE}{repo_display:<48}{Colors.RESET}{Colors.BRIGHT_GREEN}{Colors.RESET}")
+        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_CYAN}Repository:{Colors.RESET} {Colors.BRIGHT_WHITE}{repo_display}{Colors.RESET}"))
         
         if repo_info.get('description'):
             desc = repo_info['description']
-            if len(desc) > 50:
-                desc = desc[:47] + "..."
-            print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_CYAN}Description:{Colors.RESET} {Colors.BRIGHT_YELLOW}{desc:<48}{Colors.RESET}{Colors.BRIGHT_GREEN}{Colors.RESET}")
+            if len(desc) > 45:
+                desc = desc[:42] + "..."
+            print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_CYAN}Description:{Colors.RESET} {Colors.BRIGHT_YELLOW}{desc}{Colors.RESET}"))
         
         print(f"{Colors.BRIGHT_GREEN}└────────────────────────────────────────────────────────────┘{Colors.RESET}")
         
@@ -1619,6 +3780,76 @@ class GitHubTool:
         
         print(f"{Colors.BRIGHT_GREEN}{' ' * 10}{Colors.BRIGHT_WHITE}{'─' * 40}{Colors.RESET}")
     
+    @render_once
+    def display_repository_scan(self, owner: str, summary: Dict):
+        """Display the aggregated results of scan_repositories()"""
+        self.print_header(f"REPOSITORY SCAN: {owner}")
+        
+        print(f"{Colors.BRIGHT_GREEN}{' ' * 10}{Colors.BRIGHT_WHITE}{'─' * 40}{Colors.RESET}")
+        print(f"{Colors.BRIGHT_GREEN}{' ' * 10}{Colors.BRIGHT_YELLOW}[+]{Colors.RESET} {Colors.BRIGHT_MAGENTA}📦 Repositories:{Colors.RESET} {Colors.BRIGHT_WHITE}{summary['repositories']:,} ({summary['forks']:,} forks){Colors.RESET}")
+        print(f"{Colors.BRIGHT_GREEN}{' ' * 10}{Colors.BRIGHT_YELLOW}[+]{Colors.RESET} {Colors.BRIGHT_MAGENTA}⭐ Stars:{Colors.RESET} {Colors.BRIGHT_WHITE}{summary['stars']:,}{Colors.RESET}")
+        print(f"{Colors.BRIGHT_GREEN}{' ' * 10}{Colors.BRIGHT_YELLOW}[+]{Colors.RESET} {Colors.BRIGHT_MAGENTA}📂 Open Issues:{Colors.RESET} {Colors.BRIGHT_WHITE}{summary['open_issues']:,}{Colors.RESET}")
+        print(f"{Colors.BRIGHT_GREEN}{' ' * 10}{Colors.BRIGHT_YELLOW}[+]{Colors.RESET} {Colors.BRIGHT_MAGENTA}📜 License Coverage:{Colors.RESET} {Colors.BRIGHT_WHITE}{summary['license_coverage']:.1f}%{Colors.RESET}")
+        print(f"{Colors.BRIGHT_GREEN}{' ' * 10}{Colors.BRIGHT_WHITE}{'─' * 40}{Colors.RESET}")
+        
+        sections = [
+            ("💻 LANGUAGE BYTES", [f"{language:<15} {stats['bytes']:>14,}  {stats['percent']:5.1f}%"
+                                  for language, stats in summary['languages'].items()]),
+            ("📜 LICENSES", [f"{name:<30} {count:>5}" for name, count in summary['licenses'].items()]),
+            ("📦 ARCHIVED", summary['archived']),
+            (f"🕒 STALE (no push in {summary['stale_days']} days)",
+             [f"{repo['name']:<30} last push {repo['pushed_at']}" for repo in summary['stale']]),
+        ]
+        
+        for title, lines in sections:
+            print(f"\n{Colors.BRIGHT_CYAN}{'─' * 60}{Colors.RESET}")
+            print(f"{Colors.BRIGHT_MAGENTA}{Colors.BOLD}{title}: {len(lines)}{Colors.RESET}")
+            print(f"{Colors.BRIGHT_CYAN}{'─' * 60}{Colors.RESET}")
+            for line in lines[:15]:
+                print(f"  {Colors.BRIGHT_WHITE}{line}{Colors.RESET}")
+            if len(lines) > 15:
+                print(f"  {Colors.DIM}... and {len(lines) - 15} more{Colors.RESET}")
+    
+    def format_metric_changes(self, before: Dict, after: Dict) -> str:
+        """Coloured '+3 followers · -1 stars' for the profile metrics that differ ('' if none do)"""
+        labels = [('followers', 'followers'), ('following', 'following'), ('public_repos', 'repos'),
+                  ('total_stars', 'stars'), ('total_forks', 'forks')]
+        changes = []
+        for name, label in labels:
+            delta = (after.get(name) or 0) - (before.get(name) or 0)
+            if delta:
+                color = Colors.BRIGHT_GREEN if delta > 0 else Colors.BRIGHT_RED
+                changes.append(f"{color}{delta:+,} {label}{Colors.RESET}")
+        return ' · '.join(changes)
+    
+    @render_once
+    def display_profile_history(self, login: str, entries: List[Dict], period: str):
+        """Display ProfileHistoryStore.trend() rows: one line per day/week with changes from the one before"""
+        self.print_header(f"PROFILE HISTORY: @{login} (by {period})")
+        
+        if not entries:
+            self.print_info("No history yet - analyze the account first")
+            return
+        
+        columns = [('followers', 'Followers'), ('following', 'Following'), ('public_repos', 'Repos'),
+                   ('total_stars', 'Stars'), ('total_forks', 'Forks')]
+        print(f"  {Colors.BRIGHT_CYAN}{'Period':<12}" + ''.join(f"{title:>16}" for _, title in columns) + Colors.RESET)
+        print(f"  {Colors.BRIGHT_WHITE}{'─' * 92}{Colors.RESET}")
+        
+        for entry in entries:
+            cells = []
+            for name, _ in columns:
+                delta = entry[f"{name}_delta"]
+                text = f"{entry[name]:,}" + (f" ({delta:+,})" if delta else '')
+                color = Colors.BRIGHT_GREEN if delta and delta > 0 else Colors.BRIGHT_RED if delta else Colors.BRIGHT_WHITE
+                cells.append(f"{color}{text:>16}{Colors.RESET}")
+            print(f"  {Colors.BRIGHT_YELLOW}{entry['period']:<12}{Colors.RESET}" + ''.join(cells))
+        
+        first, last = entries[0], entries[-1]
+        changes = self.format_metric_changes(first, last) if len(entries) > 1 else ''
+        print(f"\n  {Colors.BRIGHT_MAGENTA}📈 {first['period']} → {last['period']}:{Colors.RESET} {changes or 'no change'}")
+        print(f"  {Colors.DIM}From local history (last checked {last['last_seen']}); no API requests made{Colors.RESET}")
+    
     def wrap_text(self, text: str, width: int) -> List[str]:
         """Wrap text to specified width"""
         words = text.split()
@@ -1722,8 +3953,9 @@ class GitHubTool:
         
         return results
     
-    def get_input(self, prompt: str, color: str = Colors.BRIGHT_CYAN, password: bool = False) -> str:
+    def get_input(self, prompt: str, color: Optional[str] = None, password: bool = False) -> str:
         """Get user input with styling"""
+        color = color or Colors.BRIGHT_CYAN
         if password:
             import getpass
             user_input = getpass.getpass(f"{color}{prompt}{Colors.BRIGHT_YELLOW}➜ {Colors.RESET}")
@@ -1731,6 +3963,7 @@ class GitHubTool:
             user_input = input(f"{color}{prompt}{Colors.BRIGHT_YELLOW}➜ {Colors.RESET}").strip()
         return user_input
     
+    @profile_flow
     def handle_login_flow(self):
         """Handle the login flow"""
         print(f"\n{Colors.BRIGHT_CYAN}{'─' * 50}{Colors.RESET}")
@@ -1773,6 +4006,7 @@ class GitHubTool:
         else:
             self.print_error("Invalid option! Please choose 1-3.")
     
+    @profile_flow
     def handle_follow_flow(self):
         """Handle the follow user flow"""
         if not self.username or not self.access_token:
@@ -1871,10 +4105,10 @@ class GitHubTool:
                         
                         self.print_header("BULK FOLLOW RESULTS")
                         print(f"{Colors.BRIGHT_GREEN}┌────────────────────────────────────────────────────────────┐{Colors.RESET}")
-                        print(f"{Colors.BRIGHT_GREEN}│{Colors.BRIGHT_CYAN}                    Results Summary                     {Colors.BRIGHT_GREEN}{Colors.RESET}")
+                        print(self.box_row(f"{Colors.BRIGHT_CYAN}                    Results Summary"))
                         print(f"{Colors.BRIGHT_GREEN}├────────────────────────────────────────────────────────────┤{Colors.RESET}")
-                        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_GREEN}✅ Successful:{Colors.RESET} {len(results['successful']):>3}/{results['total']:<45}{Colors.BRIGHT_GREEN}{Colors.RESET}")
-                        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_RED}❌ Failed:{Colors.RESET}     {len(results['failed']):>3}/{results['total']:<45}{Colors.BRIGHT_GREEN}{Colors.RESET}")
+                        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_GREEN}✅ Successful:{Colors.RESET} {len(results['successful']):>3}/{results['total']}"))
+                        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_RED}❌ Failed:{Colors.RESET}     {len(results['failed']):>3}/{results['total']}"))
                         print(f"{Colors.BRIGHT_GREEN}└────────────────────────────────────────────────────────────┘{Colors.RESET}")
             
             elif choice == '3':
@@ -1911,6 +4145,7 @@ class GitHubTool:
             self.clear_screen()
             self.print_banner()
     
+    @profile_flow
     def handle_repo_flow(self):
         """Handle repository operations"""
         if not self.username or not self.access_token:
@@ -1928,9 +4163,10 @@ class GitHubTool:
             print(f"{Colors.BRIGHT_GREEN}[2]{Colors.RESET} {Colors.BRIGHT_WHITE}Star a repository{Colors.RESET}")
             print(f"{Colors.BRIGHT_GREEN}[3]{Colors.RESET} {Colors.BRIGHT_WHITE}Star multiple repositories{Colors.RESET}")
             print(f"{Colors.BRIGHT_GREEN}[4]{Colors.RESET} {Colors.BRIGHT_WHITE}Fork a repository{Colors.RESET}")
-            print(f"{Colors.BRIGHT_GREEN}[5]{Colors.RESET} {Colors.BRIGHT_WHITE}Back to main menu{Colors.RESET}")
+            print(f"{Colors.BRIGHT_GREEN}[5]{Colors.RESET} {Colors.BRIGHT_WHITE}Scan all repositories of an organization/user{Colors.RESET}")
+            print(f"{Colors.BRIGHT_GREEN}[6]{Colors.RESET} {Colors.BRIGHT_WHITE}Back to main menu{Colors.RESET}")
             
-            choice = self.get_input("\nSelect option (1-5)")
+            choice = self.get_input("\nSelect option (1-6)")
             
             if choice == '1':
                 repo_input = self.get_input("Enter repository (owner/repo): ")
@@ -2026,10 +4262,10 @@ class GitHubTool:
                         
                         self.print_header("BULK STAR RESULTS")
                         print(f"{Colors.BRIGHT_GREEN}┌────────────────────────────────────────────────────────────┐{Colors.RESET}")
-                        print(f"{Colors.BRIGHT_GREEN}│{Colors.BRIGHT_CYAN}                    Results Summary                     {Colors.BRIGHT_GREEN}{Colors.RESET}")
+                        print(self.box_row(f"{Colors.BRIGHT_CYAN}                    Results Summary"))
                         print(f"{Colors.BRIGHT_GREEN}├────────────────────────────────────────────────────────────┤{Colors.RESET}")
-                        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_GREEN}✅ Successful:{Colors.RESET} {len(results['successful']):>3}/{results['total']:<45}{Colors.BRIGHT_GREEN}{Colors.RESET}")
-                        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_RED}❌ Failed:{Colors.RESET}     {len(results['failed']):>3}/{results['total']:<45}{Colors.BRIGHT_GREEN}{Colors.RESET}")
+                        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_GREEN}✅ Successful:{Colors.RESET} {len(results['successful']):>3}/{results['total']}"))
+                        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_RED}❌ Failed:{Colors.RESET}     {len(results['failed']):>3}/{results['total']}"))
                         print(f"{Colors.BRIGHT_GREEN}└────────────────────────────────────────────────────────────┘{Colors.RESET}")
             
             elif choice == '4':
@@ -2045,15 +4281,33 @@ class GitHubTool:
                     self.print_error("Please use format: owner/repository")
             
             elif choice == '5':
+                owner = self.get_input("Organization or user: ").strip().lstrip('@')
+                if owner:
+                    with_contributors = self.get_input("Include top contributors? (one extra request per repository) (y/N)").lower() == 'y'
+                    repos = self.scan_repositories(owner, with_contributors)
+                    
+                    if repos:
+                        self.display_repository_scan(owner, self.summarize_repositories(repos))
+                        if self.get_input("\nExport one row per repository to a file? (y/N)").lower() == 'y':
+                            output_format, compression = self.ask_export_format('csv')
+                            self.export_rows(f"github_repos_{owner}", repos, REPO_SCAN_FIELDS, output_format, compression,
+                                             types=REPO_SCAN_TYPES)
+                    elif repos is not None:
+                        self.print_warning(f"{owner} has no repositories")
+                    else:
+                        self.print_error("Failed to scan repositories")
+            
+            elif choice == '6':
                 break
             
             else:
-                self.print_error("Invalid option! Please choose 1-5.")
+                self.print_error("Invalid option! Please choose 1-6.")
             
             input(f"\n{Colors.BRIGHT_WHITE}Press Enter to continue...{Colors.RESET}")
             self.clear_screen()
             self.print_banner()
     
+    @profile_flow
     def handle_user_analysis_flow(self):
         """Handle user analysis flow"""
         self.print_header("USER ANALYSIS")
@@ -2065,9 +4319,11 @@ class GitHubTool:
             
             print(f"{Colors.BRIGHT_GREEN}[1]{Colors.RESET} {Colors.BRIGHT_WHITE}Analyze your own account{Colors.RESET}")
             print(f"{Colors.BRIGHT_GREEN}[2]{Colors.RESET} {Colors.BRIGHT_WHITE}Analyze another user{Colors.RESET}")
-            print(f"{Colors.BRIGHT_GREEN}[3]{Colors.RESET} {Colors.BRIGHT_WHITE}Back to main menu{Colors.RESET}")
+            print(f"{Colors.BRIGHT_GREEN}[3]{Colors.RESET} {Colors.BRIGHT_WHITE}Analyze users from a file (batch){Colors.RESET}")
+            print(f"{Colors.BRIGHT_GREEN}[4]{Colors.RESET} {Colors.BRIGHT_WHITE}Profile history and trends (no API calls){Colors.RESET}")
+            print(f"{Colors.BRIGHT_GREEN}[5]{Colors.RESET} {Colors.BRIGHT_WHITE}Back to main menu{Colors.RESET}")
             
-            choice = self.get_input("\nSelect option (1-3)")
+            choice = self.get_input("\nSelect option (1-5)")
             
             if choice == '1':
                 if self.username:
@@ -2082,25 +4338,33 @@ class GitHubTool:
             elif choice == '2':
                 target_username = self.get_input("Enter username to analyze (without @): ")
                 if target_username:
-                    if self.verify_user_exists(target_username):
-                        user_info = self.get_user_info(target_username)
-                        if user_info:
-                            self.display_user_statistics(user_info)
-                        else:
-                            self.print_error("Failed to get user information")
+                    # get_user_info already fetches /users/{username}, no separate existence check needed
+                    user_info = self.get_user_info(target_username)
+                    if user_info:
+                        self.display_user_statistics(user_info)
                     else:
-                        self.print_error(f"User @{target_username} not found")
+                        self.print_error(f"User @{target_username} not found or unavailable")
             
             elif choice == '3':
+                self.handle_batch_analysis()
+            
+            elif choice == '4':
+                login = self.get_input(f"Username (without @){f' [{self.username}]' if self.username else ''}: ") or self.username
+                if login:
+                    period = 'week' if self.get_input("Group by day or week? (d/w): ").lower().startswith('w') else 'day'
+                    self.display_profile_history(login, self.profile_history.trend(login, period), period)
+            
+            elif choice == '5':
                 break
             
             else:
-                self.print_error("Invalid option! Please choose 1-3.")
+                self.print_error("Invalid option! Please choose 1-5.")
             
             input(f"\n{Colors.BRIGHT_WHITE}Press Enter to continue...{Colors.RESET}")
             self.clear_screen()
             self.print_banner()
     
+    @render_once
     def print_menu(self):
         """Print the main menu"""
         self.print_header("GITHUB TOOL - MAIN MENU")
@@ -2109,36 +4373,48 @@ class GitHubTool:
         token_status = f"{Colors.BRIGHT_GREEN}✅ Token active{Colors.RESET}" if self.access_token else f"{Colors.BRIGHT_RED}❌ No token{Colors.RESET}"
         
         print(f"{Colors.BRIGHT_GREEN}┌────────────────────────────────────────────────────────────┐{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.BRIGHT_CYAN}                     Available Options                      {Colors.BRIGHT_GREEN}{Colors.RESET}")
+        print(self.box_row(f"{Colors.BRIGHT_CYAN}                     Available Options"))
         print(f"{Colors.BRIGHT_GREEN}├────────────────────────────────────────────────────────────┤{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_YELLOW}1.{Colors.RESET} {Colors.BRIGHT_WHITE}Login to GitHub Account{Colors.RESET}                          {Colors.BRIGHT_GREEN}{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_YELLOW}2.{Colors.RESET} {Colors.BRIGHT_WHITE}User Profile Analysis{Colors.RESET}                           {Colors.BRIGHT_GREEN}{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_YELLOW}3.{Colors.RESET} {Colors.BRIGHT_WHITE}Follow/Unfollow Users{Colors.RESET}                          {Colors.BRIGHT_GREEN}{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_YELLOW}4.{Colors.RESET} {Colors.BRIGHT_WHITE}Repository Operations{Colors.RESET}                          {Colors.BRIGHT_GREEN}{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_YELLOW}5.{Colors.RESET} {Colors.BRIGHT_WHITE}Followback Checker & Cleaner{Colors.RESET}                  {Colors.BRIGHT_GREEN}{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_YELLOW}6.{Colors.RESET} {Colors.BRIGHT_WHITE}Seed User Follower Extractor{Colors.RESET}                   {Colors.BRIGHT_GREEN}{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_YELLOW}7.{Colors.RESET} {Colors.BRIGHT_WHITE}Check Rate Limits{Colors.RESET}                              {Colors.BRIGHT_GREEN}{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_YELLOW}8.{Colors.RESET} {Colors.BRIGHT_WHITE}Exit Tool{Colors.RESET}                                      {Colors.BRIGHT_GREEN}{Colors.RESET}")
+        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_YELLOW}1.{Colors.RESET} {Colors.BRIGHT_WHITE}Login to GitHub Account{Colors.RESET}"))
+        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_YELLOW}2.{Colors.RESET} {Colors.BRIGHT_WHITE}User Profile Analysis{Colors.RESET}"))
+        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_YELLOW}3.{Colors.RESET} {Colors.BRIGHT_WHITE}Follow/Unfollow Users{Colors.RESET}"))
+        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_YELLOW}4.{Colors.RESET} {Colors.BRIGHT_WHITE}Repository Operations{Colors.RESET}"))
+        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_YELLOW}5.{Colors.RESET} {Colors.BRIGHT_WHITE}Followback Checker & Cleaner{Colors.RESET}"))
+        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_YELLOW}6.{Colors.RESET} {Colors.BRIGHT_WHITE}Seed User Follower Extractor{Colors.RESET}"))
+        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_YELLOW}7.{Colors.RESET} {Colors.BRIGHT_WHITE}Check Rate Limits{Colors.RESET}"))
+        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_YELLOW}8.{Colors.RESET} {Colors.BRIGHT_WHITE}Exit Tool{Colors.RESET}"))
         print(f"{Colors.BRIGHT_GREEN}├────────────────────────────────────────────────────────────┤{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_CYAN}Status:{Colors.RESET} {logged_in_status:<48}{Colors.BRIGHT_GREEN}{Colors.RESET}")
-        print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_CYAN}Token:{Colors.RESET}  {token_status:<48}{Colors.BRIGHT_GREEN}{Colors.RESET}")
+        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_CYAN}Status:{Colors.RESET} {logged_in_status}"))
+        print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_CYAN}Token:{Colors.RESET}  {token_status}"))
         print(f"{Colors.BRIGHT_GREEN}└────────────────────────────────────────────────────────────┘{Colors.RESET}\n")
     
+    @track_flow
+    def get_rate_limits(self) -> Optional[Dict]:
+        """Fetch /rate_limit (doesn't count against the limit) and feed it to the governor"""
+        response = self.session.get(f"{self.api_url}/rate_limit")
+        if response.status_code != 200:
+            return None
+        
+        rate_data = response.json()
+        self.rate_governor.update_from_rate_limit(rate_data)
+        return rate_data
+    
+    @profile_flow
+    @render_once
     def check_rate_limits(self):
         """Check GitHub API rate limits"""
         try:
             self.print_header("API RATE LIMITS")
             
-            response = self.session.get(f"{self.api_url}/rate_limit")
+            rate_data = self.get_rate_limits()
             
-            if response.status_code == 200:
-                rate_data = response.json()
+            if rate_data:
                 core = rate_data['resources']['core']
                 search = rate_data['resources']['search']
                 graphql = rate_data['resources']['graphql'] if 'graphql' in rate_data['resources'] else None
                 
                 print(f"{Colors.BRIGHT_GREEN}┌────────────────────────────────────────────────────────────┐{Colors.RESET}")
-                print(f"{Colors.BRIGHT_GREEN}│{Colors.BRIGHT_CYAN}                    Rate Limit Status                    {Colors.BRIGHT_GREEN}{Colors.RESET}")
+                print(self.box_row(f"{Colors.BRIGHT_CYAN}                    Rate Limit Status"))
                 print(f"{Colors.BRIGHT_GREEN}├────────────────────────────────────────────────────────────┤{Colors.RESET}")
                 
                 # Core API limits
@@ -2147,19 +4423,19 @@ class GitHubTool:
                 reset_core = datetime.fromtimestamp(core['reset']).strftime('%Y-%m-%d %H:%M:%S')
                 used_percentage = (limit_core - remaining_core) / limit_core * 100
                 
-                print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_CYAN}📊 Core API:{Colors.RESET}                                            {Colors.BRIGHT_GREEN}{Colors.RESET}")
-                print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET}   {Colors.BRIGHT_WHITE}Remaining:{Colors.RESET} {remaining_core}/{limit_core} ({used_percentage:.1f}% used)    {Colors.BRIGHT_GREEN}{Colors.RESET}")
-                print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET}   {Colors.BRIGHT_WHITE}Resets at:{Colors.RESET} {reset_core}             {Colors.BRIGHT_GREEN}{Colors.RESET}")
+                print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_CYAN}📊 Core API:{Colors.RESET}"))
+                print(self.box_row(f"{Colors.RESET}   {Colors.BRIGHT_WHITE}Remaining:{Colors.RESET} {remaining_core}/{limit_core} ({used_percentage:.1f}% used)"))
+                print(self.box_row(f"{Colors.RESET}   {Colors.BRIGHT_WHITE}Resets at:{Colors.RESET} {reset_core}"))
                 
                 # Search API limits
                 remaining_search = search['remaining']
                 limit_search = search['limit']
                 reset_search = datetime.fromtimestamp(search['reset']).strftime('%Y-%m-%d %H:%M:%S')
                 
-                print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET}                                                          {Colors.BRIGHT_GREEN}{Colors.RESET}")
-                print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_CYAN}🔍 Search API:{Colors.RESET}                                        {Colors.BRIGHT_GREEN}{Colors.RESET}")
-                print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET}   {Colors.BRIGHT_WHITE}Remaining:{Colors.RESET} {remaining_search}/{limit_search}                  {Colors.BRIGHT_GREEN}{Colors.RESET}")
-                print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET}   {Colors.BRIGHT_WHITE}Resets at:{Colors.RESET} {reset_search}             {Colors.BRIGHT_GREEN}{Colors.RESET}")
+                print(self.box_row(f"{Colors.RESET}"))
+                print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_CYAN}🔍 Search API:{Colors.RESET}"))
+                print(self.box_row(f"{Colors.RESET}   {Colors.BRIGHT_WHITE}Remaining:{Colors.RESET} {remaining_search}/{limit_search}"))
+                print(self.box_row(f"{Colors.RESET}   {Colors.BRIGHT_WHITE}Resets at:{Colors.RESET} {reset_search}"))
                 
                 # GraphQL API limits if available
                 if graphql:
@@ -2167,10 +4443,20 @@ class GitHubTool:
                     limit_graphql = graphql['limit']
                     reset_graphql = datetime.fromtimestamp(graphql['reset']).strftime('%Y-%m-%d %H:%M:%S')
                     
-                    print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET}                                                          {Colors.BRIGHT_GREEN}{Colors.RESET}")
-                    print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BRIGHT_CYAN}📈 GraphQL API:{Colors.RESET}                                     {Colors.BRIGHT_GREEN}{Colors.RESET}")
-                    print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET}   {Colors.BRIGHT_WHITE}Remaining:{Colors.RESET} {remaining_graphql}/{limit_graphql}                {Colors.BRIGHT_GREEN}{Colors.RESET}")
-                    print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET}   {Colors.BRIGHT_WHITE}Resets at:{Colors.RESET} {reset_graphql}             {Colors.BRIGHT_GREEN}{Colors.RESET}")
+                    print(self.box_row(f"{Colors.RESET}"))
+                    print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_CYAN}📈 GraphQL API:{Colors.RESET}"))
+                    print(self.box_row(f"{Colors.RESET}   {Colors.BRIGHT_WHITE}Remaining:{Colors.RESET} {remaining_graphql}/{limit_graphql}"))
+                    print(self.box_row(f"{Colors.RESET}   {Colors.BRIGHT_WHITE}Resets at:{Colors.RESET} {reset_graphql}"))
+                
+                # Local governor state (fed from every response's headers)
+                backoff = self.rate_governor.wait_time()
+                governor_status = f"backing off {backoff:.0f}s" if backoff > 0 else "ready"
+                
+                print(self.box_row(f"{Colors.RESET}"))
+                print(self.box_row(f"{Colors.RESET} {Colors.BRIGHT_CYAN}🚦 Rate Governor:{Colors.RESET}"))
+                print(self.box_row(f"{Colors.RESET}   {Colors.BRIGHT_WHITE}Status:{Colors.RESET} {governor_status}"))
+                print(self.box_row(f"{Colors.RESET}   {Colors.BRIGHT_WHITE}Secondary limit hits:{Colors.RESET} {self.rate_governor.secondary_hits}"))
+                print(self.box_row(f"{Colors.RESET}   {Colors.BRIGHT_WHITE}Auto-wait limit:{Colors.RESET} {self.rate_governor.max_wait}s"))
                 
                 print(f"{Colors.BRIGHT_GREEN}└────────────────────────────────────────────────────────────┘{Colors.RESET}")
                 
@@ -2186,6 +4472,25 @@ class GitHubTool:
         except Exception as e:
             self.print_error(f"Error checking rate limits: {e}")
     
+    @render_once
+    def display_request_metrics(self):
+        """Show which flows made API requests, what they cost and how long they took"""
+        flows = self.request_metrics.summary()['flows']
+        if not flows:
+            return
+        
+        print(f"\n{Colors.BRIGHT_CYAN}📡 API usage by flow:{Colors.RESET}")
+        print(f"{Colors.DIM}  {'flow':<28}{'requests':>9}{'quota':>7}{'cached':>8}{'KB in':>9}{'p50 ms':>8}{'p90 ms':>8}{Colors.RESET}")
+        
+        for flow, totals in sorted(flows.items(), key=lambda item: -item[1]['quota_units']):
+            print(f"  {Colors.BRIGHT_WHITE}{flow:<28}{Colors.RESET}{totals['requests']:>9}{totals['quota_units']:>7}"
+                  f"{totals['cache_hits']:>8}{totals['bytes_in'] / 1024:>9.1f}"
+                  f"{totals['latency_ms']['p50']:>8.0f}{totals['latency_ms']['p90']:>8.0f}")
+        
+        if self.metrics_path:
+            self.request_metrics.dump(self.metrics_path)
+            print(f"{Colors.DIM}  Full metrics written to {self.metrics_path}{Colors.RESET}")
+    
     def run(self):
         """Main execution flow"""
         self.clear_screen()
@@ -2239,6 +4544,9 @@ class GitHubTool:
                     if self.starred_repos:
                         print(f"{Colors.BRIGHT_BLUE}⭐ Total repositories starred this session: {len(self.starred_repos)}{Colors.RESET}")
                 
+                self.display_request_metrics()
+                self.save_session_state()
+                
                 self.print_success("Thank you for using GitHub Tool! 👋")
                 print(f"\n{Colors.DIM}Session duration: {(datetime.now() - self.session_start_time).seconds} seconds{Colors.RESET}\n")
                 break
@@ -2249,8 +4557,448 @@ class GitHubTool:
             self.clear_screen()
             self.print_banner()
 
+class AsyncReader:
+    """
+    asyncio engine for read-only fan-out (profiles, repositories, languages)
+    
+    Independent requests are awaited together and run concurrently, limited by
+    one semaphore shared by everything the reader does. Each request still
+    goes through the tool's session - ETag cache, rate-limit governor, metrics -
+    on a worker thread, so the sync and async paths behave identically.
+    """
+    
+    def __init__(self, tool: 'GitHubTool', concurrency: Optional[int] = None):
+        self.tool = tool
+        self.semaphore = asyncio.Semaphore(concurrency or tool.transport.pool_size)
+    
+    async def call(self, function, *args):
+        """Run one blocking request under the semaphore"""
+        async with self.semaphore:
+            return await asyncio.to_thread(function, *args)
+    
+    async def get(self, url: str):
+        return await self.call(self.tool.api_get, url)
+    
+    async def graphql(self, query: str, variables: Dict) -> Optional[Dict]:
+        return await self.call(self.tool.graphql, query, variables)
+    
+    async def paginate_all(self, url: str, fields: Optional[Tuple[str, ...]]) -> List[Dict]:
+        """
+        Every item of a paginated REST list, in page order
+        
+        The first page's Link: rel="last" gives the page count, so the remaining
+        pages are requested together instead of walking rel="next" one by one.
+        """
+        pages = []
+        async for page_number, items in self.paginate_pages(url, fields):
+            pages.append((page_number, items))
+        return [item for _, items in sorted(pages, key=lambda page: page[0]) for item in items]
+    
+    async def paginate_pages(self, url: str, fields: Optional[Tuple[str, ...]]) -> AsyncIterator[Tuple[int, List[Dict]]]:
+        """(page number, items) for each page of a paginated REST list, as soon as that page arrives"""
+        def items(response) -> List[Dict]:
+            if response.status_code != 200:
+                raise GitHubAPIError(response.status_code, f"HTTP {response.status_code} for {response.url}")
+            return [{field: item.get(field) for field in fields} if fields else item for item in response.json()]
+        
+        async def page(number: int):
+            return number, await self.get(f"{url}{separator}per_page=100&page={number}")
+        
+        separator = '&' if '?' in url else '?'
+        first = await self.get(f"{url}{separator}per_page=100")
+        yield 1, items(first)
+        
+        last_page = re.search(r'[?&]page=(\d+)', first.links.get('last', {}).get('url') or '')
+        if last_page:
+            for next_done in asyncio.as_completed([page(number) for number in range(2, int(last_page.group(1)) + 1)]):
+                number, response = await next_done
+                yield number, items(response)
+    
+    async def user_repo_stats(self, username: str) -> Dict:
+        """
+        aggregate_repo_stats() over a user's public repositories, GraphQL first with REST fallback
+        
+        Each page is folded into the totals as it arrives; only the names seen
+        over GraphQL are kept, to skip them if the REST fallback takes over.
+        """
+        repo_stats = self.tool.aggregate_repo_stats(())
+        seen = set()
+        cursor = None
+        while True:
+            data = await self.graphql(USER_REPOSITORIES_QUERY, {'login': username, 'cursor': cursor})
+            if not data or not data.get('user'):
+                break
+            
+            page = data['user']['repositories']
+            repos = [self.tool.repo_from_graphql_node(node) for node in page['nodes']]
+            seen.update(repo['name'] for repo in repos)
+            repo_stats = self.tool.aggregate_repo_stats(repos, repo_stats)
+            
+            if not page['pageInfo']['hasNextPage']:
+                return repo_stats
+            cursor = page['pageInfo']['endCursor']
+        
+        async for _, repos in self.paginate_pages(f"{self.tool.api_url}/users/{username}/repos",
+                                                  ('name', 'stargazers_count', 'forks_count', 'language')):
+            repo_stats = self.tool.aggregate_repo_stats((repo for repo in repos if repo['name'] not in seen),
+                                                        repo_stats)
+        return repo_stats
+    
+    async def user_info(self, username: str, refresh: bool = False) -> Optional[Dict]:
+        """
+        get_user_info(): the profile and the repository scan run concurrently
+        
+        For an account already in the profile history the profile is revalidated
+        first; if its ETag still matches, stars, forks and languages come from the
+        history instead of a new repository scan.
+        """
+        cache_key = username.lower()
+        if not refresh and cache_key in self.tool.user_info_cache:
+            return self.tool.user_info_cache[cache_key]
+        
+        history = self.tool.profile_history.latest(username)
+        profile_url = f"{self.tool.api_url}/users/{username}"
+        
+        if history:
+            response = await self.get(profile_url)
+            if response.status_code != 200:
+                return None
+            
+            last = history[0]
+            scanned_at = datetime.strptime(last['scanned_at'], "%Y-%m-%d %H:%M:%S") if last['scanned_at'] else None
+            if (getattr(response, 'from_cache', False) and scanned_at
+                    and (datetime.now() - scanned_at).total_seconds() < ProfileHistoryStore.REUSE_MAX_AGE):
+                repo_stats = {
+                    'repo_count': last['repo_count'],
+                    'total_stars': last['total_stars'],
+                    'total_forks': last['total_forks'],
+                    'top_languages': last['top_languages'],
+                    'avg_repo_stars': last['total_stars'] / last['repo_count'] if last['repo_count'] else 0
+                }
+                user_info = self.tool.user_info_from_profile(response.json(), repo_stats)
+                self.tool.profile_history.touch(username)
+                self.tool.user_info_cache[cache_key] = user_info
+                return user_info
+            
+            repo_stats = await self.user_repo_stats(username)
+        else:
+            response, repo_stats = await asyncio.gather(self.get(profile_url), self.user_repo_stats(username))
+            if response.status_code != 200:
+                return None
+        
+        user_info = self.tool.user_info_from_profile(response.json(), repo_stats)
+        self.tool.profile_history.record(user_info, repo_stats['repo_count'])
+        self.tool.user_info_cache[cache_key] = user_info
+        return user_info
+    
+    async def users_info(self, usernames: List[str]) -> AsyncIterator[Tuple[str, Optional[Dict]]]:
+        """(username, get_user_info() result or None) for many users, in completion order"""
+        async def one(username: str) -> Tuple[str, Optional[Dict]]:
+            try:
+                return username, await self.user_info(username)
+            except Exception as e:
+                logger.error(f"Error getting user info for @{username}: {e}")
+                return username, None
+        
+        for next_done in asyncio.as_completed([one(username) for username in usernames]):
+            yield await next_done
+    
+    async def repository_info(self, repo_owner: str, repo_name: str) -> Optional[Dict]:
+        """get_repository_info(): repo fields, languages and contributors requested together"""
+        data, contributors = await asyncio.gather(
+            self.graphql(REPOSITORY_QUERY, {'owner': repo_owner, 'name': repo_name}),
+            self.call(self.tool.get_top_contributors, repo_owner, repo_name),
+        )
+        if data and data.get('repository'):
+            return self.tool.repo_info_from_graphql(data['repository'], contributors)
+        
+        # REST fallback: the languages URL is predictable, so it needn't wait for the repo payload
+        repo_url = f"{self.tool.api_url}/repos/{repo_owner}/{repo_name}"
+        response, lang_response = await asyncio.gather(self.get(repo_url), self.get(f"{repo_url}/languages"))
+        if response.status_code != 200:
+            return None
+        
+        languages = lang_response.json() if lang_response.status_code == 200 else {}
+        return self.tool.repo_info_from_rest(response.json(), languages, contributors)
+    
+    async def owner_repositories(self, owner: str, contributors: bool = False) -> List[Dict]:
+        """
+        scan_repositories(): get_repository_info() fields for every repository of a user or organization
+        
+        GraphQL returns 50 repositories per request, languages included. The REST
+        fallback lists the repositories and then fetches each one's languages
+        concurrently, through the ETag cache so a repeated scan mostly costs 304s.
+        """
+        nodes = []
+        cursor = None
+        while True:
+            data = await self.graphql(OWNER_REPOSITORIES_QUERY, {'login': owner, 'cursor': cursor})
+            if not data or not data.get('repositoryOwner'):
+                nodes = None
+                break
+            
+            page = data['repositoryOwner']['repositories']
+            nodes.extend(node for node in page['nodes'] if node)
+            self.tool.print_info(f"Loaded {len(nodes)}/{page['totalCount']} repositories so far...")
+            
+            if not page['pageInfo']['hasNextPage']:
+                break
+            cursor = page['pageInfo']['endCursor']
+        
+        if nodes is not None:
+            repos = [self.tool.repo_info_from_graphql(node, []) for node in nodes]
+        else:
+            try:
+                listing = await self.paginate_all(f"{self.tool.api_url}/orgs/{owner}/repos?type=all", None)
+            except GitHubAPIError as e:
+                if e.status_code != 404:
+                    raise
+                listing = await self.paginate_all(f"{self.tool.api_url}/users/{owner}/repos?type=owner", None)
+            
+            responses = await asyncio.gather(*(self.get(f"{self.tool.api_url}/repos/{repo['full_name']}/languages")
+                                               for repo in listing))
+            repos = [self.tool.repo_info_from_rest(repo, response.json() if response.status_code == 200 else {}, [])
+                     for repo, response in zip(listing, responses, strict=True)]
+        
+        if contributors:
+            # GraphQL has no contributors field: one REST request per repository
+            top = await asyncio.gather(*(self.call(self.tool.get_top_contributors, owner, repo['name']) for repo in repos))
+            for repo, repo_contributors in zip(repos, top, strict=True):
+                repo['contributors'] = repo_contributors
+        
+        return repos
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Command-line interface for the read-only analytics (no arguments starts the interactive menu)"""
+    parser = argparse.ArgumentParser(
+        prog='github_tool.py',
+        description='GitHub Tool - run without arguments for the interactive menu'
+    )
+    parser.add_argument('--token', default=os.environ.get('GITHUB_TOKEN'),
+                        help='Personal access token (default: $GITHUB_TOKEN)')
+    parser.add_argument('--format', choices=['json', 'csv', 'jsonl'], default='json', help='Output format (default: json)')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Show progress messages on stderr')
+    parser.add_argument('--timeout', type=float, metavar='SECONDS',
+                        help='Read timeout per request (default: 30, or $GITHUB_TOOL_READ_TIMEOUT)')
+    parser.add_argument('--http2', action='store_true', help='Use HTTP/2 for API reads (needs httpx[http2])')
+    parser.add_argument('--fresh-login', action='store_true',
+                        help="Re-check the token with /user and /rate_limit instead of reusing the last run's state")
+    parser.add_argument('--when-over-budget', choices=['fail', 'wait', 'run', 'split'], default='fail',
+                        help="When a command's estimated cost exceeds the remaining rate limit: exit (default), "
+                             "wait for the reset, run anyway, or (analyze-users) analyze what fits now")
+    parser.add_argument('--metrics', metavar='PATH', default=os.environ.get('GITHUB_TOOL_METRICS'),
+                        help='Write per-flow request metrics here (.prom for Prometheus text, otherwise JSON)')
+    parser.add_argument('--profile', metavar='DIR', default=os.environ.get('GITHUB_TOOL_PROFILE'),
+                        help='Profile the command with cProfile: a .pstats file plus a wall/CPU/wait '
+                             'breakdown in DIR/profiles.jsonl')
+    
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    user_parser = subparsers.add_parser('analyze-user', help='Profile analytics for a user')
+    user_parser.add_argument('username')
+    
+    history_parser = subparsers.add_parser('profile-history',
+                                           help='Recorded profile metrics per day/week from local history (no API calls)')
+    history_parser.add_argument('username')
+    history_parser.add_argument('--period', choices=sorted(ProfileHistoryStore.PERIODS), default='day')
+    history_parser.add_argument('--limit', type=int, default=30, help='Most recent periods to show (default: 30)')
+    
+    repo_parser = subparsers.add_parser('analyze-repo', help='Repository analytics')
+    repo_parser.add_argument('repository', help='owner/repo')
+    
+    batch_parser = subparsers.add_parser('analyze-users', help='Profile analytics for many users (JSON lines)')
+    batch_parser.add_argument('file', help='File with one username per line')
+    batch_parser.add_argument('--workers', type=int, default=4, help='Parallel read requests (default: 4)')
+    batch_parser.add_argument('-o', '--output', help='Output file (default: stdout)')
+    
+    followback_parser = subparsers.add_parser('followback-report', help='Followback analysis for the token owner')
+    followback_parser.add_argument('-o', '--output', help='Stream one row per account to a file instead; the '
+                                   'format comes from the extension (.csv, .jsonl, .parquet, plus .gz/.zst)')
+    scan_parser = subparsers.add_parser('scan-repos', help='Aggregated analytics for every repository of an org or user')
+    scan_parser.add_argument('owner', help='Organization or user')
+    scan_parser.add_argument('--contributors', action='store_true',
+                             help='Also fetch top contributors (one extra request per repository)')
+    scan_parser.add_argument('--stale-days', type=int, default=365,
+                             help='Repositories without a push for this long count as stale (default: 365)')
+    scan_parser.add_argument('-o', '--output', help='Also stream one row per repository to a file '
+                             '(.csv, .jsonl, .parquet, plus .gz/.zst)')
+    subparsers.add_parser('rate-limit', help='Current API rate limits')
+    
+    return parser
+
+def csv_cell(value) -> str:
+    """Flatten a value into a single CSV cell"""
+    if value is None:
+        return ''
+    if isinstance(value, dict):
+        if 'login' in value:
+            return value['login']
+        return ';'.join(f"{k}:{v}" for k, v in value.items())
+    if isinstance(value, tuple):
+        return ':'.join(str(v) for v in value)
+    if isinstance(value, list):
+        return ';'.join(csv_cell(v) for v in value)
+    return str(value)
+
+def followback_rows(mutual: List[str], not_following_back: List[str], fans: List[str]) -> Iterator[Dict]:
+    """One {'login', 'category'} row per account in a followback analysis"""
+    for category, logins in (('mutual', mutual), ('not_following_back', not_following_back), ('fan', fans)):
+        for login in logins:
+            yield {'login': login, 'category': category}
+
+def write_output(document, rows: Iterable[Dict], output_format: str, stream=None):
+    """Write a command result as JSON (the whole document), or CSV / JSON Lines (one line per row)"""
+    stream = stream or sys.stdout
+    
+    if output_format == 'json':
+        json.dump(document, stream, indent=2, default=str)
+        stream.write('\n')
+        return
+    
+    with ExportWriter(stream, output_format=output_format) as writer:
+        writer.write_rows(rows)
+
+def run_cli(args: argparse.Namespace) -> int:
+    """Run one headless command; returns the process exit code"""
+    configure_colors(sys.stderr)  # Messages go to stderr; stdout carries the command's output
+    transport = Transport.from_env()
+    if args.timeout:
+        transport.read_timeout = args.timeout
+    if args.http2:
+        transport.http2 = True
+    
+    tool = GitHubTool(interactive=False, verbose=args.verbose, transport=transport)
+    if args.metrics:
+        tool.metrics_path = args.metrics
+    tool.budget_policy = args.when_over_budget
+    if args.profile:
+        tool.profiler = FlowProfiler(args.profile)
+    
+    try:
+        with tool.profiled(args.command):
+            return run_command(tool, args)
+    finally:
+        tool.save_session_state()
+        if tool.metrics_path:
+            tool.request_metrics.dump(tool.metrics_path)
+
+def run_command(tool: GitHubTool, args: argparse.Namespace) -> int:
+    """Log in if a token was given and run the selected subcommand"""
+    if args.token and args.command != 'profile-history':  # Reads local history only
+        success, message = tool.login_with_token(args.token, use_saved_state=not args.fresh_login)
+        if not success:
+            tool.print_error(message)
+            return 1
+    elif args.command == 'followback-report':
+        tool.print_error("This command needs a token (--token or $GITHUB_TOKEN)")
+        return 1
+    
+    if args.command == 'analyze-user':
+        user_info = tool.get_user_info(args.username)
+        if not user_info:
+            tool.print_error(f"Failed to get information for @{args.username}")
+            return 1
+        write_output(user_info, [user_info], args.format)
+    
+    elif args.command == 'profile-history':
+        entries = tool.profile_history.trend(args.username, args.period, args.limit)
+        if not entries:
+            tool.print_error(f"No recorded analyses of @{args.username}")
+            return 1
+        write_output({'username': args.username, 'period': args.period, 'entries': entries}, entries, args.format)
+    
+    elif args.command == 'analyze-users':
+        try:
+            usernames = tool.read_usernames_file(args.file)
+        except OSError as e:
+            tool.print_error(f"Could not read {args.file}: {e}")
+            return 1
+        
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                results = tool.analyze_users_batch(usernames, f, args.workers)
+        else:
+            results = tool.analyze_users_batch(usernames, sys.stdout, args.workers)
+        
+        if results['failed']:
+            tool.print_warning(f"{results['failed']}/{results['total']} users could not be analyzed")
+        if results['deferred']:
+            deferred_file = tool.save_deferred_usernames(results['deferred'])
+            tool.print_warning(f"{len(results['deferred'])} users deferred for lack of quota; rerun with {deferred_file}")
+            if len(results['deferred']) == results['total']:
+                return 1
+    
+    elif args.command == 'analyze-repo':
+        if '/' not in args.repository:
+            tool.print_error("Please use format: owner/repository")
+            return 1
+        owner, repo_name = args.repository.split('/', 1)
+        repo_info = tool.get_repository_info(owner.strip(), repo_name.strip())
+        if not repo_info:
+            tool.print_error("Failed to get repository information")
+            return 1
+        write_output(repo_info, [repo_info], args.format)
+    
+    elif args.command == 'followback-report':
+        mutual, not_following_back, fans = tool.check_follow_back_status()
+        if not (mutual or not_following_back or fans):
+            return 1
+        
+        rows = followback_rows(mutual, not_following_back, fans)
+        if args.output:
+            output_format, compression = ExportWriter.parse_format(args.output)
+            try:
+                with ExportWriter(args.output, ['login', 'category'], output_format, compression) as writer:
+                    writer.write_rows(rows)
+            except (ValueError, ImportError, OSError) as e:
+                tool.print_error(f"Export failed: {e}")
+                return 1
+            return 0
+        
+        document = {
+            'username': tool.username,
+            'mutual': mutual,
+            'not_following_back': not_following_back,
+            'fans': fans,
+            'changes': tool.followback_changes
+        }
+        write_output(document, rows, args.format)
+    
+    elif args.command == 'scan-repos':
+        repos = tool.scan_repositories(args.owner, args.contributors)
+        if repos is None:
+            tool.print_error(f"Failed to scan the repositories of {args.owner}")
+            return 1
+        
+        if args.output:
+            output_format, compression = ExportWriter.parse_format(args.output)
+            try:
+                with ExportWriter(args.output, REPO_SCAN_FIELDS, output_format, compression, types=REPO_SCAN_TYPES) as writer:
+                    writer.write_rows(repos)
+            except (ValueError, ImportError, OSError) as e:
+                tool.print_error(f"Export failed: {e}")
+                return 1
+        
+        summary = tool.summarize_repositories(repos, args.stale_days)
+        rows = [dict(language=language, **stats) for language, stats in summary['languages'].items()]
+        write_output(dict(owner=args.owner, **summary), rows, args.format)
+    
+    elif args.command == 'rate-limit':
+        rate_data = tool.get_rate_limits()
+        if not rate_data:
+            tool.print_error("Failed to get rate limit information")
+            return 1
+        rows = [dict(resource=name, **state) for name, state in rate_data['resources'].items()]
+        write_output(rate_data['resources'], rows, args.format)
+    
+    return 0
+
 def main():
     """Main function"""
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(build_arg_parser().parse_args()))
+    
+    configure_colors(sys.stdout)
     try:
         tool = GitHubTool()
         tool.run()
@@ -0,0 +1,34 @@
+"""Shared fixtures: every test gets its own GITHUB_TOOL_HOME and tools wired to the replay server"""
+import pytest
+
+from github_tool import GitHubTool
+from github_replay import FakeGitHub, ReplayAdapter
+
+
+@pytest.fixture(autouse=True)
+def tool_home(tmp_path, monkeypatch):
+    """Keep caches, snapshots and session state out of the real home directory"""
+    monkeypatch.setenv('GITHUB_TOOL_HOME', str(tmp_path / 'home'))
+    monkeypatch.delenv('GITHUB_TOOL_PROFILE', raising=False)
+    monkeypatch.delenv('GITHUB_TOOL_METRICS', raising=False)
+    return tmp_path / 'home'
+
+
+@pytest.fixture
+def replay_tool():
+    """make(fake=None, adapter_class=ReplayAdapter, **adapter_options) -> (logged-in tool, adapter)"""
+    tools = []
+
+    def make(fake=None, adapter_class=ReplayAdapter, **adapter_options):
+        tool = GitHubTool(interactive=False)
+        adapter = adapter_class(fake or FakeGitHub(followers=300), **adapter_options)
+        adapter.mount(tool)
+        success, message = tool.login_with_token('replay-token')
+        assert success, message
+        adapter.reset_counters()
+        tools.append(tool)
+        return tool, adapter
+
+    yield make
+    for tool in tools:
+        tool.session.close()
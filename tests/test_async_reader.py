@@ -0,0 +1,26 @@
+"""Repository aggregation on the async reader"""
+from github_replay import FakeGitHub
+
+
+def test_graphql_and_rest_repository_scans_agree(replay_tool, tmp_path, monkeypatch):
+    graphql_tool, _ = replay_tool(FakeGitHub(repos=250))
+    via_graphql = graphql_tool.get_user_info('octo')
+
+    monkeypatch.setenv('GITHUB_TOOL_HOME', str(tmp_path / 'rest-home'))  # No shared cache or history
+    rest_tool, adapter = replay_tool(FakeGitHub(repos=250), graphql=False)
+    via_rest = rest_tool.get_user_info('octo')
+
+    assert adapter.by_endpoint['/users/octo/repos'] == 3  # Every REST page was folded in
+    for field in ('total_stars', 'total_forks', 'top_languages', 'avg_repo_stars'):
+        assert via_rest[field] == via_graphql[field]
+    assert rest_tool.profile_history.latest('octo')[0]['repo_count'] == 250
+
+
+def test_aggregation_folds_pages_into_running_totals(replay_tool):
+    tool, _ = replay_tool()
+    repos = [{'name': f"r{i}", 'stargazers_count': i, 'forks_count': 1, 'language': 'Go' if i % 3 else 'C'}
+             for i in range(10)]
+
+    folded = tool.aggregate_repo_stats(repos[5:], tool.aggregate_repo_stats(repos[:5]))
+
+    assert folded == tool.aggregate_repo_stats(repos)
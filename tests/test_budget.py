@@ -0,0 +1,83 @@
+"""Planning a flow's request cost against the remaining rate limit"""
+import pytest
+
+from github_replay import FakeGitHub
+
+USERS = [f"user{i}" for i in range(100)]
+
+
+def batch_cost(tool, usernames):
+    return tool.total_cost(tool.estimate_user_costs(usernames))
+
+
+@pytest.mark.parametrize('policy, expected', [('fail', 0), ('run', 100)])
+def test_over_budget_policies(replay_tool, policy, expected):
+    tool, _ = replay_tool(rate_limit=50)
+    tool.budget_policy = policy
+
+    assert tool.plan_budget("Batch analysis", batch_cost(tool, USERS), units=100) == expected
+
+
+def test_split_runs_only_what_fits(replay_tool):
+    tool, _ = replay_tool(rate_limit=50)
+    tool.budget_policy = 'split'
+
+    costs = tool.estimate_user_costs(USERS)
+
+    units = tool.plan_budget("Batch analysis", tool.total_cost(costs), units=100, unit_costs=costs)
+
+    assert 0 < units < 100
+    assert not tool.rate_governor.shortfall(batch_cost(tool, USERS[:units]))
+
+
+def test_within_budget_runs_everything(replay_tool):
+    tool, _ = replay_tool(rate_limit=5000)
+    tool.budget_policy = 'fail'
+
+    assert tool.plan_budget("Batch analysis", batch_cost(tool, USERS[:10]), units=10) == 10
+
+
+def test_wait_sleeps_until_the_window_resets(replay_tool):
+    tool, adapter = replay_tool(rate_limit=5, window=0.5)
+    tool.budget_policy = 'wait'
+
+    assert tool.plan_budget("Followback", {'graphql': 50}, units=1) == 1
+
+
+def test_followback_estimate_counts_only_new_accounts(replay_tool):
+    tool, _ = replay_tool(FakeGitHub(followers=1000))
+    counts = {'followers': 1000, 'following': 1000}
+    full = tool.estimate_followback_cost(counts, None, None)
+
+    tool.check_follow_back_status()
+    incremental = tool.estimate_followback_cost(counts, tool.snapshot_store.latest('octo', 'followers'),
+                                                tool.snapshot_store.latest('octo', 'following'))
+
+    assert full == {'graphql': 20}
+    assert incremental == {'graphql': 2}
+
+
+def test_batch_estimate_uses_known_repository_counts(replay_tool):
+    tool, _ = replay_tool()
+    tool.profile_history.record({'username': 'big', 'public_repos': 250}, 250)
+    tool.user_info_cache['cached'] = {'public_repos': 120}
+    tool.user_info_cache['empty'] = {'public_repos': 0}
+
+    costs = tool.estimate_user_costs(['Big', 'cached', 'empty', 'never-seen'])
+
+    assert [cost['graphql'] for cost in costs] == [3, 2, 1, 1]
+    assert all(cost['core'] == 1 for cost in costs)
+
+
+def test_split_with_uneven_costs_stays_within_the_budget(replay_tool):
+    tool, _ = replay_tool(rate_limit=20)
+    tool.budget_policy = 'split'
+    for i in range(0, 100, 10):
+        tool.profile_history.record({'username': f"user{i}", 'public_repos': 950}, 950)
+    costs = tool.estimate_user_costs(USERS)
+
+    units = tool.plan_budget("Batch analysis", tool.total_cost(costs), units=100, unit_costs=costs)
+
+    assert 0 < units < 100
+    assert not tool.rate_governor.shortfall(batch_cost(tool, USERS[:units]))
+    assert tool.rate_governor.shortfall(batch_cost(tool, USERS[:units + 1]))
@@ -0,0 +1,41 @@
+"""ETag revalidation against the replay server"""
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+
+
+def test_profile_is_revalidated_with_its_etag(replay_tool):
+    tool, adapter = replay_tool()
+    url = f"{tool.api_url}/users/octo"
+
+    first = tool.api_get(url)
+    second = tool.api_get(url)
+
+    assert adapter.not_modified == 1
+    assert not first.from_cache and second.from_cache
+    assert second.status_code == 200
+    assert second.json() == first.json()
+
+
+def test_cache_entries_are_private_to_the_user(replay_tool):
+    tool, _ = replay_tool()
+
+    tool.api_get(f"{tool.api_url}/user")
+
+    entries = os.listdir(tool.response_cache.directory)
+    assert entries and not any(name.endswith('.tmp') for name in entries)
+    for name in entries:
+        assert stat.S_IMODE(os.stat(os.path.join(tool.response_cache.directory, name)).st_mode) == 0o600
+
+
+def test_concurrent_stores_of_one_url_do_not_share_a_temp_file(replay_tool, caplog):
+    tool, _ = replay_tool()
+    url = f"{tool.api_url}/users/octo"
+    response = tool.session.get(url)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: tool.response_cache.store(url, response), range(200)))
+
+    assert "Could not write cache entry" not in caplog.text  # A shared temp file gets replaced from under a writer
+    assert tool.response_cache.get(url)['body'] == response.text
+    assert not any(name.endswith('.tmp') for name in os.listdir(tool.response_cache.directory))
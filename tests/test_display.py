@@ -0,0 +1,44 @@
+"""Terminal column arithmetic behind the boxed screens"""
+import pytest
+
+from github_tool import Colors, GitHubTool, clip, display_width, pad
+
+
+@pytest.mark.parametrize('text, width', [
+    ('plain', 5),
+    (f"{Colors.BRIGHT_GREEN}green{Colors.RESET}", 5),
+    ('日本', 4),
+    ('🚀 go', 5),
+    ('\u26a0\ufe0f x', 4),  # Emoji presentation selector widens ⚠ to two columns
+    ('\U0001F468\u200d\U0001F469\u200d\U0001F467', 6),  # Joined emoji: each part counts, the joiners don't
+    ('e\u0301', 1),  # Combining accent
+])
+def test_display_width(text, width):
+    assert display_width(text) == width
+
+
+def test_clip_and_pad_fit_the_width_exactly():
+    for text in ('x' * 80, f"{Colors.BRIGHT_WHITE}Status:{Colors.RESET} Logged in as " + 'a' * 60, '日本' * 40):
+        clipped = clip(text, 60)
+
+        assert clipped.endswith('…')
+        assert display_width(pad(clipped, 60)) == 60
+
+
+def test_short_text_is_not_clipped():
+    assert clip('short', 60) == 'short'
+
+
+def test_box_rows_keep_the_right_border_in_place():
+    tool = GitHubTool(interactive=False)
+    rows = [tool.box_row(f" Company: {'Example Corporation ' * 5}"), tool.box_row(" ok")]
+
+    assert {display_width(row) for row in rows} == {62}
+
+
+def test_creating_a_tool_leaves_colours_alone():
+    before = Colors.BRIGHT_GREEN
+
+    GitHubTool(interactive=False)
+
+    assert Colors.BRIGHT_GREEN == before
@@ -0,0 +1,62 @@
+"""Streaming exports"""
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from github_tool import ExportWriter, REPO_SCAN_FIELDS, REPO_SCAN_TYPES
+
+
+ROWS = [{'login': 'alice', 'category': 'mutual'}, {'login': 'bob', 'category': 'fan'}]
+
+
+def test_csv_to_stream():
+    stream = io.StringIO()
+    with ExportWriter(stream, ['login', 'category']) as writer:
+        assert writer.write_rows(iter(ROWS)) == 2
+
+    assert list(csv.DictReader(io.StringIO(stream.getvalue()))) == ROWS
+
+
+def test_gzipped_json_lines(tmp_path):
+    path = str(tmp_path / 'rows.jsonl.gz')
+    output_format, compression = ExportWriter.parse_format(path)
+    with ExportWriter(path, ['login', 'category'], output_format, compression) as writer:
+        writer.write_rows(ROWS)
+
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        assert [json.loads(line) for line in f] == ROWS
+
+
+@pytest.mark.parametrize('spec, expected', [
+    ('csv', ('csv', None)),
+    ('jsonl.gz', ('jsonl', 'gzip')),
+    ('out/report.parquet.zst', ('parquet', 'zstd')),
+])
+def test_parse_format(spec, expected):
+    assert ExportWriter.parse_format(spec) == expected
+
+
+def test_rejects_unknown_formats_and_types():
+    with pytest.raises(ValueError):
+        ExportWriter(io.StringIO(), output_format='txt')
+    with pytest.raises(ValueError):
+        ExportWriter(io.StringIO(), ['login'], types={'login': 'varchar'})
+    with pytest.raises(ValueError):
+        ExportWriter(io.StringIO(), output_format='jsonl', compression='gzip')
+
+
+def test_parquet_schema_survives_an_all_none_first_row_group(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    path = str(tmp_path / 'repos.parquet')
+    rows = [{'full_name': f"octo/repo{i}", 'stars': None if i < 2 else i, 'archived': None if i < 2 else True,
+             'topics': ['a']} for i in range(4)]
+
+    with ExportWriter(path, REPO_SCAN_FIELDS, 'parquet', chunk_rows=2, types=REPO_SCAN_TYPES) as writer:
+        writer.write_rows(rows)
+
+    table = pq.read_table(path)
+    assert str(table.schema.field('stars').type) == 'int64'
+    assert table.column('stars').to_pylist() == [None, None, 2, 3]
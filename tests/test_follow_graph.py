@@ -0,0 +1,46 @@
+"""FollowGraph's linear merge over numeric user IDs"""
+import random
+
+from github_tool import FollowGraph
+
+
+def naive_partition(followers, following):
+    follower_ids, following_ids = dict(followers), dict(following)
+    return (sorted(following_ids[i] for i in following_ids.keys() & follower_ids.keys()),
+            sorted(following_ids[i] for i in following_ids.keys() - follower_ids.keys()),
+            sorted(follower_ids[i] for i in follower_ids.keys() - following_ids.keys()))
+
+
+def test_partition_into_mutual_not_following_back_and_fans():
+    followers = [(3, 'carol'), (1, 'alice'), (4, 'dave')]
+    following = [(2, 'bob'), (3, 'carol'), (1, 'alice')]
+
+    assert FollowGraph(followers, following).partition() == (['alice', 'carol'], ['bob'], ['dave'])
+
+
+def test_renamed_account_still_matches_by_id():
+    mutual, not_following_back, fans = FollowGraph([(7, 'new-name')], [(7, 'old-name')]).partition()
+
+    assert (len(mutual), not_following_back, fans) == (1, [], [])
+
+
+def test_empty_and_one_sided_lists():
+    assert FollowGraph([], []).partition() == ([], [], [])
+    assert FollowGraph([(1, 'a')], []).partition() == ([], [], ['a'])
+    assert FollowGraph([], [(1, 'a')]).partition() == ([], ['a'], [])
+
+
+def test_repeated_ids_count_once():
+    followers = [(1, 'a'), (1, 'a'), (2, 'b')]
+    following = [(1, 'a'), (3, 'c'), (3, 'c')]
+
+    assert FollowGraph(followers, following).partition() == (['a'], ['c'], ['b'])
+
+
+def test_matches_a_set_based_partition_on_random_lists():
+    rng = random.Random(13)
+    for _ in range(50):
+        followers = [(i, f"user{i}") for i in rng.sample(range(500), rng.randint(0, 200))]
+        following = [(i, f"user{i}") for i in rng.sample(range(500), rng.randint(0, 200))]
+
+        assert FollowGraph(followers, following).partition() == naive_partition(followers, following)
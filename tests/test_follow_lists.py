@@ -0,0 +1,100 @@
+"""Checkpointed and incremental follower/following fetches"""
+import sqlite3
+
+import pytest
+
+from github_tool import GitHubAPIError
+from github_replay import FakeGitHub, ReplayAdapter
+
+
+class ShrinkingFakeGitHub(FakeGitHub):
+    """Followers list from which the `removed` newest entries have left"""
+    removed = 0
+
+    def counts(self, login):
+        followers, following, repos = super().counts(login)
+        return followers - self.removed, following, repos
+
+    def connection_entry(self, owner, connection, index):
+        if connection == 'followers':
+            return self.user_entry(index + self.removed)
+        return super().connection_entry(owner, connection, index)
+
+
+class GraphQLStopsAdapter(ReplayAdapter):
+    """GraphQL serves `pages` requests, then 150 followers leave and GraphQL goes down"""
+    pages = 3
+
+    def _graphql(self, payload):
+        if self.pages == 0:
+            self.fake.removed = 150
+            return 502, {'message': 'Bad Gateway'}, {}
+        self.pages -= 1
+        return super()._graphql(payload)
+
+
+def test_interrupted_fetch_resumes_from_its_checkpoint(replay_tool):
+    tool, adapter = replay_tool(FakeGitHub(followers=1000), graphql=False, rate_limit=5)
+
+    with pytest.raises(GitHubAPIError):
+        tool.fetch_follow_list('followers')
+    saved = tool.snapshot_store.checkpoint_size('octo', 'followers')
+    assert 0 < saved < 1000
+
+    adapter.rate_limit, adapter.reset_at = 100, 0  # The window resets...
+    tool.get_rate_limits()  # ...and the governor learns so, as after wait_for_reset()
+    adapter.reset_counters()
+    users = tool.fetch_follow_list('followers')
+
+    assert len({user_id for user_id, _ in users}) == len(users) == 1000
+    assert adapter.by_endpoint['/users/octo/followers'] == 10 - saved // 100
+    assert tool.snapshot_store.checkpoint('octo', 'followers') is None
+
+
+def test_rest_fallback_rescans_when_the_list_shifted(replay_tool):
+    tool, _ = replay_tool(ShrinkingFakeGitHub(followers=1000), adapter_class=GraphQLStopsAdapter)
+
+    users = tool.fetch_follow_list('followers')
+
+    ids = {user_id for user_id, _ in users}
+    assert len(ids) == len(users)
+    assert ids == set(range(1, 1001))  # Nobody still following was skipped
+
+
+def test_second_followback_check_is_incremental(replay_tool):
+    tool, adapter = replay_tool()
+    first = tool.check_follow_back_status()
+    full_requests = adapter.requests
+    adapter.reset_counters()
+
+    second = tool.check_follow_back_status()
+
+    assert second == first
+    assert adapter.requests < full_requests
+
+
+def test_day_old_snapshot_is_refetched_in_full(replay_tool):
+    tool, adapter = replay_tool()
+    tool.check_follow_back_status()
+    full_requests = adapter.requests
+    with sqlite3.connect(tool.snapshot_store.path) as conn:
+        conn.execute("UPDATE snapshots SET taken_at = '2020-01-01 00:00:00'")
+    adapter.reset_counters()
+
+    tool.check_follow_back_status()
+
+    assert adapter.requests == full_requests
+
+
+def test_unfollow_404_discards_the_following_snapshot(replay_tool, monkeypatch):
+    tool, _ = replay_tool(FakeGitHub(followers=300, gone=['user200']))
+    monkeypatch.setattr(tool, 'animate_loading', lambda *args, **kwargs: None)
+    monkeypatch.setattr('github_tool.random.uniform', lambda low, high: 0)
+    tool.check_follow_back_status()
+    assert tool.snapshot_store.latest('octo', 'following')
+
+    success, _ = tool.unfollow_user('user200')
+
+    assert not success
+    assert tool.snapshot_store.latest('octo', 'following') is None
+    assert tool.snapshot_store.latest('octo', 'followers')
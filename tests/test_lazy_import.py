@@ -0,0 +1,32 @@
+"""Deferred imports: nothing heavy at import time, and nothing registered for other importers"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+from github_tool import lazy_import
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_missing_package_raises_import_error():
+    with pytest.raises(ImportError):
+        lazy_import('no_such_package_for_github_tool')
+
+
+def test_importing_the_tool_leaves_deferred_modules_alone():
+    script = ("import sys, github_tool; "
+              "print(sorted(m for m in ('requests', 'asyncio', 'sqlite3', 'csv', 'gzip') if m in sys.modules))")
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True,
+                            cwd=REPO_ROOT, env=dict(os.environ, PYTHONPATH=REPO_ROOT))
+
+    assert result.stdout.strip() == '[]'
+
+
+def test_deferred_module_is_the_real_module_once_used():
+    import sqlite3
+
+    lazy = lazy_import('sqlite3')
+
+    assert lazy.connect is sqlite3.connect
@@ -0,0 +1,45 @@
+"""Profile history: repository stats reused while a profile is unchanged, and metric trends"""
+import sqlite3
+
+
+def test_unchanged_profile_reuses_repository_stats_from_history(replay_tool):
+    tool, adapter = replay_tool()
+    first = tool.get_user_info('octo')
+    adapter.reset_counters()
+
+    again = tool.get_user_info('octo', refresh=True)
+
+    assert adapter.requests == 1 and adapter.not_modified == 1  # Only the profile, answered 304
+    assert again['total_stars'] == first['total_stars']
+    assert again['top_languages'] == first['top_languages']
+
+
+def test_reuse_does_not_postpone_the_next_rescan(replay_tool):
+    tool, adapter = replay_tool()
+    tool.get_user_info('octo')
+    with sqlite3.connect(tool.profile_history.path) as conn:
+        conn.execute("UPDATE profile_metrics SET scanned_at = '2020-01-01 00:00:00'")
+    adapter.reset_counters()
+
+    tool.get_user_info('octo', refresh=True)
+
+    assert adapter.requests > 1  # The repositories were scanned again
+    assert tool.profile_history.latest('octo')[0]['scanned_at'] != '2020-01-01 00:00:00'
+
+
+def test_history_trend_reports_deltas_per_period(replay_tool):
+    tool, _ = replay_tool()
+    info = tool.get_user_info('octo')
+    tool.profile_history.record(dict(info, followers=info['followers'] + 5), 30)
+    with sqlite3.connect(tool.profile_history.path) as conn:
+        conn.execute("UPDATE profile_metrics SET last_seen = '2026-01-01 12:00:00' WHERE id = 1")
+
+    entries = tool.profile_history.trend('octo', 'day')
+
+    assert [entry['followers_delta'] for entry in entries] == [None, 5]
+
+
+def test_trend_of_an_account_never_analyzed_is_empty(replay_tool):
+    tool, _ = replay_tool()
+
+    assert tool.profile_history.trend('nobody') == []
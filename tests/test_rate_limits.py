@@ -0,0 +1,90 @@
+"""RateLimitGovernor: header parsing, Retry-After backoff, and requests held back by it"""
+import time
+
+import requests
+
+from github_tool import RateLimitGovernor
+
+
+def make_response(status, headers, body=b'{}'):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers)
+    response._content = body
+    return response
+
+
+def test_rate_limit_headers_are_recorded_per_resource():
+    governor = RateLimitGovernor()
+
+    governor.observe(make_response(200, {'X-RateLimit-Resource': 'graphql', 'X-RateLimit-Limit': '5000',
+                                         'X-RateLimit-Remaining': '4990', 'X-RateLimit-Used': '10',
+                                         'X-RateLimit-Reset': '1700000000'}))
+
+    assert governor.resources['graphql'] == {'limit': 5000, 'remaining': 4990, 'used': 10, 'reset': 1700000000}
+    assert governor.remaining('core') is None
+
+
+def test_malformed_rate_limit_headers_are_ignored():
+    governor = RateLimitGovernor()
+
+    governor.observe(make_response(200, {'X-RateLimit-Remaining': 'soon'}))
+
+    assert governor.resources == {}
+
+
+def test_exhausted_core_limit_waits_until_the_reset():
+    governor = RateLimitGovernor()
+
+    governor.observe(make_response(403, {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(int(time.time()) + 30)}))
+
+    assert 29 <= governor.wait_time() <= 32
+    assert governor.secondary_hits == 0
+
+
+def test_retry_after_sets_a_secondary_backoff():
+    governor = RateLimitGovernor(max_wait=10)
+    response = make_response(403, {'Retry-After': '120'}, b'{"message": "You have exceeded a secondary rate limit"}')
+
+    governor.observe(response)
+
+    assert governor.is_rate_limited(response)
+    assert governor.secondary_hits == 1
+    assert 119 <= governor.wait_time() <= 120
+    assert governor.wait() is False  # Longer than max_wait: not slept through
+
+
+def test_secondary_limit_without_retry_after_backs_off_exponentially():
+    governor = RateLimitGovernor()
+    response = make_response(403, {}, b'{"message": "secondary rate limit"}')
+
+    governor.observe(response)
+    first = governor.wait_time()
+    governor.observe(response)
+
+    assert 59 <= first <= 60
+    assert 119 <= governor.wait_time() <= 120
+
+
+def test_get_is_not_sent_when_the_limit_outlasts_max_wait(replay_tool):
+    tool, adapter = replay_tool()
+    tool.rate_governor.backoff_until = time.time() + 3600
+
+    response = tool.api_get(f"{tool.api_url}/users/octo")
+
+    assert adapter.requests == 0
+    assert response.status_code == 403 and tool.rate_governor.is_rate_limited(response)
+
+
+def test_writes_are_held_back_during_a_secondary_backoff(replay_tool, monkeypatch):
+    tool, adapter = replay_tool()
+    monkeypatch.setattr(time, 'sleep', lambda seconds: None)
+    monkeypatch.setattr(tool, 'animate_loading', lambda *args, **kwargs: None)
+    tool.rate_governor.backoff_until = time.time() + 3600
+
+    followed = tool.follow_user('user1')
+    unfollowed = tool.unfollow_user('user1')
+
+    assert adapter.requests == 0
+    assert followed[0] is False and followed[1].startswith("Rate limited")
+    assert unfollowed[0] is False and unfollowed[1].startswith("Rate limited")
@@ -0,0 +1,14 @@
+"""The replay server itself"""
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_replay_ids_do_not_depend_on_the_hash_seed():
+    code = "from github_replay import FakeGitHub; print(FakeGitHub().profile('octo')['id'])"
+    ids = {subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, cwd=REPO_ROOT,
+                          env={'PYTHONHASHSEED': seed, 'PYTHONPATH': REPO_ROOT, 'PATH': ''}).stdout
+           for seed in ('1', '2')}
+    assert len(ids) == 1
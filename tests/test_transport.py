@@ -0,0 +1,44 @@
+"""Transport settings and the HTTP/2 adapter's TLS options"""
+import logging
+import ssl
+
+import pytest
+
+from github_http import HTTP2Adapter
+from github_tool import Transport
+
+
+def test_transport_settings_come_from_the_environment(monkeypatch):
+    monkeypatch.setenv('GITHUB_TOOL_POOL_SIZE', '4')
+    monkeypatch.setenv('GITHUB_TOOL_READ_TIMEOUT', '12.5')
+    monkeypatch.setenv('GITHUB_TOOL_HTTP2', 'yes')
+
+    transport = Transport.from_env()
+
+    assert transport.pool_size == 4
+    assert transport.timeout == (5.0, 12.5)
+    assert transport.http2
+
+
+@pytest.mark.parametrize('name, value', [('GITHUB_TOOL_READ_TIMEOUT', 'abc'), ('GITHUB_TOOL_CONNECT_TIMEOUT', 'nan'),
+                                         ('GITHUB_TOOL_POOL_SIZE', '0'), ('GITHUB_TOOL_RETRIES', '2.5')])
+def test_invalid_transport_settings_fall_back_to_the_defaults(monkeypatch, caplog, name, value):
+    monkeypatch.setenv(name, value)
+
+    with caplog.at_level(logging.WARNING):
+        transport = Transport.from_env()
+
+    defaults = Transport()
+    assert (transport.pool_size, transport.timeout, transport.retries) == (defaults.pool_size, defaults.timeout,
+                                                                           defaults.retries)
+    assert name in caplog.text
+
+
+def test_http2_tls_context_follows_requests_verify():
+    assert HTTP2Adapter.ssl_context(True, None).verify_mode == ssl.CERT_REQUIRED
+
+    unverified = HTTP2Adapter.ssl_context(False, None)
+
+    assert unverified.verify_mode == ssl.CERT_NONE and not unverified.check_hostname
+    with pytest.raises(FileNotFoundError):
+        HTTP2Adapter.ssl_context('/nonexistent/ca-bundle.pem', None)